@@ -10,6 +10,13 @@ from .template import Template
 from .property import Property
 from .tag import Tag
 from .icon import Icon
+from .cache import ResponseCache
+from .retry import RetryPolicy
+from .limiter import AdaptiveLimiter
+from .deadline import Deadline, DeadlineExceeded
+from .hedge import HedgePolicy
+from .middleware import Middleware, Request
+from .metrics import Metrics, profile
 
 
 from .api import apiEndpoints
@@ -0,0 +1,1495 @@
+import os
+import json
+import random
+import time
+import asyncio
+import inspect
+import warnings
+from collections import deque
+from functools import partial
+from itertools import islice
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+from .api import apiEndpoints, APIError, _next_offsets, _path_template
+from .cache import TagRegistry, ResponseCache
+from .retry import RetryPolicy
+from .limiter import AdaptiveLimiter
+from .hedge import HedgePolicy
+from .middleware import Middleware, Request
+from .metrics import Metrics
+from . import deadline as _deadline
+from .deadline import DeadlineExceeded
+from .anytype import Anytype
+from .space import Space
+from .type import Type
+from .listview import ListView
+from .object import Object
+from .member import Member
+from .template import Template
+from .property import Property, Select, MultiSelect
+from .tag import Tag
+from .bulk import BulkResult, BulkFailure
+from .utils import requires_auth, _ANYTYPE_PROPERTIES_COLORS
+
+
+class AsyncApiEndpoints(apiEndpoints):
+    """
+    asyncio counterpart of `apiEndpoints`.
+
+    Every endpoint method of `apiEndpoints` is available with the same name and
+    arguments, but returns a coroutine. Requests are sent with `httpx.AsyncClient` and
+    at most `max_concurrency` of them are in flight at the same time, the remaining ones
+    wait on the event loop without holding a thread.
+
+    Parameters:
+        headers (dict): Extra headers sent with every request.
+        max_concurrency (int): Maximum number of requests in flight (default: 100).
+        pool_connections (int): Unused, kept for signature compatibility with `apiEndpoints`.
+        pool_maxsize (int): Number of keep-alive connections kept open (default: 100).
+        pool_block (bool): If True, `pool_maxsize` is also a hard cap on open connections.
+        keep_alive (bool): If False, every connection is closed after its response.
+        page_parallelism (int): Number of pages requested at the same time when iterating
+            over a list endpoint whose total is known (default: 4).
+        response_cache (ResponseCache, optional): Cache for the single-item GET endpoints,
+            disabled by default.
+        retry (RetryPolicy, optional): When and how failed requests are sent again
+            (default: `RetryPolicy()`).
+        limiter (AdaptiveLimiter, optional): Paces the requests sent by this instance
+            (default: `AdaptiveLimiter(max_limit=pool_maxsize)`).
+        timeout (float | tuple | dict, optional): Connect and read timeouts, see
+            `apiEndpoints`.
+        hedge (HedgePolicy, optional): Sends a second copy of reads that are slower than
+            usual, disabled by default. The slower copy is cancelled.
+        middleware (list[Middleware], optional): Hooks run around every call, in order.
+            Hooks can be coroutines.
+        metrics (Metrics, optional): Receives the count, latency and size of every HTTP
+            request per endpoint template (default: `Metrics()`).
+        lazy_hydration (bool): If True, objects are hydrated on first use, see
+            `apiEndpoints`.
+    """
+
+    _is_async = True
+    _UNSENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout) if httpx is not None else ()
+    _TRANSPORT_ERRORS = (httpx.TransportError,) if httpx is not None else ()
+    _TIMEOUT_ERRORS = (httpx.TimeoutException,) if httpx is not None else ()
+
+    def __init__(
+        self,
+        headers: dict = {},
+        max_concurrency: int = 100,
+        pool_connections: int = 1,
+        pool_maxsize: int = 100,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        page_parallelism: int = 4,
+        response_cache: ResponseCache | None = None,
+        retry: RetryPolicy | None = None,
+        limiter: AdaptiveLimiter | None = None,
+        timeout: float | tuple | dict | None = None,
+        hedge: HedgePolicy | None = None,
+        middleware: list[Middleware] | None = None,
+        metrics: Metrics | None = None,
+        lazy_hydration: bool = True,
+    ):
+        if httpx is None:
+            raise ImportError(
+                "The async client requires httpx, install it with `pip install anytype-client[async]`"
+            )
+        self.max_concurrency = max_concurrency
+        self._semaphore: asyncio.Semaphore | None = None
+        self._slot_freed: asyncio.Condition | None = None
+        super().__init__(
+            headers,
+            pool_connections,
+            pool_maxsize,
+            pool_block,
+            keep_alive,
+            page_parallelism,
+            response_cache,
+            retry,
+            limiter,
+            timeout,
+            hedge,
+            middleware,
+            metrics,
+            lazy_hydration,
+        )
+
+    def _new_session(self, pool_connections, pool_maxsize, pool_block):
+        limits = httpx.Limits(
+            max_connections=pool_maxsize if pool_block else None,
+            max_keepalive_connections=pool_maxsize,
+        )
+        return httpx.AsyncClient(headers=self.headers, limits=limits, timeout=None)
+
+    async def close(self) -> None:
+        """
+        Closes every pooled connection owned by this instance.
+        """
+        await self.session.aclose()
+
+    def _pickled_options(self) -> dict:
+        return super()._pickled_options() | {"max_concurrency": self.max_concurrency}
+
+    async def _request(self, method, path, params=None, json=None):
+        if not self.middleware:
+            return await self._dispatch(method, path, params, json)
+        request = Request(method, path, params, json)
+        ran = []
+        try:
+            response = None
+            for middleware in self.middleware:
+                ran.append(middleware)
+                response = await _resolve(middleware.before_request(request))
+                if response is not None:
+                    break
+            if response is None:
+                response = await self._dispatch(
+                    request.method, request.path, request.params, request.json
+                )
+        except Exception as error:
+            for middleware in reversed(ran):
+                response = await _resolve(middleware.on_error(request, error))
+                if response is not None:
+                    break
+            else:
+                raise
+        for middleware in reversed(ran):
+            response = await _resolve(middleware.after_response(request, response))
+        return response
+
+    async def _dispatch(self, method, path, params=None, json=None):
+        left = _deadline.remaining()
+        if method != "GET":
+            return await self._send(method, path, params, json)
+
+        key = (path, tuple(sorted((params or {}).items())))
+        future, owner = self._in_flight.join(key, asyncio.get_running_loop().create_future())
+        if owner:
+            # the request runs as its own task, cancelling one caller does not cancel it
+            task = asyncio.ensure_future(self._send(method, path, params, json))
+            task.add_done_callback(partial(self._settle_in_flight, key))
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), left)
+        except asyncio.TimeoutError:
+            if future.done():
+                raise
+            raise DeadlineExceeded(f"Deadline exceeded waiting for GET {path}") from None
+
+    def _settle_in_flight(self, key: tuple, task: asyncio.Task) -> None:
+        error = asyncio.CancelledError() if task.cancelled() else task.exception()
+        if error is None:
+            self._in_flight.settle(key, task.result())
+        else:
+            future = self._in_flight.settle(key, error=error)
+            future.exception()  # retrieved here in case every waiter was cancelled
+
+    async def _send(self, method, path, params=None, json=None):
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        url = f"{self.api_url}{path}"
+        hedged = self.hedge is not None and self._hedgeable(method, path)
+        self.retry.count("requests")
+        attempt, delay = 1, 0.0
+        while True:
+            try:
+                if hedged:
+                    data = await self._hedged_attempt(method, path, url, params, json)
+                else:
+                    data = await self._attempt(method, path, url, params, json)
+            except (APIError, *self._TRANSPORT_ERRORS) as e:
+                delay = self._retry_delay(method, path, e, attempt, delay)
+                if delay is None:
+                    if attempt > 1:
+                        self.retry.count("exhausted")
+                    if isinstance(e, self._TIMEOUT_ERRORS) and _deadline.expired():
+                        raise DeadlineExceeded(f"Deadline exceeded during {method} {path}") from e
+                    raise
+            else:
+                if attempt > 1:
+                    self.retry.count("recovered")
+                return data
+            self.retry.count("retries")
+            attempt += 1
+            # waits without holding a concurrency slot
+            await asyncio.sleep(delay)
+
+    async def _attempt(self, method, path, url, params=None, json=None, ticket=None):
+        if ticket is None:
+            ticket = await self._acquire()
+        started = time.monotonic()
+        response = None
+        try:
+            connect, read = self._timeout(path)
+            async with self._semaphore:
+                response = await self.session.request(
+                    method,
+                    url,
+                    json=json,
+                    params=params,
+                    timeout=httpx.Timeout(read, connect=connect),
+                )
+            data = self._check_response(response)
+        except BaseException as e:
+            await self._release_async(ticket, method, path, started, e, response)
+            raise
+        await self._release_async(ticket, method, path, started, response=response)
+        return data
+
+    async def _hedged_attempt(self, method, path, url, params=None, json=None):
+        delay = self.hedge.delay(f"{method} {_path_template(path)}")
+        primary = asyncio.ensure_future(self._attempt(method, path, url, params, json))
+        if delay is None:
+            return await primary
+        backup = None
+        try:
+            done, _ = await asyncio.wait([primary], timeout=delay)
+            if len(done) > 0:
+                return primary.result()
+            # no hedge when the budget is spent or the limiter is full
+            ticket, _ = self.limiter.try_acquire(count=False)
+            if ticket is not None and not self.hedge.allow():
+                self.limiter.release(ticket)
+                ticket = None
+            if ticket is None:
+                return await primary
+            backup = asyncio.ensure_future(
+                self._attempt(method, path, url, params, json, ticket=ticket)
+            )
+            pending = {primary, backup}
+            while len(pending) > 0:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is backup:
+                            self.hedge.count("won")
+                        return task.result()
+            return primary.result()
+        finally:
+            # unlike threads, the slower copy can be cancelled
+            for task in (primary, backup):
+                if task is not None and not task.done():
+                    task.cancel()
+
+    async def _acquire(self) -> int:
+        if self._slot_freed is None:
+            self._slot_freed = asyncio.Condition()
+        ticket, wait = self.limiter.try_acquire()
+        while ticket is None:
+            left = _deadline.remaining()
+            wait = wait or 0.05
+            if left is not None:
+                wait = min(wait, left)
+            async with self._slot_freed:
+                try:
+                    # the timeout also covers slots freed by another thread sharing the limiter
+                    await asyncio.wait_for(self._slot_freed.wait(), wait)
+                except asyncio.TimeoutError:
+                    pass
+            ticket, wait = self.limiter.try_acquire(count=False)
+        return ticket
+
+    async def _release_async(self, ticket, method, path, started, error=None, response=None):
+        self._release(ticket, method, path, started, error, response)
+        if self._slot_freed is not None:
+            async with self._slot_freed:
+                self._slot_freed.notify_all()
+
+    async def _cached_get(self, family: str, path: str):
+        cache = self.response_cache
+        if cache is None:
+            return await self._request("GET", path)
+        response = cache.get(path)
+        if response is None:
+            generation = cache.generation
+            response = await self._request("GET", path)
+            cache.put(family, path, response, generation)
+        return response
+
+    async def _write(self, method: str, path: str, forget, json=None):
+        forget()
+        try:
+            return await self._request(method, path, json=json)
+        finally:
+            forget()
+
+    def _property_definition(self, spaceId: str, propertyId: str) -> dict:
+        # hydration is synchronous and cannot fetch, _hydrate puts the definitions fetched
+        # by _prefetch_properties in the payloads
+        definition = self._property_cache.get(spaceId, propertyId)
+        if definition is None:
+            raise ValueError(f"Definition of property {propertyId} was not prefetched")
+        return definition
+
+    async def _load_properties(self, spaceId: str, limit: int = 100) -> None:
+        fetch = partial(self.getProperties, spaceId)
+        definitions = [data async for data in _iter_pages(fetch, limit, self.page_parallelism)]
+        self._index_collection(("properties", spaceId), definitions)
+
+    async def _lookup(self, collection: tuple, field: str, value: str, limit: int = 100):
+        if not self._lookup_index.is_loaded(collection):
+            pages = _iter_pages(self._list_fetch(collection), limit, self.page_parallelism)
+            self._index_collection(collection, [data async for data in pages])
+        return self._lookup_index.get(collection, field, value)
+
+    async def _prefetch_properties(self, spaceId: str, payloads: list[dict]) -> dict:
+        """
+        Makes sure the definitions of every property used by `payloads` are cached.
+
+        Returns:
+            The definitions of the properties that `payloads` only name by id, by id.
+        """
+        ids = set()
+        for data in payloads:
+            # entries with a format carry their own definition
+            for prop in data.get("properties") or []:
+                if "format" not in prop:
+                    ids.add(prop["id"])
+            for prop in (data.get("type") or {}).get("properties") or []:
+                if "format" not in prop:
+                    ids.add(prop["id"])
+        cache = self._property_cache
+        definitions = {id: cache.get(spaceId, id) for id in ids}
+        if all(definition is not None for definition in definitions.values()):
+            return definitions
+        if not cache.is_loaded(spaceId):
+            await self._load_properties(spaceId)
+            definitions = {id: cache.get(spaceId, id) for id in ids}
+
+        missing = [id for id, definition in definitions.items() if definition is None]
+        responses = await asyncio.gather(*[self.getProperty(spaceId, id) for id in missing])
+        fetched = [response.get("property", {}) for response in responses]
+        cache.update(spaceId, fetched)
+        return definitions | dict(zip(missing, fetched))
+
+    async def _load_tags(self, spaceId: str, propertyId: str, limit: int = 100) -> TagRegistry:
+        registry = self._tag_registry(spaceId, propertyId)
+        if not registry.loaded:
+            fetch = partial(self.getTags, spaceId, propertyId)
+            pages = _iter_pages(fetch, limit, self.page_parallelism)
+            registry.update([data async for data in pages])
+            registry.loaded = True
+        return registry
+
+    async def _create_tag(self, spaceId, propertyId, registry: TagRegistry, name: str) -> None:
+        data = {"name": name, "color": random.choice(_ANYTYPE_PROPERTIES_COLORS)}
+        try:
+            response = await self.createTag(spaceId, propertyId, data)
+        except Exception as e:
+            registry.settle(name, error=e)
+            return
+        warnings.warn(f"Tag '{name}' not exist, creating it")
+        registry.settle(name, response.get("tag", {}))
+
+    async def _resolve_tags(self, wanted: dict, concurrency: int = 8) -> dict:
+        """
+        Same as `apiEndpoints._resolve_tags`, missing tags are created concurrently on
+        the event loop (bounded by `max_concurrency`).
+        """
+        unloaded = [key for key in wanted if not self._tag_registry(*key).loaded]
+        await asyncio.gather(*[self._load_tags(*key) for key in unloaded])
+
+        loop = asyncio.get_running_loop()
+        resolved = {key: {} for key in wanted}
+        waiting = []
+        to_create = []
+        for key, names in wanted.items():
+            registry = self._tag_registry(*key)
+            for name in dict.fromkeys(names):
+                tag, future, owner = registry.claim(name, loop.create_future())
+                if tag is not None:
+                    resolved[key][name] = tag["id"]
+                    continue
+                if owner:
+                    to_create.append(self._create_tag(*key, registry, name))
+                waiting.append((key, name, future))
+
+        await asyncio.gather(*to_create)
+        for key, name, future in waiting:
+            try:
+                resolved[key][name] = (await future)["id"]
+            except Exception as e:
+                warnings.warn(f"Could not create tag '{name}': {e}")
+        return resolved
+
+
+async def _resolve(value):
+    # middleware hooks can be plain functions or coroutines
+    if inspect.isawaitable(value):
+        return await value
+    return value
+
+
+async def _hydrate(cls, api: AsyncApiEndpoints, space_id: str, payloads: list[dict], extra={}):
+    definitions = await api._prefetch_properties(space_id, payloads)
+    if len(definitions) > 0:
+        # objects are hydrated later, when the cache may have dropped the definitions
+        payloads = [_with_definitions(data, definitions) for data in payloads]
+    return [cls._from_api(api, data | {"space_id": space_id} | extra) for data in payloads]
+
+
+def _with_definitions(data: dict, definitions: dict) -> dict:
+    """
+    Replaces the property entries of `data`, and of its type, that only name a property
+    by the definition of the property.
+    """
+
+    def resolve(entries: list) -> list:
+        return [entry if "format" in entry else definitions[entry["id"]] for entry in entries]
+
+    data = dict(data)
+    if data.get("properties"):
+        data["properties"] = resolve(data["properties"])
+    type = data.get("type")
+    if type and type.get("properties"):
+        data["type"] = type | {"properties": resolve(type["properties"])}
+    return data
+
+
+async def _iter_responses(fetch, limit: int, parallelism: int = 1):
+    """
+    Yields every page of a list endpoint in order, same as `anytype.api._iter_pages`:
+    once the total is known up to `parallelism` pages are requested as concurrent tasks,
+    otherwise the next page is requested while the current one is consumed.
+    """
+    pending = deque([(0, asyncio.ensure_future(fetch(0, limit)))])
+    planned = iter(range(0))
+    first = True
+    try:
+        while len(pending) > 0:
+            offset, task = pending.popleft()
+            response = await task
+            items = response.get("data", [])
+            has_more, offsets = _next_offsets(response, offset, limit, first, parallelism)
+            if first:
+                planned = iter(offsets)
+                first = False
+            for next_offset in islice(planned, parallelism - len(pending)):
+                pending.append((next_offset, asyncio.ensure_future(fetch(next_offset, limit))))
+            if has_more and len(pending) == 0:
+                next_offset = offset + len(items)
+                pending.append((next_offset, asyncio.ensure_future(fetch(next_offset, limit))))
+            yield response
+    finally:
+        for _, task in pending:
+            task.cancel()
+
+
+async def _iter_pages(fetch, limit: int, parallelism: int = 1):
+    async for response in _iter_responses(fetch, limit, parallelism):
+        for item in response.get("data", []):
+            yield item
+
+
+class AsyncAnytype(Anytype):
+    """
+    asyncio counterpart of `anytype.Anytype`. Every method that talks to the API is a
+    coroutine and the spaces it returns are `AsyncSpace` instances.
+
+    Parameters:
+        max_concurrency (int): Maximum number of requests in flight (default: 100).
+        pool_maxsize (int): Number of keep-alive connections kept open (default: 100).
+        pool_block (bool): If True, `pool_maxsize` is also a hard cap on open connections.
+        keep_alive (bool): If False, connections are closed after every response.
+        page_parallelism (int): Number of pages requested at the same time by the `iter_*`
+            methods once the first page tells the total (default: 4).
+        response_cache (ResponseCache, optional): Opt-in cache for the single-item GET
+            endpoints, see `anytype.Anytype`.
+        retry (RetryPolicy, optional): When and how failed requests are sent again, see
+            `anytype.Anytype`.
+        limiter (AdaptiveLimiter, optional): Paces the requests of this client, see
+            `anytype.Anytype`.
+        timeout (float | tuple | dict, optional): Connect and read timeouts, see
+            `anytype.Anytype`.
+        hedge (HedgePolicy, optional): Hedging of slow reads, see `anytype.Anytype`.
+        middleware (list[Middleware], optional): Hooks run around every call, see
+            `anytype.Anytype`. Hooks can be coroutines.
+        metrics (Metrics, optional): Per-endpoint request metrics, see `anytype.Anytype`.
+        lazy_hydration (bool): Hydrate objects on first use, see `anytype.Anytype`.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 100,
+        pool_maxsize: int = 100,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        page_parallelism: int = 4,
+        response_cache: ResponseCache | None = None,
+        retry: RetryPolicy | None = None,
+        limiter: AdaptiveLimiter | None = None,
+        timeout: float | tuple | dict | None = None,
+        hedge: HedgePolicy | None = None,
+        middleware: list[Middleware] | None = None,
+        metrics: Metrics | None = None,
+        lazy_hydration: bool = True,
+    ) -> None:
+        super().__init__(
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            keep_alive=keep_alive,
+            page_parallelism=page_parallelism,
+            response_cache=response_cache,
+            retry=retry,
+            limiter=limiter,
+            timeout=timeout,
+            hedge=hedge,
+            middleware=middleware,
+            metrics=metrics,
+            lazy_hydration=lazy_hydration,
+        )
+        self._session_options["max_concurrency"] = max_concurrency
+
+    def _new_endpoints(self, headers: dict = {}) -> AsyncApiEndpoints:
+        # the previous client is not closed here because closing needs the event loop
+        self._apiEndpoints = AsyncApiEndpoints(headers, **self._session_options)
+        return self._apiEndpoints
+
+    async def close(self) -> None:
+        """
+        Closes the pooled HTTP connections used by this client.
+        """
+        if self._apiEndpoints is not None:
+            await self._apiEndpoints.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def auth(self, force=False, callback=None, persist_token=True, api_key="") -> dict | None:
+        """
+        Authenticates the user by retrieving or creating a session token. Same as
+        `Anytype.auth`, `callback` can be a regular function or a coroutine function.
+
+        Parameters:
+            force (bool): If True, forces re-authentication even if a token already exists.
+            callback (callable): A callback function to retrieve the 4-digit code. If None, the user will be prompted to enter the code.
+            persist_token (bool): If False, the token will not be saved to disk and will be returned.
+            api_key (string): Used to re-auth to the app, if persist_token is set to False
+
+        Returns:
+            dict | None: The token response if persist_token is False, otherwise None.
+
+        Raises:
+            Raises an error if the authentication request or token validation fails.
+        """
+        userdata = self._get_userdata_folder()
+        anytoken = os.path.join(userdata, "any_token.json")
+
+        if force and os.path.exists(anytoken):
+            os.remove(anytoken)
+
+        if self.app_name == "":
+            self.app_name = "python-anytype-client"
+
+        if persist_token and os.path.exists(anytoken):
+            with open(anytoken) as f:
+                auth_json = json.load(f)
+            self.api_key = auth_json.get("api_key")
+            if await self._validate_token():
+                return None
+
+        if not persist_token and api_key and not force:
+            self.api_key = api_key
+            if await self._validate_token():
+                return None
+            else:
+                raise Exception("Invalid provided API key, please login again.")
+
+        self._new_endpoints()
+        display_code_response = await self._apiEndpoints.displayCode()
+        challenge_id = display_code_response.get("challenge_id")
+
+        if callback is None:
+            api_four_digit_code = input("Enter the 4 digit code: ")
+        else:
+            api_four_digit_code = callback()
+            if inspect.isawaitable(api_four_digit_code):
+                api_four_digit_code = await api_four_digit_code
+
+        token_response = await self._apiEndpoints.getToken(challenge_id, api_four_digit_code)
+
+        self.api_key = token_response.get("api_key")
+        await self._validate_token()
+
+        if persist_token:
+            with open(anytoken, "w") as file:
+                json.dump(token_response, file, indent=4)
+            return None
+        else:
+            return token_response
+
+    async def _validate_token(self) -> bool:
+        self._headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {self.api_key}",
+        }
+        self._new_endpoints(self._headers)
+        try:
+            await self._apiEndpoints.getSpaces(0, 1)
+            return True
+        except Exception:
+            return False
+
+    @requires_auth
+    async def get_space(self, space: str | Space) -> "AsyncSpace":
+        """
+        Retrieve a specific space by its unique identifier.
+
+        Parameters:
+            space (str | Space): The unique id identifier of the space or the Space Class.
+
+        Returns:
+            AsyncSpace: The requested space.
+        """
+        spaceId = space.id if isinstance(space, Space) else space
+        response = await self._apiEndpoints.getSpace(spaceId)
+        return AsyncSpace._from_api(self._apiEndpoints, response.get("space", {}))
+
+    @requires_auth
+    async def get_spaces(self, offset=0, limit=10) -> list["AsyncSpace"]:
+        """
+        Retrieves a list of spaces associated with the authenticated user.
+
+        Parameters:
+            offset (int, optional): The offset for pagination (default: 0).
+            limit (int, optional): The limit for the number of results (default: 10).
+
+        Returns:
+            A list of AsyncSpace instances.
+        """
+        response = await self._apiEndpoints.getSpaces(offset, limit)
+        return [AsyncSpace._from_api(self._apiEndpoints, data) for data in response.get("data", [])]
+
+    @requires_auth
+    async def iter_spaces(self, limit=100):
+        """
+        Iterates over every space of the user, fetching `limit` spaces per request.
+        """
+        api = self._apiEndpoints
+        async for data in _iter_pages(api.getSpaces, limit, api.page_parallelism):
+            yield AsyncSpace._from_api(api, data)
+
+    @requires_auth
+    async def create_space(self, name: str) -> "AsyncSpace":
+        """
+        Creates a new space with a given name.
+
+        Parameters:
+            name (str): The name of the space to create.
+
+        Returns:
+            An AsyncSpace instance representing the newly created space.
+        """
+        response = await self._apiEndpoints.createSpace(name)
+        return AsyncSpace._from_api(self._apiEndpoints, response.get("space", {}))
+
+    @requires_auth
+    async def global_search(self, query, offset=0, limit=10) -> list[Object]:
+        """
+        Performs a global search for objects across all spaces using a query string.
+
+        Parameters:
+            query (str): The search query string.
+            offset (int, optional): The offset for pagination (default: 0).
+            limit (int, optional): The limit for the number of results (default: 10).
+
+        Returns:
+            A list of Object instances that match the search query.
+        """
+        response = await self._apiEndpoints.globalSearch(query, offset, limit)
+        objects = []
+        for data in response.get("data", []):
+            objects += await _hydrate(Object, self._apiEndpoints, data.get("space_id", ""), [data])
+        return objects
+
+
+class AsyncSpace(Space):
+    """
+    asyncio counterpart of `anytype.Space`, every method that talks to the API is a coroutine.
+    Listing methods also have an `iter_*` async generator that walks all pages.
+    """
+
+    __slots__ = ()
+
+    @requires_auth
+    async def _object_to_dict(self, obj: Object) -> dict:
+        self._check_object_type(obj)
+        properties = self._object_properties(obj)
+        tag_ids = await self._apiEndpoints._resolve_tags(self._tags_to_resolve(properties))
+        return self._object_payload(obj, self._properties_json(properties, tag_ids))
+
+    async def _objects(self, response: dict) -> list[Object]:
+        return await _hydrate(Object, self._apiEndpoints, self.id, response.get("data", []))
+
+    @requires_auth
+    async def get_objects(self, offset=0, limit=100) -> list[Object]:
+        """
+        Retrieves a list of objects associated with the space.
+
+        Parameters:
+            offset (int, optional): The offset for pagination (default: 0).
+            limit (int, optional): The limit for the number of results (default: 100).
+
+        Returns:
+            A list of Object instances.
+        """
+        return await self._objects(await self._apiEndpoints.getObjects(self.id, offset, limit))
+
+    @requires_auth
+    async def iter_objects(self, limit=100):
+        """
+        Iterates over every object of the space, fetching `limit` objects per request.
+        """
+        fetch = lambda offset, limit: self._apiEndpoints.getObjects(self.id, offset, limit)
+        async for response in _iter_responses(fetch, limit, self._apiEndpoints.page_parallelism):
+            for obj in await self._objects(response):
+                yield obj
+
+    @requires_auth
+    async def get_object(self, obj: str | Object) -> Object:
+        """
+        Retrieves a specific object by its ID.
+
+        Parameters:
+            obj (Object | str): The object (or its ID) to retrieve.
+
+        Returns:
+            An Object instance representing the retrieved object.
+        """
+        objectId = obj.id if isinstance(obj, Object) else obj
+        response = await self._apiEndpoints.getObject(self.id, objectId)
+        data = response.get("object", {})
+        return (await _hydrate(Object, self._apiEndpoints, self.id, [data]))[0]
+
+    @requires_auth
+    async def create_object(self, obj: Object, type: Type | None = None) -> Object:
+        """
+        Creates a new object within the space, associated with a specified type.
+
+        Parameters:
+            obj (Object): The Object instance to create.
+            type (Type): The Type instance to associate the object with.
+
+        Returns:
+            A new Object instance representing the created object.
+        """
+        if obj.type is None and type is not None:
+            obj.type = type
+
+        object_data = await self._object_to_dict(obj)
+        response = await self._apiEndpoints.createObject(self.id, object_data)
+        data = response.get("object", {})
+        return (await _hydrate(Object, self._apiEndpoints, self.id, [data]))[0]
+
+    @requires_auth
+    async def create_objects(
+        self, objs, type: Type | None = None, concurrency: int = 8, chunk_size: int = 100
+    ) -> BulkResult:
+        """
+        Creates many objects within the space, see `Space.create_objects`.
+
+        Parameters:
+            objs (Iterable[Object]): The objects to create, can be a generator.
+            type (Type, optional): Type used for the objects that have no type.
+            concurrency (int, optional): Number of simultaneous create requests (default: 8).
+            chunk_size (int, optional): Number of objects serialized at once (default: 100).
+
+        Returns:
+            BulkResult: The created objects in input order and the per-object failures.
+        """
+        result = BulkResult()
+        semaphore = asyncio.Semaphore(concurrency)
+        api = self._apiEndpoints
+
+        async def create(index: int, obj: Object, payload: dict) -> None:
+            try:
+                async with semaphore:
+                    response = await api.createObject(self.id, payload)
+                data = response.get("object", {})
+                result.objects[index] = (await _hydrate(Object, api, self.id, [data]))[0]
+            except Exception as e:
+                result.failures.append(BulkFailure(index, obj, e))
+
+        iterator = iter(objs)
+        sending = None
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if len(chunk) == 0:
+                break
+
+            properties, wanted = self._chunk_properties(chunk, type)
+            try:
+                tag_ids = await api._resolve_tags(wanted)
+            except Exception as e:
+                properties, tag_ids = self._tag_failures(properties, e), {}
+            payloads = self._chunk_payloads(chunk, properties, tag_ids)
+            if sending is not None:
+                await sending
+            tasks = []
+            for obj, payload in zip(chunk, payloads):
+                index = len(result.objects)
+                result.objects.append(None)
+                if isinstance(payload, Exception):
+                    result.failures.append(BulkFailure(index, obj, payload))
+                else:
+                    tasks.append(create(index, obj, payload))
+            sending = asyncio.ensure_future(asyncio.gather(*tasks))
+
+        if sending is not None:
+            await sending
+        result.failures.sort(key=lambda failure: failure.index)
+        return result
+
+    @requires_auth
+    async def update_object(self, obj: Object) -> Object:
+        """
+        Updates an existing object within the space, sending only what changed since the
+        object was retrieved from the API (see `Space.update_object`).
+
+        Parameters:
+            obj (Object): The anytype.Object to be modified.
+
+        Returns:
+            An Object instance representing the updated object.
+        """
+        if obj._snapshot is None:
+            data = await self._object_to_dict(obj)
+        else:
+            fields, properties = obj._changes()
+            if len(fields) == 0 and len(properties) == 0:
+                return obj
+
+            for prop in properties:
+                prop.space_id = self.id
+            tag_ids = await self._apiEndpoints._resolve_tags(self._tags_to_resolve(properties))
+            properties_json = self._properties_json(properties, tag_ids)
+            data = self._update_payload(obj, fields, properties_json)
+
+        response = await self._apiEndpoints.updateObject(self.id, obj.id, data)
+        obj._snapshot = obj._state()
+        data = response.get("object", {})
+        return (await _hydrate(Object, self._apiEndpoints, self.id, [data]))[0]
+
+    @requires_auth
+    async def delete_object(self, obj: str | Object) -> None:
+        """
+        Attempt to delete an object by its unique identifier.
+
+        Parameters:
+            obj (Object | str): The Object or object ID string to delete.
+        """
+        if isinstance(obj, Object):
+            obj = obj.id
+        await self._apiEndpoints.deleteObject(self.id, obj)
+
+    async def _type_properties(self, type: Type, create_missing: bool) -> list[dict]:
+        props = type.properties.values() if isinstance(type.properties, dict) else type.properties
+
+        defined_props = []
+        for prop in props:
+            prop_name = prop.name if isinstance(prop, Property) else prop["name"]
+            prop_format = prop.format if isinstance(prop, Property) else prop["format"]
+            # BUG: Tag is not a valid prop?
+            if create_missing and prop_name == "Tag":
+                continue
+            data = await self._apiEndpoints._lookup(("properties", self.id), "name", prop_name)
+            if data is not None:
+                defined_props.append(data | {"space_id": self.id})
+            elif create_missing:
+                created = await self.create_property(Property.from_format(prop_name, prop_format))
+                defined_props.append(created._json)
+            else:
+                defined_props.append({"name": prop_name, "format": prop_format})
+        return defined_props
+
+    @requires_auth
+    async def create_type(self, type: Type) -> "AsyncType":
+        """
+        Create a new type within the current space, see `Space.create_type`.
+
+        Parameters:
+            type (Type): The Type instance to be created, including its properties.
+
+        Returns:
+            AsyncType: The created Type instance as returned by the API.
+        """
+        if not type.icon or not type.layout or not type.name or not type.plural_name:
+            raise Exception("Please define icon, layout, name and plural_name")
+
+        data = {
+            "name": type.name,
+            "plural_name": type.plural_name,
+            "icon": type.icon._get_json(),
+            "layout": type.layout,
+            "properties": await self._type_properties(type, create_missing=False),
+        }
+        response = await self._apiEndpoints.createType(self.id, data)
+        return (await _hydrate(AsyncType, self._apiEndpoints, self.id, [response.get("type", {})]))[
+            0
+        ]
+
+    @requires_auth
+    async def update_type(self, type: Type) -> "AsyncType":
+        """
+        Update an existing type within the current space, see `Space.update_type`.
+
+        Parameters:
+            type (Type): The Type instance to be updated. Must include a valid `id`.
+
+        Returns:
+            AsyncType: The updated Type instance as returned by the API.
+        """
+        if not type.icon or not type.layout or not type.name or not type.plural_name:
+            raise Exception("Please define icon, layout, name and plural_name")
+
+        data = {
+            "name": type.name,
+            "plural_name": type.plural_name,
+            "icon": type.icon._get_json(),
+            "layout": type.layout,
+            "properties": await self._type_properties(type, create_missing=True),
+        }
+        response = await self._apiEndpoints.updateType(self.id, type.id, data)
+        return (await _hydrate(AsyncType, self._apiEndpoints, self.id, [response.get("type", {})]))[
+            0
+        ]
+
+    @requires_auth
+    async def delete_type(self, type: str | Type) -> None:
+        """
+        Delete an existing type from the current space.
+
+        Parameters:
+            type (str | Type): The ID of the type to delete or a `Type` instance.
+        """
+        typeId = type.id if isinstance(type, Type) else type
+        await self._apiEndpoints.deleteType(self.id, typeId)
+
+    @requires_auth
+    async def get_type(self, type: str | Type) -> "AsyncType":
+        """
+        Retrieves a specific type by its name or by a `Type` instance.
+
+        Parameters:
+            type (str | Type): The name of the type to retrieve.
+
+        Returns:
+            An AsyncType instance representing the type.
+        """
+        if not isinstance(type, Type):
+            return await self.get_type_byname(type)
+
+        response = await self._apiEndpoints.getType(self.id, type.id)
+        return (await _hydrate(AsyncType, self._apiEndpoints, self.id, [response.get("type", {})]))[
+            0
+        ]
+
+    @requires_auth
+    async def get_types(self, offset=0, limit=100) -> list["AsyncType"]:
+        """
+        Retrieves a list of types associated with the space.
+
+        Parameters:
+            offset (int, optional): The offset for pagination (default: 0).
+            limit (int, optional): The limit for the number of results (default: 100).
+
+        Returns:
+            A list of AsyncType instances.
+        """
+        response = await self._apiEndpoints.getTypes(self.id, offset, limit)
+        return await _hydrate(AsyncType, self._apiEndpoints, self.id, response.get("data", []))
+
+    @requires_auth
+    async def iter_types(self, limit=100):
+        """
+        Iterates over every type of the space, fetching `limit` types per request.
+        """
+        fetch = lambda offset, limit: self._apiEndpoints.getTypes(self.id, offset, limit)
+        async for data in _iter_pages(fetch, limit, self._apiEndpoints.page_parallelism):
+            yield (await _hydrate(AsyncType, self._apiEndpoints, self.id, [data]))[0]
+
+    @requires_auth
+    async def get_type_byname(self, name: str) -> "AsyncType":
+        """
+        Retrieves a type by its name, see `Space.get_type_byname`.
+
+        Parameters:
+            name (str): The name of the type to retrieve.
+
+        Returns:
+            AsyncType: The matching type.
+
+        Raises:
+            ValueError: If no type with the given name is found.
+        """
+        return await self._indexed_type("name", name)
+
+    @requires_auth
+    async def get_type_bykey(self, key: str) -> "AsyncType":
+        """
+        Retrieves a type by its key, see `Space.get_type_bykey`.
+
+        Parameters:
+            key (str): The key of the type to retrieve.
+
+        Returns:
+            AsyncType: The matching type.
+
+        Raises:
+            ValueError: If no type with the given key is found.
+        """
+        return await self._indexed_type("key", key)
+
+    async def _indexed_type(self, field: str, value: str) -> "AsyncType":
+        data = await self._apiEndpoints._lookup(("types", self.id), field, value)
+        if data is None:
+            raise ValueError("Type not found")
+        return (await _hydrate(AsyncType, self._apiEndpoints, self.id, [data]))[0]
+
+    @requires_auth
+    async def get_member(self, member: str | Member) -> Member:
+        memberId = member.id if isinstance(member, Member) else member
+        response = await self._apiEndpoints.getMember(self.id, memberId)
+        data = response.get("object", {})
+        return Member._from_api(self._apiEndpoints, data | {"space_id": self.id})
+
+    @requires_auth
+    async def get_members(self, offset: int = 0, limit: int = 100) -> list[Member]:
+        """
+        Retrieves a list of members associated with the space.
+
+        Parameters:
+            offset (int, optional): The offset for pagination (default: 0).
+            limit (int, optional): The limit for the number of results (default: 100).
+
+        Returns:
+            A list of Member instances.
+        """
+        response = await self._apiEndpoints.getMembers(self.id, offset, limit)
+        return [
+            Member._from_api(self._apiEndpoints, data | {"space_id": self.id})
+            for data in response.get("data", [])
+        ]
+
+    @requires_auth
+    async def iter_members(self, limit=100):
+        """
+        Iterates over every member of the space, fetching `limit` members per request.
+        """
+        fetch = lambda offset, limit: self._apiEndpoints.getMembers(self.id, offset, limit)
+        async for data in _iter_pages(fetch, limit, self._apiEndpoints.page_parallelism):
+            yield Member._from_api(self._apiEndpoints, data | {"space_id": self.id})
+
+    @requires_auth
+    async def get_listviews(
+        self, listId: str | Object | Type, offset: int = 0, limit: int = 100
+    ) -> list["AsyncListView"]:
+        if isinstance(listId, Object) or isinstance(listId, Type):
+            listId = listId.id
+
+        response = await self._apiEndpoints.getListViews(self.id, listId, offset, limit)
+        return [
+            AsyncListView._from_api(
+                self._apiEndpoints, data | {"space_id": self.id, "list_id": listId}
+            )
+            for data in response.get("data", [])
+        ]
+
+    @requires_auth
+    async def get_properties(self, offset=0, limit=100) -> list[Property]:
+        """
+        Retrieves a list of property associated with the space.
+
+        Parameters:
+            offset (int, optional): The offset for pagination (default: 0).
+            limit (int, optional): The limit for the number of results (default: 100).
+
+        Returns:
+            A list of Property instances.
+        """
+        response = await self._apiEndpoints.getProperties(self.id, offset, limit)
+        self._apiEndpoints._property_cache.update(self.id, response.get("data", []))
+        props = [
+            Property._from_api(self._apiEndpoints, data | {"space_id": self.id})
+            for data in response.get("data", [])
+        ]
+        self._all_types = props
+        return props
+
+    @requires_auth
+    async def iter_properties(self, limit=100):
+        """
+        Iterates over every property of the space, fetching `limit` properties per request.
+        """
+        fetch = lambda offset, limit: self._apiEndpoints.getProperties(self.id, offset, limit)
+        async for data in _iter_pages(fetch, limit, self._apiEndpoints.page_parallelism):
+            yield Property._from_api(self._apiEndpoints, data | {"space_id": self.id})
+
+    @requires_auth
+    async def create_property(self, prop: Property) -> Property:
+        object_data = {
+            "name": prop.name,
+            "format": prop.format,
+        }
+        response = await self._apiEndpoints.createProperty(self.id, object_data)
+        data = response.get("property", {})
+        self._apiEndpoints._property_cache.update(self.id, [data])
+        return Property._from_api(self._apiEndpoints, data | {"space_id": self.id})
+
+    @requires_auth
+    async def get_property(self, prop: str | Property) -> Property:
+        propertyId = prop.id if isinstance(prop, Property) else prop
+        response = await self._apiEndpoints.getProperty(self.id, propertyId)
+        data = response.get("property", {})
+        return Property._from_api(self._apiEndpoints, data | {"space_id": self.id})
+
+    @requires_auth
+    async def get_property_bykey(self, key: str) -> Property:
+        """
+        Retrieves a property by its key, see `Space.get_property_bykey`.
+        """
+        return await self._indexed_property("key", key)
+
+    @requires_auth
+    async def get_property_byname(self, name: str) -> Property:
+        """
+        Retrieves a property by its name, see `Space.get_property_byname`.
+        """
+        return await self._indexed_property("name", name)
+
+    async def _indexed_property(self, field: str, value: str) -> Property:
+        data = await self._apiEndpoints._lookup(("properties", self.id), field, value)
+        if data is None:
+            raise ValueError("Property not found, create it using create_property method")
+        return Property._from_api(self._apiEndpoints, data | {"space_id": self.id})
+
+    @requires_auth
+    async def search(
+        self, query, type: Type | list[Type] | None = None, offset: int = 0, limit: int = 10
+    ) -> list[Object]:
+        """
+        Performs a search for objects in the space using a query string.
+
+        Parameters:
+            query (str): The search query string.
+            type (Type, optional): The type to filter by.
+            offset (int, optional): The offset for pagination (default: 0).
+            limit (int, optional): The limit for the number of results (default: 10).
+
+        Returns:
+            A list of Object instances that match the search query.
+        """
+        if self.id == "":
+            raise ValueError("Space ID is required")
+
+        data = self._search_data(query, type)
+        return await self._objects(await self._apiEndpoints.search(self.id, data, offset, limit))
+
+    @requires_auth
+    async def iter_search(self, query, type: Type | list[Type] | None = None, limit: int = 100):
+        """
+        Iterates over every object that matches the search, fetching `limit` objects per request.
+        """
+        data = self._search_data(query, type)
+        fetch = lambda offset, limit: self._apiEndpoints.search(self.id, data, offset, limit)
+        async for item in _iter_pages(fetch, limit, self._apiEndpoints.page_parallelism):
+            yield (await _hydrate(Object, self._apiEndpoints, self.id, [item]))[0]
+
+    def __repr__(self):
+        return f"<AsyncSpace(name={self.name})>"
+
+
+class AsyncType(Type):
+    """
+    asyncio counterpart of `anytype.Type`, template lookups are coroutines.
+    """
+
+    __slots__ = ()
+
+    @requires_auth
+    async def get_templates(self, offset: int = 0, limit: int = 100) -> list[Template]:
+        """
+        Retrieves the templates associated with the type from the API.
+
+        Parameters:
+            offset (int): The offset to start retrieving templates (default: 0).
+            limit (int): The maximum number of templates to retrieve (default: 100).
+
+        Returns:
+            A list of Template objects.
+        """
+        response = await self._apiEndpoints.getTemplates(self.space_id, self.id, offset, limit)
+        self._all_templates = [
+            Template._from_api(self._apiEndpoints, data | {"space_id": self.space_id})
+            for data in response.get("data", [])
+        ]
+        return self._all_templates
+
+    @requires_auth
+    async def iter_templates(self, limit: int = 100):
+        """
+        Iterates over every template of the type, fetching `limit` templates per request.
+        """
+        api = self._apiEndpoints
+        fetch = lambda offset, limit: api.getTemplates(self.space_id, self.id, offset, limit)
+        async for data in _iter_pages(fetch, limit, self._apiEndpoints.page_parallelism):
+            yield Template._from_api(api, data | {"space_id": self.space_id})
+
+    @requires_auth
+    async def get_template_byname(self, name: str, offset: int = 0, limit: int = 100) -> Template:
+        """
+        Retrieves a template by its name, see `Type.get_template_byname`.
+
+        Parameters:
+            name (str): The name of the template to retrieve.
+
+        Returns:
+            Template: The matching Template instance.
+
+        Raises:
+            ValueError: If no template with the given name is found.
+        """
+        data = await self._template_data(name, limit)
+        if data is None:
+            raise ValueError("Template not found")
+        return Template._from_api(self._apiEndpoints, data | {"space_id": self.space_id})
+
+    async def _template_data(self, name: str, limit: int = 100) -> dict | None:
+        collection = ("templates", self.space_id, self.id)
+        return await self._apiEndpoints._lookup(collection, "name", name, limit)
+
+    @requires_auth
+    async def set_template(self, template_name: str) -> None:
+        """
+        Sets a template for the type by name, looked up in the template index of the type.
+
+        Parameters:
+            template_name (str): The name of the template to assign.
+
+        Raises:
+            ValueError: If a template with the specified name is not found.
+        """
+        data = await self._template_data(template_name)
+        if data is None:
+            raise ValueError(f"Type '{self.name}' does not have a template named '{template_name}'")
+        self.template_id = data["id"]
+
+    @requires_auth
+    async def get_template(self, id: str) -> Template:
+        """
+        Retrieve a specific template by its unique identifier.
+
+        Parameters:
+            id (str): The unique identifier of the template to retrieve.
+
+        Returns:
+            Template: A `Template` instance populated with data retrieved from the API.
+        """
+        response = await self._apiEndpoints.getTemplate(self.space_id, self.id, id)
+        data = response.get("template", {})
+        return Template._from_api(self._apiEndpoints, data | {"space_id": self.space_id})
+
+
+class AsyncListView(ListView):
+    """
+    asyncio counterpart of `anytype.ListView`.
+    """
+
+    __slots__ = ()
+
+    async def _objects(self, response: dict) -> list[Object]:
+        return await _hydrate(Object, self._apiEndpoints, self.space_id, response.get("data", []))
+
+    @requires_auth
+    async def get_objectsinlistview(self, offset=0, limit=100) -> list[Object]:
+        """
+        Retrieve a list of objects displayed in the current list view.
+
+        Parameters:
+            offset (int, optional): The starting index for pagination. Defaults to 0.
+            limit (int, optional): The maximum number of objects to retrieve. Defaults to 100.
+
+        Returns:
+            list[Object]: A list of Object instances parsed from the API response.
+        """
+        response = await self._apiEndpoints.getObjectsInList(
+            self.space_id, self.list_id, self.id, offset, limit
+        )
+        return await self._objects(response)
+
+    @requires_auth
+    async def iter_objectsinlistview(self, limit=100):
+        """
+        Iterates over every object of the list view, fetching `limit` objects per request.
+        """
+        api = self._apiEndpoints
+        fetch = lambda offset, limit: api.getObjectsInList(
+            self.space_id, self.list_id, self.id, offset, limit
+        )
+        async for data in _iter_pages(fetch, limit, self._apiEndpoints.page_parallelism):
+            yield (await _hydrate(Object, api, self.space_id, [data]))[0]
+
+    async def add_objectinlistview(self, obj: Object) -> None:
+        """
+        Add one object to the current list view.
+        """
+        await self.add_objectsinlistview([obj])
+
+    @requires_auth
+    async def add_objectsinlistview(self, objs: list[Object]) -> None:
+        """
+        Add a list of objects to the current list view.
+        """
+        payload = {"objects": [obj.id for obj in objs]}
+        await self._apiEndpoints.addObjectsToList(self.space_id, self.list_id, payload)
+
+    @requires_auth
+    async def delete_objectinlistview(self, obj: Object | str) -> None:
+        """
+        Remove an object from the current list view.
+        """
+        objId = obj.id if isinstance(obj, Object) else obj
+        assert objId != ""
+        await self._apiEndpoints.deleteObjectsFromList(self.space_id, self.list_id, objId)
+
+    def __repr__(self) -> str:
+        return f"<AsyncListView(name={self.name})>"
+
+
+class AsyncSelect(Select):
+    """
+    asyncio counterpart of `anytype.property.Select`, tag methods are coroutines.
+    """
+
+    __slots__ = ()
+
+    @requires_auth
+    async def create_tag(
+        self, name: str, color: str = "red", create_if_exists: bool = False
+    ) -> Tag:
+        return await _create_tag(self, name, color, create_if_exists)
+
+    @requires_auth
+    async def get_tags(self) -> list[Tag]:
+        return await _get_tags(self)
+
+    @requires_auth
+    async def get_tag(self, tag_id: str) -> Tag:
+        return await _get_tag(self, tag_id)
+
+    @requires_auth
+    async def iter_tags(self, limit: int = 100):
+        async for tag in _iter_tags(self, limit):
+            yield tag
+
+
+class AsyncMultiSelect(MultiSelect):
+    """
+    asyncio counterpart of `anytype.property.MultiSelect`, tag methods are coroutines.
+    """
+
+    __slots__ = ()
+
+    @requires_auth
+    async def create_tag(
+        self, name: str, color: str = "red", create_if_exists: bool = False
+    ) -> Tag:
+        return await _create_tag(self, name, color, create_if_exists)
+
+    @requires_auth
+    async def get_tags(self) -> list[Tag]:
+        return await _get_tags(self)
+
+    @requires_auth
+    async def get_tag(self, tag_id: str) -> Tag:
+        return await _get_tag(self, tag_id)
+
+    @requires_auth
+    async def iter_tags(self, limit: int = 100):
+        async for tag in _iter_tags(self, limit):
+            yield tag
+
+
+class AsyncTag(Tag):
+    """
+    asyncio counterpart of `anytype.Tag`, updates and deletions are coroutines.
+    """
+
+    __slots__ = ()
+
+    @requires_auth
+    async def update_tag(self, name: str, color: str = "red") -> "AsyncTag":
+        """
+        Updates the name and color of the tag, see `anytype.Tag.update_tag`.
+        """
+        data = {"name": name, "color": color}
+        api = self._apiEndpoints
+        response = await api.updateTag(self.space_id, self.property_id, self.id, data)
+        return AsyncTag._from_api(
+            api,
+            response.get("tag", {}) | {"space_id": self.space_id, "property_id": self.property_id},
+        )
+
+    @requires_auth
+    async def delete_tag(self) -> None:
+        """
+        Deletes the tag, see `anytype.Tag.delete_tag`.
+        """
+        await self._apiEndpoints.deleteTag(self.space_id, self.property_id, self.id)
+
+
+async def _get_tags(prop: Property) -> list[Tag]:
+    registry = await prop._apiEndpoints._load_tags(prop.space_id, prop.id)
+    return [prop._tag(data) for data in registry.tags()]
+
+
+async def _iter_tags(prop: Property, limit: int):
+    api = prop._apiEndpoints
+    registry = api._tag_registry(prop.space_id, prop.id)
+    if registry.loaded:
+        for data in registry.tags():
+            yield prop._tag(data)
+        return
+
+    async def fetch(offset: int, limit: int) -> dict:
+        response = await api.getTags(prop.space_id, prop.id, offset, limit)
+        registry.update(response.get("data", []))
+        return response
+
+    async for data in _iter_pages(fetch, limit, api.page_parallelism):
+        yield prop._tag(data)
+    registry.loaded = True
+
+
+async def _get_tag(prop: Property, tag_id: str) -> Tag:
+    response = await prop._apiEndpoints.getTag(prop.space_id, prop.id, tag_id)
+    return prop._tag(response.get("tag", {}))
+
+
+async def _create_tag(prop: Property, name: str, color: str, create_if_exists: bool) -> Tag:
+    registry = await prop._apiEndpoints._load_tags(prop.space_id, prop.id)
+    if not create_if_exists:
+        existing = registry.get(name)
+        if existing is not None:
+            warnings.warn(f"Tag '{name}' already exists, returning existing tag")
+            return prop._tag(existing)
+
+    data = {"name": name, "color": color}
+    response = await prop._apiEndpoints.createTag(prop.space_id, prop.id, data)
+    registry.update([response.get("tag", {})])
+    return prop._tag(response.get("tag", {}))
+
+
+AsyncApiEndpoints._models = {
+    "type": AsyncType,
+    "select": AsyncSelect,
+    "multi_select": AsyncMultiSelect,
+    "tag": AsyncTag,
+}
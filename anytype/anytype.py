@@ -1,26 +1,98 @@
 import os
 import json
+from typing import Iterator
 
 from .space import Space
 from .object import Object
-from .api import apiEndpoints
+from .api import apiEndpoints, _iter_pages
+from .cache import ResponseCache
+from .retry import RetryPolicy
+from .limiter import AdaptiveLimiter
+from .hedge import HedgePolicy
+from .middleware import Middleware
+from .metrics import Metrics
 from .utils import requires_auth
 
 
 class Anytype:
     """
     Used to interact with the Anytype API for authentication, retrieving spaces, creating spaces, and performing global searches. It provides methods to authenticate via a token, fetch spaces, create new spaces, and search for objects across spaces.
+
+    All spaces, objects, types and properties retrieved from one client share the same pooled HTTP session.
+
+    Parameters:
+        pool_connections (int): Number of per-host connection pools to keep (default: 1).
+        pool_maxsize (int): Number of connections kept open to the Anytype server (default: 10).
+        pool_block (bool): If True, `pool_maxsize` is a hard cap on simultaneous connections (default: False).
+        keep_alive (bool): If False, connections are closed after every response (default: True).
+        page_parallelism (int): Number of pages requested at the same time by the `iter_*` methods once the first page tells the total (default: 4).
+        response_cache (ResponseCache, optional): Opt-in cache for the single-item GET endpoints (spaces, types, properties, templates, members and tags), e.g. `Anytype(response_cache=ResponseCache(maxsize=512, ttl={"member": 30}))`. Updates and deletions made through this client invalidate it.
+        retry (RetryPolicy, optional): When and how failed requests are sent again. By default idempotent requests are retried up to 3 times on 5xx, 429, 408 and connection errors, POST only when the server could not have processed it. Pass `RetryPolicy(max_attempts=1)` to disable retries. The policy and its counters are available as `retry`.
+        limiter (AdaptiveLimiter, optional): Paces the requests sent by every thread using this client. By default the number of requests in flight adapts to the server: it shrinks on 429, 503, timeouts and growing latency and grows back while responses are healthy, up to `pool_maxsize`. Use e.g. `AdaptiveLimiter(rate=20)` to also cap the requests per second. The limiter is available as `limiter`.
+        timeout (float | tuple | dict, optional): Connect and read timeouts in seconds: one value, a `(connect, read)` tuple, or a dict of them per endpoint family such as `{"search": (5, 120), "default": (2, 10)}` (default: 5s to connect, 30s to read, 60s for objects and search). Use `anytype.Deadline` to bound a whole operation.
+        hedge (HedgePolicy, optional): Opt-in hedging of reads (GET requests and searches): a read slower than the 95th percentile of its endpoint is sent a second time and the first response wins, for at most 5% of the reads, e.g. `Anytype(hedge=HedgePolicy(percentile=0.9))`.
+        middleware (list[Middleware], optional): Hooks run around every API call, in order: `before_request` can change the request or answer it, `after_response` can change the response and `on_error` can replace an error by a response. See `anytype.middleware.Middleware`.
+        metrics (Metrics, optional): Count, latency histogram, bytes sent and received and errors of the HTTP requests per endpoint template, e.g. `GET /spaces/{id}/properties/{id}`. Available as `metrics`, print `metrics.report()` for a summary. Use `anytype.profile()` to measure one block of code.
+        lazy_hydration (bool, optional): Objects returned by the API set their plain fields (id, name, ...) right away and build `type`, `properties`, `icon` and the markdown body the first time they are used, so listing and filtering large spaces costs little more than parsing the JSON (default: True). Pass False to build everything up front.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        pool_connections: int = 1,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        page_parallelism: int = 4,
+        response_cache: ResponseCache | None = None,
+        retry: RetryPolicy | None = None,
+        limiter: AdaptiveLimiter | None = None,
+        timeout: float | tuple | dict | None = None,
+        hedge: HedgePolicy | None = None,
+        middleware: list[Middleware] | None = None,
+        metrics: Metrics | None = None,
+        lazy_hydration: bool = True,
+    ) -> None:
         self.app_name = ""
         self.space_id = ""
         self.api_key = ""
         self.app_key = ""
         self._apiEndpoints: apiEndpoints | None = None
         self._headers = {}
+        self.retry = retry if retry is not None else RetryPolicy()
+        # more requests in flight than pooled connections would open throwaway connections
+        if limiter is None:
+            limiter = AdaptiveLimiter(max_limit=pool_maxsize)
+        self.limiter = limiter
+        self.metrics = metrics if metrics is not None else Metrics()
+        self._session_options = {
+            "pool_connections": pool_connections,
+            "pool_maxsize": pool_maxsize,
+            "pool_block": pool_block,
+            "keep_alive": keep_alive,
+            "page_parallelism": page_parallelism,
+            "response_cache": response_cache,
+            "retry": self.retry,
+            "limiter": self.limiter,
+            "timeout": timeout,
+            "hedge": hedge,
+            "middleware": middleware,
+            "metrics": self.metrics,
+            "lazy_hydration": lazy_hydration,
+        }
+
+    def _new_endpoints(self, headers: dict = {}) -> apiEndpoints:
+        if self._apiEndpoints is not None:
+            self._apiEndpoints.close()
+        self._apiEndpoints = apiEndpoints(headers, **self._session_options)
+        return self._apiEndpoints
+
+    def close(self) -> None:
+        """
+        Closes the pooled HTTP connections used by this client.
+        """
+        if self._apiEndpoints is not None:
+            self._apiEndpoints.close()
 
-        
     def auth(self, force=False, callback=None, persist_token=True, api_key='') -> dict | None:
         """
         Authenticates the user by retrieving or creating a session token.
@@ -61,7 +133,7 @@ class Anytype:
             else:
                 raise Exception("Invalid provided API key, please login again.")
 
-        self._apiEndpoints = apiEndpoints()
+        self._new_endpoints()
         display_code_response = self._apiEndpoints.displayCode()
         challenge_id = display_code_response.get("challenge_id")
 
@@ -87,7 +159,7 @@ class Anytype:
             "Content-Type": "application/json",
             "Authorization": f"Bearer {self.api_key}",
         }
-        self._apiEndpoints = apiEndpoints(self._headers)
+        self._new_endpoints(self._headers)
         try:
             self._apiEndpoints.getSpaces(0, 1)
             return True
@@ -148,6 +220,25 @@ class Anytype:
         # TODO: what I do here to save the space id?
         return [Space._from_api(self._apiEndpoints, data) for data in response.get("data", [])]
 
+    @requires_auth
+    def iter_spaces(self, limit: int = 100) -> Iterator[Space]:
+        """
+        Iterates over every space of the authenticated user, requesting `limit` spaces at
+        a time.
+
+        Parameters:
+            limit (int, optional): The number of spaces per request (default: 100).
+
+        Returns:
+            An iterator of Space instances.
+
+        Raises:
+            Raises an error if a request to the API fails.
+        """
+        api = self._apiEndpoints
+        for data in _iter_pages(api.getSpaces, limit, api.page_parallelism):
+            yield Space._from_api(api, data)
+
     @requires_auth
     def create_space(self, name: str) -> Space:
         """
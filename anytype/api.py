@@ -1,7 +1,27 @@
+import time
+import random
+import warnings
 import requests
-from datetime import datetime
+from requests.adapters import HTTPAdapter
+from collections import deque
+from copy import deepcopy
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from functools import cache, partial
+from itertools import islice
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from typing import TypeVar, Type
-from .utils import _ANYTYPE_SYSTEM_RELATIONS
+from .utils import _ANYTYPE_SYSTEM_RELATIONS, _ANYTYPE_PROPERTIES_COLORS
+from .cache import PropertyCache, IdentityMap, TagRegistry, LookupIndex, ResponseCache, SingleFlight
+from .retry import RetryPolicy, read_only
+from .limiter import AdaptiveLimiter
+from .hedge import HedgePolicy
+from .middleware import Middleware, Request
+from . import metrics as _metrics
+from .metrics import Metrics
+from . import deadline as _deadline
+from .deadline import DeadlineExceeded
 
 
 MIN_API_VERSION = "2025-05-20"
@@ -12,27 +32,479 @@ API_CONFIG = {
 }
 
 
+# path segments that name an endpoint and their family, every other segment is an id
+_ENDPOINT_FAMILIES = {
+    "auth": "auth",
+    "challenges": "auth",
+    "api_keys": "auth",
+    "spaces": "space",
+    "members": "member",
+    "objects": "object",
+    "types": "type",
+    "templates": "template",
+    "properties": "property",
+    "tags": "tag",
+    "lists": "list",
+    "views": "view",
+    "search": "search",
+}
+
+
+def _path_template(path: str) -> str:
+    """
+    Replaces the ids of an API path by `{id}`, e.g. `/spaces/{id}/objects/{id}`.
+    """
+    return "/".join(
+        segment if not segment or segment in _ENDPOINT_FAMILIES else "{id}"
+        for segment in path.split("/")
+    )
+
+
+def _body_sizes(response) -> tuple[int, int]:
+    """
+    Returns:
+        The sizes of the request and response bodies of a `requests` or `httpx` response.
+    """
+    if response is None:
+        return 0, 0
+    request = response.request
+    body = request.body if hasattr(request, "body") else request.content
+    if isinstance(body, str):
+        body = body.encode()
+    return len(body or b""), len(response.content)
+
+
+def _endpoint_family(path: str) -> str:
+    """
+    Family of the last endpoint named in an API path, e.g. `tag` for
+    `/spaces/{id}/properties/{id}/tags`.
+    """
+    family = "default"
+    for segment in path.split("/"):
+        family = _ENDPOINT_FAMILIES.get(segment, family)
+    return family
+
+
+class APIError(ValueError):
+    """
+    Error response of the Anytype API. It is a ValueError, like the errors raised by
+    earlier versions.
+
+    Attributes:
+        status_code (int): HTTP status of the response.
+        retry_after (float | None): Seconds the server asked to wait before retrying.
+    """
+
+    def __init__(self, message: str, status_code: int, retry_after: float | None = None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+def _retry_after(value: str | None) -> float | None:
+    """
+    Parses a `Retry-After` header, given in seconds or as an HTTP date.
+    """
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return max((date - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
 class ResponseHasError(Exception):
     """Custom exception for API errors."""
 
     def __init__(self, response):
         self.status_code = response.status_code
         if self.status_code != 200 and self.status_code != 201:
-            raise ValueError(response.json()["message"])
+            try:
+                message = response.json()["message"]
+            except (ValueError, KeyError, TypeError):
+                message = response.text or f"HTTP {self.status_code}"
+            retry_after = _retry_after(response.headers.get("Retry-After"))
+            raise APIError(message, self.status_code, retry_after)
 
 
 class apiEndpoints:
-    def __init__(self, headers: dict = {}):
+    """
+    Low level access to the Anytype HTTP API.
+
+    Every instance owns one pooled `requests.Session`, so consecutive calls reuse the
+    same keep-alive connections to the local Anytype server. The session is shared by
+    every `Space`, `Object`, `Type` and `Property` created from the same client and can
+    be used from several threads at once.
+
+    Parameters:
+        headers (dict): Extra headers sent with every request.
+        pool_connections (int): Number of per-host connection pools to keep (default: 1).
+        pool_maxsize (int): Number of connections kept open per host (default: 10).
+        pool_block (bool): If True, `pool_maxsize` is a hard cap on simultaneous
+            connections per host and callers wait for a free connection (default: False).
+        keep_alive (bool): If False, every connection is closed after its response
+            (default: True).
+        page_parallelism (int): Number of pages requested at the same time when iterating
+            over a list endpoint whose total is known (default: 4).
+        response_cache (ResponseCache, optional): Cache for the single-item GET endpoints,
+            disabled by default.
+        retry (RetryPolicy, optional): When and how failed requests are sent again
+            (default: `RetryPolicy()`).
+        limiter (AdaptiveLimiter, optional): Paces the requests sent by every thread using
+            this instance (default: `AdaptiveLimiter(max_limit=pool_maxsize)`).
+        timeout (float | tuple | dict, optional): Connect and read timeouts, per endpoint
+            family if given as a dict (default: `DEFAULT_TIMEOUTS`). Inside a `Deadline`
+            they are shortened to the remaining budget.
+        hedge (HedgePolicy, optional): Sends a second copy of reads that are slower than
+            usual, disabled by default.
+        middleware (list[Middleware], optional): Hooks run around every call, in order.
+        metrics (Metrics, optional): Receives the count, latency and size of every HTTP
+            request per endpoint template (default: `Metrics()`).
+        lazy_hydration (bool): If True, objects build their type, properties, icon and
+            markdown from the response the first time they are used (default: True).
+    """
+
+    # Classes used when hydrating nested types and properties, the async client overrides them
+    _models: dict = {}
+    _is_async = False
+    # connection errors that can be retried, the first ones mean the request was not sent
+    _UNSENT_ERRORS: tuple = (requests.exceptions.ConnectTimeout,)
+    _TRANSPORT_ERRORS: tuple = (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+    # errors and statuses that make the limiter send fewer requests at once
+    _TIMEOUT_ERRORS: tuple = (requests.exceptions.Timeout,)
+    _OVERLOAD_STATUSES = frozenset({429, 503})
+
+    def __init__(
+        self,
+        headers: dict = {},
+        pool_connections: int = 1,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        page_parallelism: int = 4,
+        response_cache: ResponseCache | None = None,
+        retry: RetryPolicy | None = None,
+        limiter: AdaptiveLimiter | None = None,
+        timeout: float | tuple | dict | None = None,
+        hedge: HedgePolicy | None = None,
+        middleware: list[Middleware] | None = None,
+        metrics: Metrics | None = None,
+        lazy_hydration: bool = True,
+    ):
         self.space_id = ""
         self.api_url = API_CONFIG["apiUrl"].rstrip("/")
         self.app_name = API_CONFIG["apiAppName"]
+        headers = dict(headers)
         if "Anytype-Version" not in headers:
             headers["Anytype-Version"] = MIN_API_VERSION
+        if not keep_alive:
+            headers["Connection"] = "close"
         self.headers = headers
+        self.page_parallelism = page_parallelism
+        self.response_cache = response_cache
+        self.retry = retry if retry is not None else RetryPolicy()
+        if limiter is None:
+            limiter = AdaptiveLimiter(max_limit=pool_maxsize)
+        self.limiter = limiter
+        self.timeouts = _deadline.resolve_timeouts(timeout)
+        self.hedge = hedge
+        self.middleware = tuple(middleware or ())
+        self.metrics = metrics if metrics is not None else Metrics()
+        self.lazy_hydration = lazy_hydration
+        self._hedge_pool = None
+        if hedge is not None and not self._is_async:
+            # more threads than pooled connections would only wait for one
+            self._hedge_pool = ThreadPoolExecutor(
+                max_workers=pool_maxsize, thread_name_prefix="anytype-hedge"
+            )
+        self._pool_options = (pool_connections, pool_maxsize, pool_block)
+        self.session = self._new_session(pool_connections, pool_maxsize, pool_block)
+        self._property_cache = PropertyCache()
+        self._identity = IdentityMap()
+        self._tag_registries: dict[tuple[str, str], TagRegistry] = {}
+        self._lookup_index = LookupIndex()
+        self._in_flight = SingleFlight()
+
+    def _new_session(self, pool_connections, pool_maxsize, pool_block) -> requests.Session:
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers.update(self.headers)
+        return session
+
+    def __deepcopy__(self, memo):
+        # the session, caches and locks are shared by everything retrieved from the client,
+        # deep copies of objects, types and properties keep using this instance
+        return self
+
+    def _pickled_options(self) -> dict:
+        pool_connections, pool_maxsize, pool_block = self._pool_options
+        return {
+            "pool_connections": pool_connections,
+            "pool_maxsize": pool_maxsize,
+            "pool_block": pool_block,
+            "page_parallelism": self.page_parallelism,
+            "timeout": self.timeouts,
+            "lazy_hydration": self.lazy_hydration,
+        }
+
+    def __reduce__(self):
+        # the session, pools, caches and locks are not pickled, the loaded instance opens
+        # its own with a default limiter, retry policy and metrics, and no response cache,
+        # hedging or middleware
+        state = {"api_url": self.api_url, "app_name": self.app_name, "space_id": self.space_id}
+        return _unpickle_endpoints, (type(self), self.headers, self._pickled_options()), state
+
+    def close(self) -> None:
+        """
+        Closes every pooled connection owned by this instance.
+        """
+        if self._hedge_pool is not None:
+            self._hedge_pool.shutdown(wait=False)
+        self.session.close()
 
     def _request(self, method, path, params=None, json=None):
+        if not self.middleware:
+            return self._dispatch(method, path, params, json)
+        request = Request(method, path, params, json)
+        ran = []
+        try:
+            response = None
+            for middleware in self.middleware:
+                ran.append(middleware)
+                response = middleware.before_request(request)
+                if response is not None:
+                    break
+            if response is None:
+                response = self._dispatch(
+                    request.method, request.path, request.params, request.json
+                )
+        except Exception as error:
+            for middleware in reversed(ran):
+                response = middleware.on_error(request, error)
+                if response is not None:
+                    break
+            else:
+                raise
+        for middleware in reversed(ran):
+            response = middleware.after_response(request, response)
+        return response
+
+    def _dispatch(self, method, path, params=None, json=None):
+        left = _deadline.remaining()
+        if method != "GET":
+            return self._send(method, path, params, json)
+
+        # identical GETs sent from several threads at once share one response
+        key = (path, tuple(sorted((params or {}).items())))
+        future, owner = self._in_flight.join(key, Future())
+        if not owner:
+            try:
+                return future.result(timeout=left)
+            except FutureTimeoutError:
+                raise DeadlineExceeded(f"Deadline exceeded waiting for GET {path}") from None
+        try:
+            response = self._send(method, path, params, json)
+        except BaseException as e:
+            self._in_flight.settle(key, error=e)
+            raise
+        self._in_flight.settle(key, response)
+        return response
+
+    def _send(self, method, path, params=None, json=None):
         url = f"{self.api_url}{path}"
-        response = requests.request(method, url, headers=self.headers, json=json, params=params)
+        hedged = self.hedge is not None and self._hedgeable(method, path)
+        self.retry.count("requests")
+        attempt, delay = 1, 0.0
+        while True:
+            try:
+                if hedged:
+                    data = self._hedged_attempt(method, path, url, params, json)
+                else:
+                    data = self._attempt(method, path, url, params, json)
+            except (APIError, *self._TRANSPORT_ERRORS) as e:
+                delay = self._retry_delay(method, path, e, attempt, delay)
+                if delay is None:
+                    if attempt > 1:
+                        self.retry.count("exhausted")
+                    if isinstance(e, self._TIMEOUT_ERRORS) and _deadline.expired():
+                        raise DeadlineExceeded(f"Deadline exceeded during {method} {path}") from e
+                    raise
+            else:
+                if attempt > 1:
+                    self.retry.count("recovered")
+                return data
+            self.retry.count("retries")
+            attempt += 1
+            time.sleep(delay)
+
+    def _attempt(self, method, path, url, params=None, json=None, ticket=None):
+        if ticket is None:
+            ticket = self.limiter.acquire(timeout=_deadline.remaining())
+            if ticket is None:
+                raise DeadlineExceeded(f"Deadline exceeded before sending {method} {path}")
+        started = time.monotonic()
+        response = None
+        try:
+            response = self.session.request(
+                method, url, json=json, params=params, timeout=self._timeout(path)
+            )
+            data = self._check_response(response)
+        except BaseException as e:
+            self._release(ticket, method, path, started, e, response)
+            raise
+        self._release(ticket, method, path, started, response=response)
+        return data
+
+    def _hedgeable(self, method: str, path: str) -> bool:
+        # search is sent with POST but does not change anything
+        return read_only(method, path)
+
+    def _hedged_attempt(self, method, path, url, params=None, json=None):
+        delay = self.hedge.delay(f"{method} {_path_template(path)}")
+        send = partial(self._attempt, method, path, url, params, json)
+        # a read that cannot be hedged is sent from the calling thread, the others from the
+        # pool so that the caller can return as soon as the hedge answers
+        if delay is None or not self.hedge.has_budget():
+            return send()
+        send = _deadline.propagate(send)
+        primary = self._hedge_pool.submit(send)
+        if len(wait([primary], timeout=delay).done) > 0:
+            return primary.result()
+        # no hedge when the budget is spent or the limiter is full
+        ticket, _ = self.limiter.try_acquire(count=False)
+        if ticket is not None and not self.hedge.allow():
+            self.limiter.release(ticket)
+            ticket = None
+        if ticket is None:
+            return primary.result()
+        backup = self._hedge_pool.submit(send, ticket=ticket)
+        for future in as_completed([primary, backup]):
+            if future.exception() is None:
+                if future is backup:
+                    self.hedge.count("won")
+                return future.result()
+        return primary.result()
+
+    def _timeout(self, path: str) -> tuple[float, float]:
+        """
+        Returns:
+            The (connect, read) timeouts of `path`, shortened to the current deadline.
+        """
+        connect, read = self.timeouts.get(_endpoint_family(path), self.timeouts["default"])
+        left = _deadline.remaining()
+        if left is not None:
+            connect, read = min(connect, left), min(read, left)
+        return connect, read
+
+    def _release(self, ticket, method, path, started, error=None, response=None):
+        endpoint = f"{method} {_path_template(path)}"
+        latency = time.monotonic() - started
+        if response is not None or isinstance(error, Exception):
+            sent, received = _body_sizes(response)
+            _metrics.record(self.metrics, endpoint, latency, sent, received, error is not None)
+        if error is None:
+            self.limiter.release(ticket, latency, endpoint=endpoint)
+            if self.hedge is not None:
+                self.hedge.record(endpoint, latency)
+            return
+        # a timeout shortened by the deadline says nothing about the server load
+        timed_out = isinstance(error, self._TIMEOUT_ERRORS) and not _deadline.expired()
+        overloaded = timed_out or (
+            isinstance(error, APIError) and error.status_code in self._OVERLOAD_STATUSES
+        )
+        self.limiter.release(ticket, overloaded=overloaded)
+
+    def _retry_delay(self, method: str, path: str, error: Exception, attempt: int, previous: float):
+        """
+        Returns:
+            Seconds to wait before sending the failed request again, or None to give up.
+        """
+        if isinstance(error, APIError):
+            status_code, retry_after, sent = error.status_code, error.retry_after, True
+        else:
+            status_code, retry_after = None, None
+            sent = not isinstance(error, self._UNSENT_ERRORS)
+        if not self.retry.retryable(method, status_code, sent, path):
+            return None
+        delay = self.retry.delay(attempt, previous, retry_after)
+        try:
+            left = _deadline.remaining()
+        except DeadlineExceeded:
+            return None
+        if delay is not None and left is not None and delay >= left:
+            # the next attempt would start after the deadline
+            return None
+        return delay
+
+    def _cached_get(self, family: str, path: str):
+        cache = self.response_cache
+        if cache is None:
+            return self._request("GET", path)
+        response = cache.get(path)
+        if response is None:
+            generation = cache.generation
+            response = self._request("GET", path)
+            cache.put(family, path, response, generation)
+        return response
+
+    def _invalidate(self, prefix: str, family: str | None = None) -> None:
+        if self.response_cache is not None:
+            self.response_cache.invalidate(prefix, family)
+
+    def _write(self, method: str, path: str, forget, json=None):
+        """
+        Sends a write and drops what it makes stale with `forget()`, before the write and
+        again once it is done: a read sent meanwhile may have cached the old state.
+        """
+        forget()
+        try:
+            return self._request(method, path, json=json)
+        finally:
+            forget()
+
+    def _forget_type(self, spaceId: str, typeId: str | None = None) -> None:
+        # the properties of a type are created with it, and types list their templates
+        self._lookup_index.invalidate(spaceId, "types")
+        self._lookup_index.invalidate(spaceId, "properties")
+        self._lookup_index.invalidate(spaceId, "templates")
+        self._property_cache.invalidate(spaceId)
+        if typeId is not None:
+            self._identity.invalidate("type", spaceId, typeId)
+            self._invalidate(f"/spaces/{spaceId}/types/{typeId}")
+
+    def _forget_property(self, spaceId: str, propertyId: str | None = None) -> None:
+        self._lookup_index.invalidate(spaceId, "properties")
+        if propertyId is None:
+            return
+        self._property_cache.invalidate(spaceId, propertyId)
+        self._identity.invalidate("property", spaceId, propertyId)
+        # types list their properties by name and key
+        self._identity.invalidate("type", spaceId)
+        self._lookup_index.invalidate(spaceId, "types")
+        self._invalidate(f"/spaces/{spaceId}/properties/{propertyId}")
+        self._invalidate(f"/spaces/{spaceId}/types", "type")
+
+    def _forget_tag(self, spaceId: str, propertyId: str, tagId: str) -> None:
+        self._tag_registry(spaceId, propertyId).discard(tagId)
+        self._identity.invalidate("tag", spaceId, tagId)
+        self._invalidate(f"/spaces/{spaceId}/properties/{propertyId}/tags/{tagId}")
+
+    def _check_response(self, response) -> dict:
+        # error responses may come from something else than Anytype, check them first
+        ResponseHasError(response)
         version_str = response.headers.get("Anytype-Version")
         if version_str:
             version_date = datetime.strptime(version_str, "%Y-%m-%d").date()
@@ -41,9 +513,126 @@ class apiEndpoints:
         else:
             raise ValueError("Anytype-Version header not found, probably anytype is too old")
 
-        ResponseHasError(response)
         return response.json()
 
+    def _canonical(self, kind: str, spaceId: str, id: str | None, build):
+        """
+        Returns the instance of `(spaceId, id)` shared by everything this client hydrates,
+        built with `build()` the first time. Items without an id are not shared.
+        """
+        if not id:
+            return build()
+        item = self._identity.get(kind, spaceId, id)
+        if item is None:
+            item = self._identity.add(kind, spaceId, id, build())
+        return item
+
+    def _property_definition(self, spaceId: str, propertyId: str) -> dict:
+        definition = self._property_cache.get(spaceId, propertyId)
+        if definition is None and not self._property_cache.is_loaded(spaceId):
+            self._load_properties(spaceId)
+            definition = self._property_cache.get(spaceId, propertyId)
+        if definition is None:
+            # created after the space was loaded, or not listed by getProperties
+            definition = self.getProperty(spaceId, propertyId).get("property", {})
+            self._property_cache.update(spaceId, [definition])
+        return definition
+
+    def _load_properties(self, spaceId: str, limit: int = 100) -> None:
+        fetch = partial(self.getProperties, spaceId)
+        definitions = list(_iter_pages(fetch, limit, self.page_parallelism))
+        self._index_collection(("properties", spaceId), definitions)
+
+    def _list_fetch(self, collection: tuple):
+        kind, spaceId = collection[0], collection[1]
+        if kind == "types":
+            return partial(self.getTypes, spaceId)
+        elif kind == "properties":
+            return partial(self.getProperties, spaceId)
+        return partial(self.getTemplates, spaceId, collection[2])
+
+    def _index_collection(self, collection: tuple, items: list[dict]) -> None:
+        if collection[0] == "properties":
+            self._property_cache.update(collection[1], items)
+            self._property_cache.mark_loaded(collection[1])
+        self._lookup_index.build(collection, items)
+
+    def _lookup(self, collection: tuple, field: str, value: str, limit: int = 100) -> dict | None:
+        """
+        Finds an item of a `LookupIndex` collection by name or key. The collection is
+        indexed in one pass the first time, later lookups do not send requests.
+        """
+        if not self._lookup_index.is_loaded(collection):
+            pages = _iter_pages(self._list_fetch(collection), limit, self.page_parallelism)
+            self._index_collection(collection, list(pages))
+        return self._lookup_index.get(collection, field, value)
+
+    def _tag_registry(self, spaceId: str, propertyId: str) -> TagRegistry:
+        registry = self._tag_registries.get((spaceId, propertyId))
+        if registry is None:
+            registry = self._tag_registries.setdefault((spaceId, propertyId), TagRegistry())
+        return registry
+
+    def _load_tags(self, spaceId: str, propertyId: str, limit: int = 100) -> TagRegistry:
+        registry = self._tag_registry(spaceId, propertyId)
+        with registry.load_lock:
+            if not registry.loaded:
+                fetch = partial(self.getTags, spaceId, propertyId)
+                registry.update(list(_iter_pages(fetch, limit, self.page_parallelism)))
+                registry.loaded = True
+        return registry
+
+    def _create_tag(self, spaceId: str, propertyId: str, registry: TagRegistry, name: str) -> None:
+        data = {"name": name, "color": random.choice(_ANYTYPE_PROPERTIES_COLORS)}
+        try:
+            response = self.createTag(spaceId, propertyId, data)
+        except Exception as e:
+            registry.settle(name, error=e)
+            return
+        warnings.warn(f"Tag '{name}' not exist, creating it")
+        registry.settle(name, response.get("tag", {}))
+
+    def _resolve_tags(self, wanted: dict, concurrency: int = 8) -> dict:
+        """
+        Maps tag names to tag ids for several properties at once.
+
+        The tags of every property are loaded once per client, and all the missing tags
+        are created in one concurrent step.
+
+        Parameters:
+            wanted (dict): Tag names keyed by `(space_id, property_id)`.
+            concurrency (int): Maximum number of simultaneous requests (default: 8).
+
+        Returns:
+            A dict `{name: tag_id}` keyed by `(space_id, property_id)`. Tags that could
+            not be created are missing from it.
+        """
+        unloaded = [key for key in wanted if not self._tag_registry(*key).loaded]
+        _map_concurrently(lambda key: self._load_tags(*key), unloaded, concurrency)
+
+        resolved = {key: {} for key in wanted}
+        waiting = []
+        to_create = []
+        for key, names in wanted.items():
+            registry = self._tag_registry(*key)
+            for name in dict.fromkeys(names):
+                tag, future, owner = registry.claim(name, Future())
+                if tag is not None:
+                    resolved[key][name] = tag["id"]
+                    continue
+                if owner:
+                    to_create.append((key, registry, name))
+                waiting.append((key, name, future))
+
+        create = lambda item: self._create_tag(*item[0], item[1], item[2])
+        _map_concurrently(create, to_create, concurrency)
+        for key, name, future in waiting:
+            try:
+                resolved[key][name] = future.result()["id"]
+            except Exception as e:
+                warnings.warn(f"Could not create tag '{name}': {e}")
+        return resolved
+
     # --- auth ---
     def displayCode(self):
         return self._request("POST", "/auth/challenges", json={"app_name": self.app_name})
@@ -103,7 +692,8 @@ class apiEndpoints:
 
     # TODO: PATCH("/spaces/:space_id")
     def updateSpace(self, spaceId: str, data: dict):
-        return self._request("PATCH", f"/spaces/{spaceId}", json=data)
+        forget = partial(self._invalidate, f"/spaces/{spaceId}", "space")
+        return self._write("PATCH", f"/spaces/{spaceId}", forget, json=data)
 
     # --- spaces ---
     def createSpace(self, name):
@@ -111,7 +701,7 @@ class apiEndpoints:
         return self._request("POST", "/spaces", json=data)
 
     def getSpace(self, spaceId: str):
-        return self._request("GET", f"/spaces/{spaceId}")
+        return self._cached_get("space", f"/spaces/{spaceId}")
 
     def getSpaces(self, offset=0, limit=10):
         options = {"offset": offset, "limit": limit}
@@ -119,7 +709,7 @@ class apiEndpoints:
 
     # --- members ---
     def getMember(self, spaceId: str, objectId: str):
-        return self._request("GET", f"/spaces/{spaceId}/members/{objectId}")
+        return self._cached_get("member", f"/spaces/{spaceId}/members/{objectId}")
 
     def getMembers(self, spaceId: str, offset: int, limit: int):
         options = {"offset": offset, "limit": limit}
@@ -127,24 +717,28 @@ class apiEndpoints:
 
     # --- types ---
     def getType(self, spaceId: str, typeId: str):
-        return self._request("GET", f"/spaces/{spaceId}/types/{typeId}")
+        return self._cached_get("type", f"/spaces/{spaceId}/types/{typeId}")
 
     def getTypes(self, spaceId: str, offset: int, limit: int):
         options = {"offset": offset, "limit": limit}
         return self._request("GET", f"/spaces/{spaceId}/types", params=options)
 
     def createType(self, spaceId: str, data: dict):
-        return self._request("POST", f"/spaces/{spaceId}/types", json=data)
+        forget = partial(self._forget_type, spaceId)
+        return self._write("POST", f"/spaces/{spaceId}/types", forget, json=data)
 
     def updateType(self, spaceId: str, typeId: str, data: dict):
-        return self._request("PATCH", f"/spaces/{spaceId}/types/{typeId}", json=data)
+        forget = partial(self._forget_type, spaceId, typeId)
+        return self._write("PATCH", f"/spaces/{spaceId}/types/{typeId}", forget, json=data)
 
     def deleteType(self, spaceId: str, typeId: str):
-        return self._request("DELETE", f"/spaces/{spaceId}/types/{typeId}")
+        forget = partial(self._forget_type, spaceId, typeId)
+        return self._write("DELETE", f"/spaces/{spaceId}/types/{typeId}", forget)
 
     # --- templates ---
     def getTemplate(self, spaceId: str, typeId: str, templateId: str):
-        return self._request("GET", f"/spaces/{spaceId}/types/{typeId}/templates/{templateId}")
+        path = f"/spaces/{spaceId}/types/{typeId}/templates/{templateId}"
+        return self._cached_get("template", path)
 
     def getTemplates(self, spaceId: str, typeId: str, offset: int, limit: int):
         options = {"offset": offset, "limit": limit}
@@ -156,16 +750,20 @@ class apiEndpoints:
         return self._request("GET", f"/spaces/{spaceId}/properties", params=options)
 
     def getProperty(self, spaceId: str, propertyId: str):
-        return self._request("GET", f"/spaces/{spaceId}/properties/{propertyId}")
+        return self._cached_get("property", f"/spaces/{spaceId}/properties/{propertyId}")
 
     def createProperty(self, spaceId: str, data: dict):
-        return self._request("POST", f"/spaces/{spaceId}/properties", json=data)
+        forget = partial(self._forget_property, spaceId)
+        return self._write("POST", f"/spaces/{spaceId}/properties", forget, json=data)
 
     def updateProperty(self, spaceId: str, propertyId: str, data: dict):
-        return self._request("PATCH", f"/spaces/{spaceId}/properties/{propertyId}", json=data)
+        forget = partial(self._forget_property, spaceId, propertyId)
+        path = f"/spaces/{spaceId}/properties/{propertyId}"
+        return self._write("PATCH", path, forget, json=data)
 
     def deleteProperty(self, spaceId: str, propertyId: str):
-        return self._request("DELETE", f"/spaces/{spaceId}/properties/{propertyId}")
+        forget = partial(self._forget_property, spaceId, propertyId)
+        return self._write("DELETE", f"/spaces/{spaceId}/properties/{propertyId}", forget)
 
     # --- tag ---
     def getTags(self, spaceId: str, propertyId: str, offset: int = 0, limit: int = 10):
@@ -175,34 +773,185 @@ class apiEndpoints:
         )
 
     def getTag(self, spaceId: str, propertyId: str, tagId: str):
-        return self._request("GET", f"/spaces/{spaceId}/properties/{propertyId}/tags/{tagId}")
+        path = f"/spaces/{spaceId}/properties/{propertyId}/tags/{tagId}"
+        return self._cached_get("tag", path)
 
     def createTag(self, spaceId: str, propertyId: str, data: dict):
         return self._request("POST", f"/spaces/{spaceId}/properties/{propertyId}/tags", json=data)
 
     def updateTag(self, spaceId: str, propertyId: str, tagId: str, data: dict):
-        return self._request(
-            "PATCH", f"/spaces/{spaceId}/properties/{propertyId}/tags/{tagId}", json=data
-        )
+        forget = partial(self._forget_tag, spaceId, propertyId, tagId)
+        path = f"/spaces/{spaceId}/properties/{propertyId}/tags/{tagId}"
+        return self._write("PATCH", path, forget, json=data)
 
     def deleteTag(self, spaceId: str, propertyId: str, tagId: str):
-        return self._request("DELETE", f"/spaces/{spaceId}/properties/{propertyId}/tags/{tagId}")
+        forget = partial(self._forget_tag, spaceId, propertyId, tagId)
+        path = f"/spaces/{spaceId}/properties/{propertyId}/tags/{tagId}"
+        return self._write("DELETE", path, forget)
+
+
+def _definition_of(data: dict, space_id: str) -> dict:
+    """
+    The definition of a property entry: the entry without its value, in `space_id`.
+    """
+    format = data["format"]
+    return {name: item for name, item in data.items() if name != format} | {"space_id": space_id}
+
+
+def _unpickle_endpoints(cls: type, headers: dict, options: dict) -> apiEndpoints:
+    return cls(headers, **options)
+
+
+@cache
+def _slot_names(cls: type) -> tuple[str, ...]:
+    names = []
+    for klass in cls.__mro__:
+        slots = klass.__dict__.get("__slots__", ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        names.extend(name for name in slots if name not in ("__dict__", "__weakref__"))
+    return tuple(names)
+
+
+def _map_concurrently(function, items: list, concurrency: int) -> list:
+    if len(items) <= 1 or concurrency <= 1:
+        return [function(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(items))) as pool:
+        return list(pool.map(_deadline.propagate(function), items))
+
+
+def _next_offsets(response: dict, offset: int, limit: int, first: bool, parallelism: int):
+    """
+    Reads the pagination of the page fetched at `offset`.
+
+    Returns:
+        Whether more pages follow, and for the first page, when the total is known and
+        `parallelism` allows it, the offsets of all the remaining pages.
+    """
+    items = response.get("data", [])
+    pagination = response.get("pagination", {})
+    has_more = pagination.get("has_more", len(items) == limit) and len(items) > 0
+    total = pagination.get("total")
+    if first and has_more and parallelism > 1 and isinstance(total, int):
+        # the server may cap the page size below `limit`, step by what it returned
+        return has_more, range(offset + len(items), total, len(items))
+    return has_more, range(0)
+
+
+def _iter_pages(fetch, limit: int, parallelism: int = 1):
+    """
+    Yields the items of every page of a list endpoint, in order.
+
+    `fetch(offset, limit)` runs in background threads. Once the first page tells the
+    total number of items, up to `parallelism` of the remaining pages are requested at
+    the same time. Without a total the next page is requested while the current one is
+    consumed. At most `parallelism + 1` pages are held in memory.
+    """
+    fetch = _deadline.propagate(fetch)
+    with ThreadPoolExecutor(max_workers=max(parallelism, 1)) as pool:
+        pending = deque([(0, pool.submit(fetch, 0, limit))])
+        planned = iter(range(0))
+        first = True
+        try:
+            while len(pending) > 0:
+                offset, future = pending.popleft()
+                response = future.result()
+                items = response.get("data", [])
+                has_more, offsets = _next_offsets(response, offset, limit, first, parallelism)
+                if first:
+                    planned = iter(offsets)
+                    first = False
+                for next_offset in islice(planned, parallelism - len(pending)):
+                    pending.append((next_offset, pool.submit(fetch, next_offset, limit)))
+                if has_more and len(pending) == 0:
+                    # no total, or more items than announced: continue page by page
+                    next_offset = offset + len(items)
+                    pending.append((next_offset, pool.submit(fetch, next_offset, limit)))
+                yield from items
+        finally:
+            for _, future in pending:
+                future.cancel()
 
 
 T = TypeVar("T", bound="APIWrapper")
 
 
 class APIWrapper:
-    __slots__ = ()
-    _apiEndpoints: apiEndpoints | None = None
-    _json: dict | None = None
-    space_id = ""
+    """
+    Base class of the models returned by the API.
+
+    The models declare their fields in `__slots__`, so they carry no per-instance
+    `__dict__`. Fields that are not declared, such as new fields sent by the server or
+    attributes set by the caller, are kept in one overflow mapping, `_extra`, and read
+    and written like the others.
+    """
+
+    __slots__ = ("_apiEndpoints", "_json", "space_id", "_extra")
+    # values of the slots that were never set
+    _DEFAULTS: dict = {"_apiEndpoints": None, "_json": None, "space_id": "", "_extra": None}
+
+    def __getattr__(self, name: str):
+        # only called when `name` is not set
+        defaults = type(self)._DEFAULTS
+        if name in defaults:
+            return defaults[name]
+        extra = self._extra
+        if extra is not None and name in extra:
+            return extra[name]
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def __setattr__(self, name: str, value) -> None:
+        try:
+            object.__setattr__(self, name, value)
+        except AttributeError:
+            if hasattr(type(self), name):
+                raise
+            if self._extra is None:
+                object.__setattr__(self, "_extra", {})
+            self._extra[name] = value
+
+    def __delattr__(self, name: str) -> None:
+        try:
+            object.__delattr__(self, name)
+        except AttributeError:
+            if self._extra is None or name not in self._extra:
+                raise
+            del self._extra[name]
+
+    def __copy__(self):
+        clone = type(self).__new__(type(self))
+        for name in _slot_names(type(self)):
+            try:
+                object.__setattr__(clone, name, object.__getattribute__(self, name))
+            except AttributeError:
+                continue
+        if self._extra is not None:
+            object.__setattr__(clone, "_extra", dict(self._extra))
+        if hasattr(self, "__dict__"):
+            clone.__dict__.update(self.__dict__)
+        return clone
+
+    def __deepcopy__(self, memo):
+        clone = type(self).__new__(type(self))
+        memo[id(self)] = clone
+        for name in _slot_names(type(self)):
+            try:
+                value = object.__getattribute__(self, name)
+            except AttributeError:
+                continue
+            object.__setattr__(clone, name, deepcopy(value, memo))
+        if hasattr(self, "__dict__"):
+            clone.__dict__.update(deepcopy(self.__dict__, memo))
+        return clone
 
     @classmethod
     def _from_api(cls: Type[T], api: apiEndpoints, data: dict) -> T:
         instance = cls()
         instance._apiEndpoints = api
         instance._json = data
+        # nested types and properties are resolved inside this space
+        if "space_id" in data:
+            instance.space_id = data["space_id"]
         instance._add_attrs_from_dict(data)
         return instance
 
@@ -214,67 +963,45 @@ class APIWrapper:
             if key == "type":
                 from anytype import type
 
-                setattr(
-                    self,
-                    key,
-                    type.Type()._from_api(self._apiEndpoints, value | {"space_id": self.space_id}),
+                api = self._apiEndpoints
+                type_class = api._models.get("type", type.Type)
+                # every object of the type shares one instance
+                canonical = api._canonical(
+                    "type",
+                    self.space_id,
+                    value.get("id"),
+                    lambda: type_class._from_api(api, value | {"space_id": self.space_id}),
                 )
+                setattr(self, key, canonical)
             elif key == "properties":
                 from anytype import property
 
                 properties = {}
-                for prop in value:
-                    id = prop["id"]
-                    response = self._apiEndpoints.getProperty(self.space_id, id)
-                    data = response.get("property", {})
-                    format = data["format"]
-                    if format == "checkbox":
-                        prop = property.Checkbox._from_api(
-                            self._apiEndpoints, data | {"space_id": self.space_id}
-                        )
-                    elif format == "text":
-                        prop = property.Text._from_api(
-                            self._apiEndpoints, data | {"space_id": self.space_id}
-                        )
-                    elif format == "number":
-                        prop = property.Number._from_api(
-                            self._apiEndpoints, data | {"space_id": self.space_id}
-                        )
-                    elif format == "select":
-                        prop = property.Select._from_api(
-                            self._apiEndpoints, data | {"space_id": self.space_id}
-                        )
-                    elif format == "multi_select":
-                        prop = property.MultiSelect._from_api(
-                            self._apiEndpoints, data | {"space_id": self.space_id}
-                        )
-                    elif format == "date":
-                        prop = property.Date._from_api(
-                            self._apiEndpoints, data | {"space_id": self.space_id}
-                        )
-                    elif format == "files":
-                        prop = property.Files._from_api(
-                            self._apiEndpoints, data | {"space_id": self.space_id}
-                        )
-                    elif format == "url":
-                        prop = property.Url._from_api(
-                            self._apiEndpoints, data | {"space_id": self.space_id}
-                        )
-                    elif format == "email":
-                        prop = property.Email._from_api(
-                            self._apiEndpoints, data | {"space_id": self.space_id}
-                        )
-                    elif format == "phone":
-                        prop = property.Phone._from_api(
-                            self._apiEndpoints, data | {"space_id": self.space_id}
-                        )
-                    elif format == "objects":
-                        prop = property.Objects._from_api(
-                            self._apiEndpoints, data | {"space_id": self.space_id}
-                        )
+                for entry in value:
+                    # entries carry the definition and the value, older servers only the id
+                    if "format" in entry:
+                        data = entry
                     else:
+                        data = self._apiEndpoints._property_definition(self.space_id, entry["id"])
+                    format = data["format"]
+                    prop_class = self._apiEndpoints._models.get(format)
+                    if prop_class is None:
+                        prop_class = property.Property._FACTORY.get(format)
+                    if prop_class is None:
                         raise Exception("Invalid format")
 
+                    # the value is decoded below, _json is the definition shared by every
+                    # property with this id
+                    definition = self._apiEndpoints._canonical(
+                        "property",
+                        self.space_id,
+                        data.get("id"),
+                        partial(_definition_of, data, self.space_id),
+                    )
+                    prop = prop_class._from_api(self._apiEndpoints, definition)
+                    prop._value_from_json(entry)
+                    if prop.key == "description" and entry.get("text") is not None:
+                        self.description = entry["text"]
                     if prop.key in _ANYTYPE_SYSTEM_RELATIONS:
                         continue
 
@@ -0,0 +1,42 @@
+class BulkFailure:
+    """
+    One object that could not be created by `Space.create_objects`.
+
+    Attributes:
+        index (int): Position of the object in the input.
+        object (Object): The object that failed.
+        error (Exception): The error raised while serializing or creating it.
+    """
+
+    def __init__(self, index: int, object, error: Exception):
+        self.index = index
+        self.object = object
+        self.error = error
+
+    def __repr__(self):
+        return f"<BulkFailure(index={self.index}, error={self.error!r})>"
+
+
+class BulkResult:
+    """
+    Outcome of `Space.create_objects`.
+
+    Attributes:
+        objects (list[Object | None]): The created objects, in input order. Objects that
+            failed are None.
+        failures (list[BulkFailure]): One entry per failed object, sorted by index.
+    """
+
+    def __init__(self):
+        self.objects: list = []
+        self.failures: list[BulkFailure] = []
+
+    @property
+    def created(self) -> list:
+        """
+        The created objects, without the ones that failed.
+        """
+        return [obj for obj in self.objects if obj is not None]
+
+    def __repr__(self):
+        return f"<BulkResult(created={len(self.created)}, failed={len(self.failures)})>"
@@ -0,0 +1,327 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+
+class PropertyCache:
+    """
+    Property definitions (id, key, name and format) of each space, keyed by property id.
+
+    A space is filled in bulk from the paginated `getProperties` endpoint, so hydrating
+    objects does not need one `getProperty` request per property. Definitions are
+    dropped when the property is updated or deleted through the same client.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._spaces: dict[str, dict[str, dict]] = {}
+        self._loaded: set[str] = set()
+
+    def get(self, space_id: str, property_id: str) -> dict | None:
+        return self._spaces.get(space_id, {}).get(property_id)
+
+    def is_loaded(self, space_id: str) -> bool:
+        return space_id in self._loaded
+
+    def update(self, space_id: str, definitions: list[dict]) -> None:
+        with self._lock:
+            space = self._spaces.setdefault(space_id, {})
+            for definition in definitions:
+                space[definition["id"]] = definition
+
+    def mark_loaded(self, space_id: str) -> None:
+        with self._lock:
+            self._loaded.add(space_id)
+
+    def invalidate(self, space_id: str, property_id: str | None = None) -> None:
+        """
+        Drops one definition, or every definition of the space if `property_id` is None.
+        """
+        with self._lock:
+            if property_id is None:
+                self._spaces.pop(space_id, None)
+                self._loaded.discard(space_id)
+            else:
+                self._spaces.get(space_id, {}).pop(property_id, None)
+
+
+class IdentityMap:
+    """
+    Canonical instances of the types, property definitions and tags of each space, keyed
+    by `(space_id, id)`.
+
+    Objects hydrated by one client share them, so a scan of many objects of the same
+    type holds one `Type`, one definition per property and one `Tag` per tag instead
+    of a copy per object. Entries are dropped when the item is updated or deleted
+    through the same client.
+
+    Kinds are `"type"`, `"property"` and `"tag"`.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._items: dict[tuple[str, str, str], object] = {}
+
+    def get(self, kind: str, space_id: str, id: str):
+        return self._items.get((kind, space_id, id))
+
+    def add(self, kind: str, space_id: str, id: str, item):
+        """
+        Returns:
+            The canonical item, `item` unless another thread added one first.
+        """
+        with self._lock:
+            return self._items.setdefault((kind, space_id, id), item)
+
+    def invalidate(self, kind: str, space_id: str, id: str | None = None) -> None:
+        """
+        Drops one item, or every item of `kind` in the space if `id` is None.
+        """
+        with self._lock:
+            if id is not None:
+                self._items.pop((kind, space_id, id), None)
+                return
+            for key in [key for key in self._items if key[:2] == (kind, space_id)]:
+                del self._items[key]
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+class TagRegistry:
+    """
+    Tags of one select or multi-select property, indexed by name.
+
+    The registry is filled once by paging through `getTags`. Names that are being
+    created are tracked as pending futures, so concurrent callers that need the same
+    missing tag wait for one creation instead of creating duplicates.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.load_lock = threading.Lock()
+        self.loaded = False
+        self._by_name: dict[str, dict] = {}
+        self._pending: dict = {}
+
+    def get(self, name: str) -> dict | None:
+        return self._by_name.get(name)
+
+    def tags(self) -> list[dict]:
+        return list(self._by_name.values())
+
+    def update(self, tags: list[dict]) -> None:
+        with self._lock:
+            for tag in tags:
+                self._by_name[tag["name"]] = tag
+
+    def discard(self, tag_id: str) -> None:
+        """
+        Forgets a tag that was updated or deleted, the next lookup reloads the registry.
+        """
+        with self._lock:
+            self._by_name = {
+                name: tag for name, tag in self._by_name.items() if tag["id"] != tag_id
+            }
+            self.loaded = False
+
+    def claim(self, name: str, future) -> tuple:
+        """
+        Registers `future` as the pending creation of `name`, unless the tag is already
+        known or another caller is creating it.
+
+        Returns:
+            The known tag (or None), the future to wait for (or None) and True if the
+            caller must create the tag and settle `future`.
+        """
+        with self._lock:
+            tag = self._by_name.get(name)
+            if tag is not None:
+                return tag, None, False
+            if name in self._pending:
+                return None, self._pending[name], False
+            self._pending[name] = future
+            return None, future, True
+
+    def settle(self, name: str, tag: dict | None = None, error: Exception | None = None) -> None:
+        with self._lock:
+            future = self._pending.pop(name)
+            if tag is not None:
+                self._by_name[tag["name"]] = tag
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(tag)
+
+
+class LookupIndex:
+    """
+    Name and key indexes of the types and properties of each space, and of the templates
+    of each type.
+
+    A collection is indexed from one pass over its list endpoint, so the `*_byname` and
+    `*_bykey` lookups do not scan pages. It is dropped when one of its items is created,
+    updated or deleted through the same client, and rebuilt by the next lookup.
+
+    Collections are tuples: `("types", space_id)`, `("properties", space_id)` and
+    `("templates", space_id, type_id)`.
+    """
+
+    FIELDS = ("name", "key")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._indexes: dict[tuple, dict[str, dict[str, dict]]] = {}
+
+    def is_loaded(self, collection: tuple) -> bool:
+        return collection in self._indexes
+
+    def get(self, collection: tuple, field: str, value: str) -> dict | None:
+        index = self._indexes.get(collection)
+        if index is None:
+            return None
+        return index[field].get(value)
+
+    def build(self, collection: tuple, items: list[dict]) -> None:
+        index = {field: {} for field in self.FIELDS}
+        for item in items:
+            for field in self.FIELDS:
+                value = item.get(field)
+                if value:
+                    # keep the first match, as the paginated scans did
+                    index[field].setdefault(value, item)
+        with self._lock:
+            self._indexes[collection] = index
+
+    def invalidate(self, space_id: str, kind: str | None = None) -> None:
+        """
+        Drops the indexes of a space, only the ones of `kind` ("types", "properties" or
+        "templates") if given.
+        """
+        with self._lock:
+            self._indexes = {
+                collection: index
+                for collection, index in self._indexes.items()
+                if collection[1] != space_id or kind not in (None, collection[0])
+            }
+
+
+class ResponseCache:
+    """
+    Bounded cache of single-item GET responses (spaces, types, properties, templates,
+    members and tags), enabled by passing an instance to `Anytype(response_cache=...)`.
+
+    Entries expire after the TTL of their family and the least recently used entry is
+    evicted once `maxsize` is reached. Updates and deletions made through the same
+    client drop the entries they make stale, and a response read while one of them was
+    sent is not cached.
+
+    Parameters:
+        maxsize (int): Maximum number of cached responses (default: 1024).
+        ttl (float | dict): Seconds an entry stays valid, either for every family or
+            per family, e.g. `{"member": 30}`. Missing families use `DEFAULT_TTL`.
+    """
+
+    DEFAULT_TTL = {
+        "space": 300.0,
+        "type": 300.0,
+        "property": 300.0,
+        "template": 300.0,
+        "member": 60.0,
+        "tag": 300.0,
+    }
+
+    def __init__(self, maxsize: int = 1024, ttl: float | dict | None = None):
+        self.maxsize = maxsize
+        if isinstance(ttl, (int, float)):
+            self.ttl = {family: float(ttl) for family in self.DEFAULT_TTL}
+        else:
+            self.ttl = self.DEFAULT_TTL | (ttl or {})
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[str, float, dict]] = OrderedDict()
+        # bumped by every invalidation, see put
+        self.generation = 0
+
+    def get(self, path: str) -> dict | None:
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is None or entry[1] < time.monotonic():
+                if entry is not None:
+                    del self._entries[path]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(path)
+            self.hits += 1
+        # callers may change the returned dict
+        return copy.deepcopy(entry[2])
+
+    def put(self, family: str, path: str, response: dict, generation: int | None = None) -> None:
+        """
+        Caches `response`. `generation` is the value of `self.generation` read before
+        the request was sent: if entries were invalidated since, the response may
+        predate a write and is not cached.
+        """
+        expires = time.monotonic() + self.ttl.get(family, 0.0)
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._entries[path] = (family, expires, copy.deepcopy(response))
+            self._entries.move_to_end(path)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, prefix: str, family: str | None = None) -> None:
+        """
+        Drops the entries of `prefix` and of the paths below it, only the ones of
+        `family` if given.
+        """
+        with self._lock:
+            self.generation += 1
+            for path in list(self._entries):
+                if path != prefix and not path.startswith(prefix + "/"):
+                    continue
+                if family is None or self._entries[path][0] == family:
+                    del self._entries[path]
+
+    def clear(self) -> None:
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+
+
+class SingleFlight:
+    """
+    Identical GET requests that are in flight at the same time, keyed by path and query
+    parameters. The first caller sends the request and settles a future that the other
+    callers wait for, so only one request goes on the wire and every caller gets the
+    same parsed response.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending: dict = {}
+
+    def join(self, key: tuple, future) -> tuple:
+        """
+        Returns:
+            The future to wait for, and True if the caller must send the request and
+            settle it.
+        """
+        with self._lock:
+            pending = self._pending.get(key)
+            if pending is not None:
+                return pending, False
+            self._pending[key] = future
+            return future, True
+
+    def settle(self, key: tuple, response=None, error: BaseException | None = None):
+        with self._lock:
+            future = self._pending.pop(key)
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(response)
+        return future
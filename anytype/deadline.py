@@ -0,0 +1,136 @@
+import time
+from contextvars import ContextVar
+
+# (connect, read) timeouts in seconds per endpoint family, "default" for the others
+DEFAULT_TIMEOUTS = {
+    "default": (5.0, 30.0),
+    "object": (5.0, 60.0),
+    "search": (5.0, 60.0),
+}
+
+_current: ContextVar["Deadline | None"] = ContextVar("anytype_deadline", default=None)
+
+
+class DeadlineExceeded(TimeoutError):
+    """
+    Raised when a request would start, or wait, after the current `Deadline` expired.
+    """
+
+
+class Deadline:
+    """
+    Time budget shared by every request sent inside the `with` block, from any method.
+
+    High-level calls such as `Space.update_object` or `Space.create_type` send several
+    requests. Inside a deadline each of them uses at most the remaining budget as its
+    timeout, retries and waits for the limiter stop once it is spent, and a
+    `DeadlineExceeded` is raised instead of starting a request that cannot finish in
+    time. Nested deadlines never extend the outer one. The budget follows the requests
+    made from worker threads by `create_objects` and the `iter_*` methods, and works
+    with `async with` for the async client.
+
+    Example:
+        with anytype.Deadline(5):
+            space.update_object(obj)
+
+    Parameters:
+        seconds (float): Budget of the block.
+    """
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self.expires: float | None = None
+        self._token = None
+
+    def __enter__(self):
+        expires = time.monotonic() + self.seconds
+        outer = _current.get()
+        if outer is not None:
+            expires = min(expires, outer.expires)
+        self.expires = expires
+        self._token = _current.set(self)
+        return self
+
+    def __exit__(self, *exc):
+        _current.reset(self._token)
+
+    async def __aenter__(self):
+        return self.__enter__()
+
+    async def __aexit__(self, *exc):
+        self.__exit__(*exc)
+
+    def remaining(self) -> float:
+        """
+        Returns:
+            Seconds left, negative once the deadline expired.
+        """
+        return self.expires - time.monotonic()
+
+    def __repr__(self):
+        return f"<Deadline(remaining={self.remaining():.3f})>"
+
+
+def remaining() -> float | None:
+    """
+    Returns:
+        Seconds left in the current deadline, None outside of one.
+
+    Raises:
+        DeadlineExceeded: If the current deadline expired.
+    """
+    current = _current.get()
+    if current is None:
+        return None
+    left = current.remaining()
+    if left <= 0:
+        raise DeadlineExceeded(f"Deadline of {current.seconds}s exceeded")
+    return left
+
+
+def expired() -> bool:
+    """
+    Returns:
+        True inside a deadline that expired.
+    """
+    current = _current.get()
+    return current is not None and current.remaining() <= 0
+
+
+def propagate(function):
+    """
+    Returns `function` bound to the current deadline, for calls made from other threads.
+    """
+    current = _current.get()
+    if current is None:
+        return function
+
+    def bound(*args, **kwargs):
+        token = _current.set(current)
+        try:
+            return function(*args, **kwargs)
+        finally:
+            _current.reset(token)
+
+    return bound
+
+
+def resolve_timeouts(timeout) -> dict:
+    """
+    Normalizes the `timeout` option of the client to `{family: (connect, read)}`.
+
+    Parameters:
+        timeout (float | tuple | dict | None): One value for both timeouts, a
+            `(connect, read)` tuple, or a dict of either per family (`object`, `search`,
+            `type`, `property`, `tag`, ... and `default`). Missing families use
+            `DEFAULT_TIMEOUTS`.
+    """
+    timeouts = dict(DEFAULT_TIMEOUTS)
+    if timeout is None:
+        return timeouts
+    if not isinstance(timeout, dict):
+        timeout = {"default": timeout}
+        timeouts = {}
+    for family, value in timeout.items():
+        timeouts[family] = tuple(value) if isinstance(value, (tuple, list)) else (value, value)
+    return timeouts
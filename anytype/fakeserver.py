@@ -0,0 +1,910 @@
+"""
+In-process stand-in for the Anytype v1 HTTP API, to run tests and benchmarks without
+the desktop app.
+
+The server keeps spaces, objects, types, properties, tags, templates, lists and members
+in memory and answers the endpoints used by `apiEndpoints` with the same JSON shapes
+and error format as Anytype. It listens on an ephemeral port of `127.0.0.1` and can add
+latency and errors to the responses.
+
+Example:
+    from anytype.fakeserver import FakeAnytypeServer
+
+    with FakeAnytypeServer(latency=0.002) as server:
+        any = server.client()
+        space = any.get_space(server.space_id)
+        space.create_object(Object("Hello", space.get_type_byname("Page")))
+"""
+
+import re
+import json
+import time
+import uuid
+import random
+import threading
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+from . import api as _api
+from .api import MIN_API_VERSION
+
+# default properties of a new space: key, name, format and the options of select formats
+_DEFAULT_PROPERTIES = (
+    ("description", "Description", "text", ()),
+    ("tag", "Tag", "multi_select", ()),
+    ("status", "Status", "select", ("Not started", "In progress", "Done")),
+    ("done", "Done", "checkbox", ()),
+    ("source", "Source", "url", ()),
+    ("due_date", "Due date", "date", ()),
+)
+
+# default types of a new space: key, name, plural name, layout and property keys
+_DEFAULT_TYPES = (
+    ("page", "Page", "Pages", "basic", ("description", "tag")),
+    ("note", "Note", "Notes", "note", ("tag",)),
+    ("task", "Task", "Tasks", "todo", ("status", "done", "due_date", "tag")),
+    ("bookmark", "Bookmark", "Bookmarks", "bookmark", ("source", "description", "tag")),
+    ("collection", "Collection", "Collections", "collection", ("description",)),
+)
+
+_COLLECTION_LAYOUTS = ("collection", "set")
+
+# objects of a new space: type key, name and markdown body
+_DEFAULT_OBJECTS = (
+    ("page", "Get started", "# Get started\nWelcome to your new space."),
+    ("note", "First note", "Notes have no title."),
+    ("task", "Try the API", ""),
+    ("collection", "Favorites", ""),
+)
+
+# largest page returned by the list endpoints
+_MAX_LIMIT = 1000
+
+# path parameters are named after the id they hold, e.g. `{object_id}`
+_ROUTES = [
+    (method, re.compile("^" + re.sub(r"\{(\w+)\}", r"(?P<\1>[^/]+)", path) + "$"), handler)
+    for method, path, handler in [
+        ("POST", "/auth/challenges", "_create_challenge"),
+        ("POST", "/auth/api_keys", "_create_api_key"),
+        ("POST", "/search", "_search_all"),
+        ("GET", "/spaces", "_list_spaces"),
+        ("POST", "/spaces", "_create_space"),
+        ("GET", "/spaces/{space_id}", "_get_space"),
+        ("PATCH", "/spaces/{space_id}", "_update_space"),
+        ("GET", "/spaces/{space_id}/members", "_list_members"),
+        ("GET", "/spaces/{space_id}/members/{member_id}", "_get_member"),
+        ("POST", "/spaces/{space_id}/search", "_search"),
+        ("GET", "/spaces/{space_id}/objects", "_list_objects"),
+        ("POST", "/spaces/{space_id}/objects", "_create_object"),
+        ("GET", "/spaces/{space_id}/objects/{object_id}", "_get_object"),
+        ("PATCH", "/spaces/{space_id}/objects/{object_id}", "_update_object"),
+        ("DELETE", "/spaces/{space_id}/objects/{object_id}", "_delete_object"),
+        ("GET", "/spaces/{space_id}/types", "_list_types"),
+        ("POST", "/spaces/{space_id}/types", "_create_type"),
+        ("GET", "/spaces/{space_id}/types/{type_id}", "_get_type"),
+        ("PATCH", "/spaces/{space_id}/types/{type_id}", "_update_type"),
+        ("DELETE", "/spaces/{space_id}/types/{type_id}", "_delete_type"),
+        ("GET", "/spaces/{space_id}/types/{type_id}/templates", "_list_templates"),
+        ("GET", "/spaces/{space_id}/types/{type_id}/templates/{template_id}", "_get_template"),
+        ("GET", "/spaces/{space_id}/properties", "_list_properties"),
+        ("POST", "/spaces/{space_id}/properties", "_create_property"),
+        ("GET", "/spaces/{space_id}/properties/{property_id}", "_get_property"),
+        ("PATCH", "/spaces/{space_id}/properties/{property_id}", "_update_property"),
+        ("DELETE", "/spaces/{space_id}/properties/{property_id}", "_delete_property"),
+        ("GET", "/spaces/{space_id}/properties/{property_id}/tags", "_list_tags"),
+        ("POST", "/spaces/{space_id}/properties/{property_id}/tags", "_create_tag"),
+        ("GET", "/spaces/{space_id}/properties/{property_id}/tags/{tag_id}", "_get_tag"),
+        ("PATCH", "/spaces/{space_id}/properties/{property_id}/tags/{tag_id}", "_update_tag"),
+        ("DELETE", "/spaces/{space_id}/properties/{property_id}/tags/{tag_id}", "_delete_tag"),
+        ("GET", "/spaces/{space_id}/lists/{list_id}/views", "_list_views"),
+        ("GET", "/spaces/{space_id}/lists/{list_id}/views/{view_id}/objects", "_list_view_objects"),
+        ("POST", "/spaces/{space_id}/lists/{list_id}/objects", "_add_to_list"),
+        ("DELETE", "/spaces/{space_id}/lists/{list_id}/objects/{object_id}", "_remove_from_list"),
+    ]
+]
+
+_api_url_lock = threading.Lock()
+
+
+class _HTTPError(Exception):
+    def __init__(self, status: int, code: str, message: str):
+        super().__init__(message)
+        self.status = status
+        self.code = code
+        self.message = message
+
+
+def _not_found(kind: str, id: str) -> _HTTPError:
+    return _HTTPError(404, "object_not_found", f"{kind} {id} not found")
+
+
+def _new_id() -> str:
+    return "bafyrei" + uuid.uuid4().hex
+
+
+def _key(name: str) -> str:
+    return re.sub(r"\W+", "_", name.strip().lower()).strip("_") or _new_id()
+
+
+def _page(items, params: dict, convert=None) -> dict:
+    items = list(items)
+    offset = int(params.get("offset", 0))
+    limit = min(int(params.get("limit", 100)), _MAX_LIMIT)
+    data = items[offset : offset + limit]
+    return {
+        "data": [convert(item) for item in data] if convert is not None else data,
+        "pagination": {
+            "total": len(items),
+            "offset": offset,
+            "limit": limit,
+            "has_more": offset + limit < len(items),
+        },
+    }
+
+
+class _Fault:
+    __slots__ = ("status", "times", "method", "path", "retry_after")
+
+    def __init__(self, status, times, method, path, retry_after):
+        self.status = status
+        self.times = times
+        self.method = method
+        self.path = re.compile(path) if path is not None else None
+        self.retry_after = retry_after
+
+    def matches(self, method: str, path: str) -> bool:
+        return (self.method is None or self.method == method) and (
+            self.path is None or self.path.search(path) is not None
+        )
+
+
+class _Space:
+    """
+    State of one space. Objects, types and properties are dicts in the API format,
+    tags are kept per property id. `lists` holds the objects added to each collection,
+    types are lists of their objects as well.
+    """
+
+    def __init__(self, id: str, name: str, description: str = ""):
+        self.data = {
+            "object": "space",
+            "id": id,
+            "name": name,
+            "icon": {"format": "emoji", "emoji": "🌐"},
+            "description": description,
+            "gateway_url": "",
+            "network_id": "",
+        }
+        self.objects: dict[str, dict] = {}
+        self.types: dict[str, dict] = {}
+        self.properties: dict[str, dict] = {}
+        self.tags: dict[str, dict[str, dict]] = {}
+        self.templates: dict[str, dict[str, dict]] = {}
+        self.lists: dict[str, list[str]] = {}
+        self.members: dict[str, dict] = {}
+
+    def property_by_key(self, key: str) -> dict:
+        for prop in self.properties.values():
+            if prop["key"] == key:
+                return prop
+        raise _HTTPError(400, "bad_request", f"unknown property key {key!r}")
+
+    def type_by_key(self, key: str) -> dict:
+        for type in self.types.values():
+            if type["key"] == key:
+                return type
+        raise _HTTPError(400, "bad_request", f"unknown type key {key!r}")
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # headers and body are written separately, do not wait for the ACK of the headers
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self, status: int, body, headers: dict | None = None) -> None:
+        raw = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(raw)))
+        self.send_header("Anytype-Version", MIN_API_VERSION)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(raw)
+
+    def _handle(self, method: str) -> None:
+        url = urlsplit(self.path)
+        params = {key: values[0] for key, values in parse_qs(url.query).items()}
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        try:
+            body = json.loads(raw) if raw else {}
+        except ValueError:
+            body = None
+        status, response, headers = self.server.fake._respond(
+            method, url.path, params, body, self.headers.get("Authorization")
+        )
+        self._reply(status, response, headers)
+
+    def do_GET(self):
+        self._handle("GET")
+
+    def do_POST(self):
+        self._handle("POST")
+
+    def do_PATCH(self):
+        self._handle("PATCH")
+
+    def do_DELETE(self):
+        self._handle("DELETE")
+
+
+class FakeAnytypeServer:
+    """
+    In-memory Anytype v1 API served over HTTP on an ephemeral local port.
+
+    A space named "Test space", with the default types (Page, Note, Task, Bookmark,
+    Collection), properties and one member, is created on start, see `space_id`. The
+    4-digit code of the authentication challenge is `code`.
+
+    Parameters:
+        latency (float): Seconds added to every response (default: 0).
+        jitter (float): Up to this many seconds are added at random to `latency`.
+        error_rate (float): Share of the requests answered with a 500 error, at random.
+        capacity (int, optional): Requests handled at the same time, the ones above are
+            answered with a 429 error and a `Retry-After` header.
+        api_key (str): Bearer token accepted by the server.
+        port (int): Port to listen on, 0 picks a free one (default: 0).
+        seed (int, optional): Seed of the random latency and errors.
+
+    Attributes:
+        requests (list[tuple[str, str]]): Method and path, below `/v1`, of every request
+            received.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        capacity: int | None = None,
+        api_key: str = "fake-api-key",
+        port: int = 0,
+        seed: int | None = None,
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.capacity = capacity
+        self.api_key = api_key
+        self.code = "1234"
+        self.port = port
+        self.requests: list[tuple[str, str]] = []
+        self._random = random.Random(seed)
+        self._faults: list[_Fault] = []
+        self._in_flight = 0
+        self._spaces: dict[str, _Space] = {}
+        self._lock = threading.RLock()
+        self._httpd: ThreadingHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+        self.space_id = self.add_space("Test space")
+
+    # --- lifecycle ---
+    def start(self) -> "FakeAnytypeServer":
+        """
+        Starts serving in a background thread.
+        """
+        if self._httpd is not None:
+            return self
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", self.port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.fake = self
+        self.port = self._httpd.server_address[1]
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="FakeAnytypeServer", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """
+        Stops the server, the state is kept and `start` serves it again.
+        """
+        if self._httpd is None:
+            return
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        self._thread.join()
+        self._httpd = None
+        self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    @property
+    def url(self) -> str:
+        """
+        Base url of the API, to use as `API_CONFIG["apiUrl"]`.
+        """
+        return f"http://127.0.0.1:{self.port}/v1"
+
+    @contextmanager
+    def _api_url(self):
+        with _api_url_lock:
+            previous = _api.API_CONFIG["apiUrl"]
+            _api.API_CONFIG["apiUrl"] = self.url
+            try:
+                yield
+            finally:
+                _api.API_CONFIG["apiUrl"] = previous
+
+    def client(self, **options):
+        """
+        Parameters:
+            **options: Arguments of `anytype.Anytype`.
+
+        Returns:
+            Anytype: A client authenticated against this server. Other clients keep
+                using the url of `API_CONFIG`.
+        """
+        from .anytype import Anytype
+
+        client = Anytype(**options)
+        with self._api_url():
+            client.auth(persist_token=False, api_key=self.api_key)
+        return client
+
+    async def async_client(self, **options):
+        """
+        Parameters:
+            **options: Arguments of `anytype.aio.AsyncAnytype`.
+
+        Returns:
+            AsyncAnytype: An asyncio client authenticated against this server.
+        """
+        from .aio import AsyncAnytype
+
+        client = AsyncAnytype(**options)
+        with self._api_url():
+            client._new_endpoints()
+        client.api_key = self.api_key
+        with self._api_url():
+            await client._validate_token()
+        return client
+
+    # --- fault injection ---
+    def inject_error(
+        self,
+        status: int = 500,
+        times: int = 1,
+        method: str | None = None,
+        path: str | None = None,
+        retry_after: float | None = None,
+    ) -> None:
+        """
+        Answers the next `times` matching requests with an error.
+
+        Parameters:
+            status (int): HTTP status of the error (default: 500).
+            times (int): Number of requests that fail (default: 1).
+            method (str, optional): Only requests with this HTTP method.
+            path (str, optional): Only requests whose path, below `/v1`, matches this
+                regular expression, e.g. `r"/objects/[^/]+$"`.
+            retry_after (float, optional): Value of the `Retry-After` header.
+        """
+        with self._lock:
+            self._faults.append(_Fault(status, times, method, path, retry_after))
+
+    def clear_errors(self) -> None:
+        with self._lock:
+            self._faults.clear()
+
+    def _fault(self, method: str, path: str) -> _Fault | None:
+        with self._lock:
+            for fault in self._faults:
+                if fault.matches(method, path):
+                    fault.times -= 1
+                    if fault.times <= 0:
+                        self._faults.remove(fault)
+                    return fault
+            if self.error_rate and self._random.random() < self.error_rate:
+                return _Fault(500, 1, None, None, None)
+        return None
+
+    # --- seeding ---
+    def add_space(self, name: str, description: str = "") -> str:
+        """
+        Creates a space with the default types, properties, objects and member.
+
+        Returns:
+            The id of the space.
+        """
+        with self._lock:
+            space = _Space(_new_id(), name, description)
+            for key, prop_name, format, options in _DEFAULT_PROPERTIES:
+                prop = self._new_property(space, prop_name, format, key)
+                for option in options:
+                    self._new_tag(space, prop["id"], option, "grey")
+            for key, type_name, plural_name, layout, keys in _DEFAULT_TYPES:
+                properties = [space.property_by_key(prop_key) for prop_key in keys]
+                self._new_type(space, key, type_name, plural_name, layout, None, properties)
+            for type_key, obj_name, body in _DEFAULT_OBJECTS:
+                data = {"name": obj_name, "body": body}
+                self._add_object(space, self._new_object(space, space.type_by_key(type_key), data))
+            member_id = _new_id()
+            space.members[member_id] = {
+                "object": "member",
+                "id": member_id,
+                "name": "Owner",
+                "icon": None,
+                "identity": member_id,
+                "global_name": "owner.any",
+                "status": "active",
+                "role": "owner",
+            }
+            self._spaces[space.data["id"]] = space
+            return space.data["id"]
+
+    def add_template(self, space_id: str, type_key: str, name: str, body: str = "") -> str:
+        """
+        Adds a template to a type.
+
+        Returns:
+            The id of the template.
+        """
+        with self._lock:
+            space = self._space(space_id)
+            type = space.type_by_key(type_key)
+            template = self._new_object(space, type, {"name": name, "body": body})
+            space.templates[type["id"]][template["id"]] = template
+            return template["id"]
+
+    def add_property(self, space_id: str, name: str, format: str, key: str = "") -> str:
+        """
+        Returns:
+            The id of the new property.
+        """
+        with self._lock:
+            return self._new_property(self._space(space_id), name, format, key)["id"]
+
+    def add_tag(self, space_id: str, property_id: str, name: str, color: str = "grey") -> str:
+        """
+        Returns:
+            The id of the new tag.
+        """
+        with self._lock:
+            space = self._space(space_id)
+            self._get(space.tags, "property", property_id)
+            return self._new_tag(space, property_id, name, color)["id"]
+
+    def add_object(
+        self,
+        space_id: str,
+        type_key: str,
+        name: str,
+        body: str = "",
+        properties: list[dict] | None = None,
+    ) -> str:
+        """
+        Adds an object without going through HTTP, to seed large spaces quickly.
+
+        Parameters:
+            properties (list[dict], optional): Values in the format of the API, e.g.
+                `{"key": "tag", "multi_select": [tag_id]}`.
+
+        Returns:
+            The id of the object.
+        """
+        with self._lock:
+            space = self._space(space_id)
+            data = {"name": name, "body": body, "properties": properties or []}
+            obj = self._new_object(space, space.type_by_key(type_key), data)
+            self._add_object(space, obj)
+            return obj["id"]
+
+    # --- request handling ---
+    def _respond(self, method: str, url_path: str, params: dict, body, authorization):
+        path = url_path[len("/v1") :] if url_path.startswith("/v1/") else url_path
+        with self._lock:
+            self.requests.append((method, path))
+            self._in_flight += 1
+            busy = self._in_flight
+        try:
+            if self.latency or self.jitter:
+                time.sleep(self.latency + self._random.uniform(0, self.jitter))
+            if self.capacity is not None and busy > self.capacity:
+                return self._error(429, "rate_limit_exceeded", "too many requests", 0.05)
+            fault = self._fault(method, path)
+            if fault is not None:
+                return self._error(
+                    fault.status, "injected_error", f"injected {fault.status}", fault.retry_after
+                )
+            if not path.startswith("/auth/") and authorization != f"Bearer {self.api_key}":
+                return self._error(401, "unauthorized", "invalid or missing api key")
+            if body is None or not isinstance(body, dict):
+                return self._error(400, "bad_request", "invalid JSON body")
+            for route_method, pattern, name in _ROUTES:
+                match = pattern.match(path)
+                if match is None or route_method != method:
+                    continue
+                try:
+                    with self._lock:
+                        status, response = getattr(self, name)(params, body, **match.groupdict())
+                except _HTTPError as e:
+                    return self._error(e.status, e.code, e.message)
+                except (KeyError, TypeError, ValueError) as e:
+                    return self._error(400, "bad_request", f"invalid request: {e!r}")
+                return status, response, None
+            return self._error(404, "not_found", f"no endpoint {method} {path}")
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    @staticmethod
+    def _error(status: int, code: str, message: str, retry_after: float | None = None):
+        body = {"object": "error", "status": status, "code": code, "message": message}
+        headers = {"Retry-After": str(retry_after)} if retry_after is not None else None
+        return status, body, headers
+
+    def _space(self, space_id: str) -> _Space:
+        space = self._spaces.get(space_id)
+        if space is None:
+            raise _not_found("space", space_id)
+        return space
+
+    @staticmethod
+    def _get(items: dict, kind: str, id: str) -> dict:
+        item = items.get(id)
+        if item is None:
+            raise _not_found(kind, id)
+        return item
+
+    # --- builders ---
+    def _new_property(self, space: _Space, name: str, format: str, key: str = "") -> dict:
+        id = _new_id()
+        prop = {"object": "property", "id": id, "key": key or _key(name)}
+        prop |= {"name": name, "format": format}
+        space.properties[id] = prop
+        space.tags[id] = {}
+        return prop
+
+    def _new_tag(self, space: _Space, property_id: str, name: str, color: str) -> dict:
+        id = _new_id()
+        tag = {"object": "tag", "id": id, "key": _key(name) + "_" + id[-6:], "name": name}
+        tag["color"] = color
+        space.tags[property_id][id] = tag
+        return tag
+
+    def _new_type(self, space, key, name, plural_name, layout, icon, properties) -> dict:
+        id = _new_id()
+        type = {
+            "object": "type",
+            "id": id,
+            "key": key,
+            "name": name,
+            "plural_name": plural_name,
+            "icon": icon or {"format": "emoji", "emoji": "📄"},
+            "archived": False,
+            "layout": layout,
+            "properties": [dict(prop) for prop in properties],
+        }
+        space.types[id] = type
+        space.templates[id] = {}
+        return type
+
+    def _new_object(self, space: _Space, type: dict, body: dict) -> dict:
+        id = _new_id()
+        obj = {
+            "object": "object",
+            "id": id,
+            "name": "",
+            "icon": None,
+            "archived": False,
+            "space_id": space.data["id"],
+            "snippet": "",
+            "layout": type["layout"],
+            "type": type,
+            "markdown": "",
+            "properties": [],
+        }
+        self._apply_object(space, obj, body)
+        return obj
+
+    @staticmethod
+    def _add_object(space: _Space, obj: dict) -> None:
+        space.objects[obj["id"]] = obj
+        if obj["layout"] in _COLLECTION_LAYOUTS:
+            space.lists[obj["id"]] = []
+
+    def _apply_object(self, space: _Space, obj: dict, body: dict) -> None:
+        for field in ("name", "icon"):
+            if field in body:
+                obj[field] = body[field]
+        if "body" in body:
+            obj["markdown"] = body["body"] or ""
+            obj["snippet"] = obj["markdown"][:200]
+        values = {prop["key"]: prop for prop in obj["properties"]}
+        for value in body.get("properties") or []:
+            definition = space.property_by_key(value["key"])
+            format = definition["format"]
+            data = value.get(format)
+            tags = space.tags[definition["id"]]
+            if format == "select" and data is not None:
+                data = self._get(tags, "tag", data)
+            elif format == "multi_select" and data is not None:
+                data = [self._get(tags, "tag", tag_id) for tag_id in data]
+            values[definition["key"]] = {
+                "object": "property",
+                "id": definition["id"],
+                "key": definition["key"],
+                "name": definition["name"],
+                "format": format,
+                format: data,
+            }
+        obj["properties"] = list(values.values())
+
+    @staticmethod
+    def _summary(obj: dict) -> dict:
+        # list and search results do not include the markdown body
+        return {key: value for key, value in obj.items() if key != "markdown"}
+
+    # --- auth ---
+    def _create_challenge(self, params, body):
+        return 201, {"challenge_id": _new_id()}
+
+    def _create_api_key(self, params, body):
+        if body.get("code") != self.code:
+            raise _HTTPError(401, "unauthorized", "invalid code")
+        return 201, {"api_key": self.api_key}
+
+    # --- spaces and members ---
+    def _list_spaces(self, params, body):
+        return 200, _page([space.data for space in self._spaces.values()], params)
+
+    def _create_space(self, params, body):
+        space_id = self.add_space(body["name"], body.get("description", ""))
+        return 201, {"space": self._spaces[space_id].data}
+
+    def _get_space(self, params, body, space_id):
+        return 200, {"space": self._space(space_id).data}
+
+    def _update_space(self, params, body, space_id):
+        data = self._space(space_id).data
+        data.update({key: body[key] for key in ("name", "description") if key in body})
+        return 200, {"space": data}
+
+    def _list_members(self, params, body, space_id):
+        return 200, _page(self._space(space_id).members.values(), params)
+
+    def _get_member(self, params, body, space_id, member_id):
+        return 200, {"member": self._get(self._space(space_id).members, "member", member_id)}
+
+    # --- objects ---
+    def _list_objects(self, params, body, space_id):
+        objects = self._space(space_id).objects.values()
+        return 200, _page(objects, params, self._summary)
+
+    def _create_object(self, params, body, space_id):
+        space = self._space(space_id)
+        type = space.type_by_key(body.get("type_key") or "page")
+        obj = self._new_object(space, type, body)
+        template_id = body.get("template_id")
+        if template_id:
+            template = self._get(space.templates[type["id"]], "template", template_id)
+            if "body" not in body:
+                obj["markdown"] = template["markdown"]
+        self._add_object(space, obj)
+        return 201, {"object": obj}
+
+    def _get_object(self, params, body, space_id, object_id):
+        return 200, {"object": self._get(self._space(space_id).objects, "object", object_id)}
+
+    def _update_object(self, params, body, space_id, object_id):
+        space = self._space(space_id)
+        obj = self._get(space.objects, "object", object_id)
+        self._apply_object(space, obj, body)
+        # objects are kept by modification order, see _sorted
+        space.objects[object_id] = space.objects.pop(object_id)
+        return 200, {"object": obj}
+
+    def _delete_object(self, params, body, space_id, object_id):
+        space = self._space(space_id)
+        obj = self._get(space.objects, "object", object_id)
+        del space.objects[object_id]
+        space.lists.pop(object_id, None)
+        return 200, {"object": obj | {"archived": True}}
+
+    # --- search ---
+    @staticmethod
+    def _matches(obj: dict, query: str, types: list) -> bool:
+        if types and obj["type"]["key"] not in types:
+            return False
+        return query.lower() in obj["name"].lower()
+
+    def _sorted(self, objects: list, body: dict) -> list:
+        # the last modified objects come first, unless the sort is ascending
+        sort = body.get("sort") or {}
+        if sort.get("direction", "desc") == "desc":
+            objects.reverse()
+        return objects
+
+    def _search_all(self, params, body):
+        query, types = body.get("query") or "", body.get("types") or []
+        objects = [
+            obj
+            for space in self._spaces.values()
+            for obj in space.objects.values()
+            if self._matches(obj, query, types)
+        ]
+        return 200, _page(self._sorted(objects, body), params, self._summary)
+
+    def _search(self, params, body, space_id):
+        query, types = body.get("query") or "", body.get("types") or []
+        objects = self._space(space_id).objects.values()
+        objects = [obj for obj in objects if self._matches(obj, query, types)]
+        return 200, _page(self._sorted(objects, body), params, self._summary)
+
+    # --- types and templates ---
+    def _list_types(self, params, body, space_id):
+        return 200, _page(self._space(space_id).types.values(), params)
+
+    def _type_properties(self, space: _Space, definitions: list) -> list:
+        properties = []
+        for definition in definitions:
+            found = [
+                prop
+                for prop in space.properties.values()
+                if prop["key"] == definition.get("key") or prop["name"] == definition["name"]
+            ]
+            if found:
+                properties.append(found[0])
+            else:
+                name, format = definition["name"], definition["format"]
+                properties.append(self._new_property(space, name, format, definition.get("key")))
+        return properties
+
+    def _create_type(self, params, body, space_id):
+        space = self._space(space_id)
+        key = body.get("key") or _key(body["name"])
+        if any(type["key"] == key for type in space.types.values()):
+            key = f"{key}_{_new_id()[-6:]}"
+        properties = self._type_properties(space, body.get("properties") or [])
+        layout = body.get("layout", "basic")
+        plural_name = body.get("plural_name", "")
+        type = self._new_type(
+            space, key, body["name"], plural_name, layout, body.get("icon"), properties
+        )
+        return 201, {"type": type}
+
+    def _get_type(self, params, body, space_id, type_id):
+        return 200, {"type": self._get(self._space(space_id).types, "type", type_id)}
+
+    def _update_type(self, params, body, space_id, type_id):
+        space = self._space(space_id)
+        type = self._get(space.types, "type", type_id)
+        for field in ("key", "name", "plural_name", "icon", "layout"):
+            if field in body:
+                type[field] = body[field]
+        if "properties" in body:
+            properties = self._type_properties(space, body["properties"])
+            type["properties"] = [dict(prop) for prop in properties]
+        return 200, {"type": type}
+
+    def _delete_type(self, params, body, space_id, type_id):
+        space = self._space(space_id)
+        type = self._get(space.types, "type", type_id)
+        del space.types[type_id]
+        space.templates.pop(type_id, None)
+        return 200, {"type": type | {"archived": True}}
+
+    def _templates(self, space_id: str, type_id: str) -> dict:
+        return self._get(self._space(space_id).templates, "type", type_id)
+
+    def _list_templates(self, params, body, space_id, type_id):
+        templates = self._templates(space_id, type_id).values()
+        return 200, _page(templates, params, self._summary)
+
+    def _get_template(self, params, body, space_id, type_id, template_id):
+        templates = self._templates(space_id, type_id)
+        return 200, {"template": self._get(templates, "template", template_id)}
+
+    # --- properties and tags ---
+    def _list_properties(self, params, body, space_id):
+        return 200, _page(self._space(space_id).properties.values(), params)
+
+    def _create_property(self, params, body, space_id):
+        space = self._space(space_id)
+        prop = self._new_property(space, body["name"], body["format"], body.get("key"))
+        for tag in body.get("tags") or []:
+            self._new_tag(space, prop["id"], tag["name"], tag.get("color", "grey"))
+        return 201, {"property": prop}
+
+    def _get_property(self, params, body, space_id, property_id):
+        properties = self._space(space_id).properties
+        return 200, {"property": self._get(properties, "property", property_id)}
+
+    def _update_property(self, params, body, space_id, property_id):
+        prop = self._get(self._space(space_id).properties, "property", property_id)
+        prop.update({key: body[key] for key in ("name", "key") if key in body})
+        return 200, {"property": prop}
+
+    def _delete_property(self, params, body, space_id, property_id):
+        space = self._space(space_id)
+        prop = self._get(space.properties, "property", property_id)
+        del space.properties[property_id]
+        space.tags.pop(property_id, None)
+        return 200, {"property": prop}
+
+    def _tags(self, space_id: str, property_id: str) -> dict:
+        return self._get(self._space(space_id).tags, "property", property_id)
+
+    def _list_tags(self, params, body, space_id, property_id):
+        return 200, _page(self._tags(space_id, property_id).values(), params)
+
+    def _create_tag(self, params, body, space_id, property_id):
+        self._tags(space_id, property_id)
+        space, color = self._space(space_id), body.get("color", "grey")
+        return 201, {"tag": self._new_tag(space, property_id, body["name"], color)}
+
+    def _get_tag(self, params, body, space_id, property_id, tag_id):
+        return 200, {"tag": self._get(self._tags(space_id, property_id), "tag", tag_id)}
+
+    def _update_tag(self, params, body, space_id, property_id, tag_id):
+        tag = self._get(self._tags(space_id, property_id), "tag", tag_id)
+        tag.update({key: body[key] for key in ("name", "color", "key") if key in body})
+        return 200, {"tag": tag}
+
+    def _delete_tag(self, params, body, space_id, property_id, tag_id):
+        tags = self._tags(space_id, property_id)
+        tag = self._get(tags, "tag", tag_id)
+        del tags[tag_id]
+        return 200, {"tag": tag}
+
+    # --- lists ---
+    def _list_ids(self, space: _Space, list_id: str) -> list[str]:
+        # as in Anytype, a type is also a list, of the objects of the type
+        if list_id in space.types:
+            return [id for id, obj in space.objects.items() if obj["type"]["id"] == list_id]
+        return self._get(space.lists, "list", list_id)
+
+    def _collection_ids(self, space: _Space, list_id: str) -> list[str]:
+        if list_id in space.types:
+            raise _HTTPError(400, "bad_request", "objects of a type cannot be added or removed")
+        return self._list_ids(space, list_id)
+
+    def _list_views(self, params, body, space_id, list_id):
+        self._list_ids(self._space(space_id), list_id)
+        view = {"object": "view", "id": "all", "name": "All", "layout": "grid"}
+        return 200, _page([view | {"filters": [], "sorts": []}], params)
+
+    def _list_view_objects(self, params, body, space_id, list_id, view_id):
+        space = self._space(space_id)
+        ids = self._list_ids(space, list_id)
+        objects = [space.objects[object_id] for object_id in ids if object_id in space.objects]
+        return 200, _page(objects, params, self._summary)
+
+    def _add_to_list(self, params, body, space_id, list_id):
+        space = self._space(space_id)
+        ids = self._collection_ids(space, list_id)
+        for object_id in body["objects"]:
+            self._get(space.objects, "object", object_id)
+            if object_id not in ids:
+                ids.append(object_id)
+        return 200, f"{len(body['objects'])} objects added to the list"
+
+    def _remove_from_list(self, params, body, space_id, list_id, object_id):
+        ids = self._collection_ids(self._space(space_id), list_id)
+        if object_id not in ids:
+            raise _not_found("object", object_id)
+        ids.remove(object_id)
+        return 200, "object removed from the list"
+
+    def __repr__(self):
+        return f"<FakeAnytypeServer(url={self.url}, spaces={len(self._spaces)})>"
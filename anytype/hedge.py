@@ -0,0 +1,100 @@
+import threading
+from collections import deque
+
+
+class HedgePolicy:
+    """
+    Sends a second copy of a slow read and keeps the first response, to cut the tail
+    latency caused by occasional stalls of the server.
+
+    Reads are the GET requests and searches. A read that has not answered after the
+    `percentile` of the recent latencies of its endpoint is sent again, and the slower
+    copy is ignored. Hedging starts once `min_samples` latencies of the endpoint are
+    known. Every read adds `max_rate` to a budget of at most `burst` hedges and every
+    hedge spends one, so at most `max_rate` of the reads are duplicated over time. No
+    hedge is sent when the client limiter has no free slot.
+
+    Parameters:
+        percentile (float): Latency percentile after which a read is hedged (default: 0.95).
+        max_rate (float): Largest share of reads that are hedged (default: 0.05).
+        burst (float): Hedges that can be sent in a row (default: 5).
+        min_delay (float): Shortest wait before hedging, in seconds (default: 0.005).
+        window (int): Latencies remembered per endpoint (default: 200).
+        min_samples (int): Latencies needed before an endpoint is hedged (default: 20).
+
+    Attributes:
+        counters (dict): `reads` seen, `hedged` reads and hedges that answered first
+            (`won`).
+    """
+
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        max_rate: float = 0.05,
+        burst: float = 5,
+        min_delay: float = 0.005,
+        window: int = 200,
+        min_samples: int = 20,
+    ):
+        self.percentile = percentile
+        self.max_rate = max_rate
+        self.burst = burst
+        self.min_delay = min_delay
+        self.window = window
+        self.min_samples = min_samples
+        self.counters = {"reads": 0, "hedged": 0, "won": 0}
+        self._latencies: dict[str, deque] = {}
+        self._budget = float(burst)
+        self._lock = threading.Lock()
+
+    def delay(self, endpoint: str) -> float | None:
+        """
+        Counts a read of `endpoint`.
+
+        Returns:
+            Seconds to wait before hedging it, None if the endpoint has too few samples.
+        """
+        with self._lock:
+            self.counters["reads"] += 1
+            self._budget = min(self.burst, self._budget + self.max_rate)
+            latencies = self._latencies.get(endpoint)
+            if latencies is None or len(latencies) < self.min_samples:
+                return None
+            ordered = sorted(latencies)
+        index = min(len(ordered) - 1, int(len(ordered) * self.percentile))
+        return max(self.min_delay, ordered[index])
+
+    def has_budget(self) -> bool:
+        """
+        Returns:
+            True if a hedge could be sent now, without spending it.
+        """
+        return self._budget >= 1
+
+    def allow(self) -> bool:
+        """
+        Spends one hedge of the budget.
+
+        Returns:
+            False if the hedge rate is exhausted.
+        """
+        with self._lock:
+            if self._budget < 1:
+                return False
+            self._budget -= 1
+            self.counters["hedged"] += 1
+            return True
+
+    def record(self, endpoint: str, latency: float) -> None:
+        with self._lock:
+            latencies = self._latencies.get(endpoint)
+            if latencies is None:
+                latencies = self._latencies[endpoint] = deque(maxlen=self.window)
+            latencies.append(latency)
+
+    def count(self, name: str, value: int = 1) -> None:
+        with self._lock:
+            self.counters[name] += value
+
+    def __repr__(self):
+        return f"<HedgePolicy(percentile={self.percentile}, counters={self.counters})>"
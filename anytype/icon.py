@@ -1,4 +1,6 @@
 class Icon:
+    __slots__ = ("color", "_emoji", "_file", "_format", "_name", "icon")
+
     def __init__(self, icon: str = "📄"):
         self.color: str = "red"
         self._emoji: str = icon
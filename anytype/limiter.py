@@ -0,0 +1,180 @@
+import threading
+import time
+
+
+class AdaptiveLimiter:
+    """
+    Paces the requests of one client so that several importers sharing an Anytype
+    instance do not overload it.
+
+    Two limits apply to every request sent by `apiEndpoints`, including retries:
+
+    - an optional token bucket, `rate` requests per second with bursts of `burst`;
+    - an adaptive cap on the requests in flight (AIMD). The cap grows by one every
+      `limit` healthy responses and is multiplied by `backoff` when the server answers
+      429 or 503, a request times out, or the smoothed latency grows past
+      `latency_tolerance` times its recent best for the same endpoint. After a decrease,
+      responses to requests sent before it do not shrink the cap again.
+
+    One instance is shared by every thread using the same client. Callers that hit a
+    limit wait until a request finishes or a token is available.
+
+    Parameters:
+        rate (float, optional): Requests per second, unlimited by default.
+        burst (int, optional): Size of the token bucket (default: `rate`, at least 1).
+        initial_limit (int): Requests in flight allowed at start (default: 16).
+        min_limit (int): Lowest cap the limiter shrinks to (default: 1).
+        max_limit (int): Highest cap the limiter grows to (default: 128). Use the same
+            value for `min_limit`, `initial_limit` and `max_limit` for a fixed cap.
+        latency_tolerance (float): Latency inflation that counts as overload (default: 5).
+        backoff (float): Factor applied to the cap on overload (default: 0.5).
+
+    Attributes:
+        limit (float): Current cap on the requests in flight.
+        counters (dict): Requests that had to wait (`throttled`) and the number of
+            `increases` and `decreases` of the cap.
+    """
+
+    def __init__(
+        self,
+        rate: float | None = None,
+        burst: int | None = None,
+        initial_limit: int = 16,
+        min_limit: int = 1,
+        max_limit: int = 128,
+        latency_tolerance: float = 5.0,
+        backoff: float = 0.5,
+    ):
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, int(rate or 1))
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.limit = float(min(max(initial_limit, min_limit), max_limit))
+        self.latency_tolerance = latency_tolerance
+        self.backoff = backoff
+        self.in_flight = 0
+        self.counters = {"throttled": 0, "increases": 0, "decreases": 0}
+        self._tokens = float(self.burst)
+        self._refilled = time.monotonic()
+        self._issued = 0
+        self._decreased_at = 0
+        # per endpoint, list pages are much slower than single items
+        self._baseline: dict = {}
+        self._smoothed: dict = {}
+        self._cond = threading.Condition()
+
+    def _try_acquire(self) -> tuple[int | None, float | None]:
+        if self.in_flight >= int(self.limit):
+            return None, None
+        if self.rate is not None:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._refilled) * self.rate)
+            self._refilled = now
+            if self._tokens < 1:
+                return None, (1 - self._tokens) / self.rate
+            self._tokens -= 1
+        self.in_flight += 1
+        self._issued += 1
+        return self._issued, 0.0
+
+    def try_acquire(self, count: bool = True) -> tuple[int | None, float | None]:
+        """
+        Takes a slot without waiting.
+
+        Parameters:
+            count (bool): If False, a refusal is not counted as `throttled`, for callers
+                trying again after waiting.
+
+        Returns:
+            `(ticket, 0)` when the request can be sent, otherwise `(None, wait)` where
+            `wait` is the time until the next token, or None if every slot is taken.
+        """
+        with self._cond:
+            ticket, wait = self._try_acquire()
+            if ticket is None and count:
+                self.counters["throttled"] += 1
+            return ticket, wait
+
+    def acquire(self, timeout: float | None = None) -> int | None:
+        """
+        Waits until a request can be sent.
+
+        Parameters:
+            timeout (float, optional): Longest wait in seconds, unlimited by default.
+
+        Returns:
+            A ticket to pass to `release` once the response arrived, None if `timeout`
+            elapsed first.
+        """
+        with self._cond:
+            ticket, wait = self._try_acquire()
+            if ticket is not None:
+                return ticket
+            self.counters["throttled"] += 1
+            expires = None if timeout is None else time.monotonic() + timeout
+            while ticket is None:
+                if expires is not None:
+                    left = expires - time.monotonic()
+                    if left <= 0:
+                        return None
+                    wait = left if wait is None else min(wait, left)
+                self._cond.wait(wait)
+                ticket, wait = self._try_acquire()
+            return ticket
+
+    def release(
+        self,
+        ticket: int,
+        latency: float | None = None,
+        overloaded: bool = False,
+        endpoint: str = "",
+    ) -> None:
+        """
+        Frees the slot taken by `acquire` and adapts the cap.
+
+        Parameters:
+            ticket (int): Value returned by `acquire`.
+            latency (float, optional): Duration of the request, None if it failed.
+            overloaded (bool): True if the server signalled overload or timed out.
+            endpoint (str): Name of the endpoint, latencies are compared per endpoint.
+        """
+        with self._cond:
+            self.in_flight -= 1
+            if overloaded:
+                self._decrease(ticket)
+            elif latency is not None:
+                self._observe(ticket, latency, endpoint)
+            self._cond.notify_all()
+
+    def _observe(self, ticket: int, latency: float, endpoint: str) -> None:
+        smoothed, samples = self._smoothed.get(endpoint, (latency, 0))
+        smoothed += (latency - smoothed) * 0.2
+        samples += 1
+        self._smoothed[endpoint] = (smoothed, samples)
+        # the baseline follows the smoothed latency, so one lucky fast response does not
+        # make every later one look inflated
+        baseline = self._baseline.get(endpoint)
+        if samples >= 5:
+            if baseline is None or smoothed < baseline:
+                baseline = smoothed
+            else:
+                # drift up slowly so a server that became slower for good is not punished
+                baseline += (smoothed - baseline) * 0.02
+            self._baseline[endpoint] = baseline
+        if baseline is not None and samples >= 5 and smoothed > baseline * self.latency_tolerance:
+            self._decrease(ticket)
+        elif self.in_flight + 1 >= self.limit / 2 and self.limit < self.max_limit:
+            # only grow when the cap is actually in use
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+            self.counters["increases"] += 1
+
+    def _decrease(self, ticket: int) -> None:
+        if ticket <= self._decreased_at or self.limit <= self.min_limit:
+            return
+        self.limit = max(self.min_limit, self.limit * self.backoff)
+        self._decreased_at = self._issued
+        self._smoothed.clear()
+        self.counters["decreases"] += 1
+
+    def __repr__(self):
+        return f"<AdaptiveLimiter(limit={int(self.limit)}, in_flight={self.in_flight})>"
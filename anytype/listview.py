@@ -1,9 +1,13 @@
-from .api import apiEndpoints, APIWrapper
+from functools import partial
+from typing import Iterator
+from .api import apiEndpoints, APIWrapper, _iter_pages
 from .object import Object
 from .utils import requires_auth
 
 
 class ListView(APIWrapper):
+    __slots__ = ("list_id", "id", "name", "object", "layout", "filters", "sorts")
+
     def __init__(self):
         self._apiEndpoints: apiEndpoints | None = None
         self.space_id = ""
@@ -35,6 +39,25 @@ class ListView(APIWrapper):
             for data in response.get("data", [])
         ]
 
+    @requires_auth
+    def iter_objectsinlistview(self, limit=100) -> Iterator[Object]:
+        """
+        Iterate over every object displayed in the current list view.
+
+        Pages of `limit` objects are requested lazily, the next one in the background
+        while the current one is consumed.
+
+        Parameters:
+            limit (int, optional): The number of objects per request. Defaults to 100.
+
+        Returns:
+            Iterator[Object]: The Object instances of the list view.
+        """
+        api = self._apiEndpoints
+        fetch = partial(api.getObjectsInList, self.space_id, self.list_id, self.id)
+        for data in _iter_pages(fetch, limit, self._apiEndpoints.page_parallelism):
+            yield Object._from_api(api, data | {"space_id": self.space_id})
+
     def add_objectinlistview(self, obj: Object) -> None:
         """
         Add a one object to the current list view.
@@ -2,6 +2,18 @@ from .api import apiEndpoints, APIWrapper
 
 
 class Member(APIWrapper):
+    __slots__ = (
+        "type",
+        "id",
+        "icon",
+        "name",
+        "object",
+        "identity",
+        "global_name",
+        "status",
+        "role",
+    )
+
     def __init__(self):
         self._apiEndpoints: apiEndpoints | None = None
         self.type = ""
@@ -0,0 +1,207 @@
+import threading
+from contextlib import contextmanager
+
+# upper bounds of the latency histogram buckets, in seconds, the last bucket is unbounded
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_profiles: list["Metrics"] = []
+_profiles_lock = threading.Lock()
+
+
+class EndpointStats:
+    """
+    Counters of one endpoint template, e.g. `GET /spaces/{id}/properties/{id}`.
+
+    Attributes:
+        calls (int): HTTP requests sent, retries and hedges included.
+        errors (int): Requests that failed, with an error status or no response.
+        total_time (float): Sum of the latencies, in seconds.
+        max_time (float): Slowest request, in seconds.
+        bytes_sent (int): Size of the request bodies.
+        bytes_received (int): Size of the response bodies.
+        histogram (list[int]): Requests per bucket of `LATENCY_BUCKETS`, plus one for the
+            slower ones.
+    """
+
+    __slots__ = (
+        "calls",
+        "errors",
+        "total_time",
+        "max_time",
+        "bytes_sent",
+        "bytes_received",
+        "histogram",
+    )
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.histogram = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    def add(self, latency: float, sent: int, received: int, error: bool) -> None:
+        self.calls += 1
+        self.errors += error
+        self.total_time += latency
+        self.max_time = max(self.max_time, latency)
+        self.bytes_sent += sent
+        self.bytes_received += received
+        for index, bound in enumerate(LATENCY_BUCKETS):
+            if latency <= bound:
+                break
+        else:
+            index = len(LATENCY_BUCKETS)
+        self.histogram[index] += 1
+
+    @property
+    def mean_time(self) -> float:
+        return self.total_time / self.calls if self.calls else 0.0
+
+    def percentile(self, q: float) -> float:
+        """
+        Returns:
+            Upper bound of the histogram bucket holding the `q` quantile, `max_time` for
+            the last bucket.
+        """
+        target = q * self.calls
+        seen = 0
+        for index, count in enumerate(self.histogram):
+            seen += count
+            if seen >= target and count > 0:
+                if index < len(LATENCY_BUCKETS):
+                    return min(LATENCY_BUCKETS[index], self.max_time)
+                break
+        return self.max_time
+
+    def as_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__} | {
+            "histogram": list(self.histogram),
+            "mean_time": self.mean_time,
+            "p95_time": self.percentile(0.95),
+        }
+
+
+class Metrics:
+    """
+    HTTP requests made by a client, grouped by endpoint template.
+
+    Every client records into its own `metrics`, and into every `profile()` that is
+    open at the time.
+
+    Attributes:
+        endpoints (dict[str, EndpointStats]): Counters per `METHOD /template`.
+    """
+
+    def __init__(self):
+        self.endpoints: dict[str, EndpointStats] = {}
+        self._lock = threading.Lock()
+
+    def record(self, endpoint: str, latency: float, sent=0, received=0, error=False) -> None:
+        with self._lock:
+            stats = self.endpoints.get(endpoint)
+            if stats is None:
+                stats = self.endpoints[endpoint] = EndpointStats()
+            stats.add(latency, sent, received, error)
+
+    @property
+    def calls(self) -> int:
+        """
+        Total number of HTTP requests.
+        """
+        with self._lock:
+            return sum(stats.calls for stats in self.endpoints.values())
+
+    def calls_to(self, endpoint: str) -> int:
+        """
+        Parameters:
+            endpoint (str): `METHOD /template`, e.g. `GET /spaces/{id}/objects/{id}`.
+
+        Returns:
+            Number of HTTP requests sent to `endpoint`.
+        """
+        with self._lock:
+            stats = self.endpoints.get(endpoint)
+            return stats.calls if stats is not None else 0
+
+    def as_dict(self) -> dict[str, dict]:
+        with self._lock:
+            return {endpoint: stats.as_dict() for endpoint, stats in self.endpoints.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            self.endpoints.clear()
+
+    def report(self) -> str:
+        """
+        Returns:
+            A table of the endpoints, the most called first.
+        """
+        with self._lock:
+            rows = sorted(
+                self.endpoints.items(), key=lambda item: (-item[1].calls, -item[1].total_time)
+            )
+            width = max([len(endpoint) for endpoint, _ in rows] + [8])
+            lines = [
+                f"{'endpoint':<{width}} {'calls':>6} {'errors':>6} {'total ms':>9} "
+                f"{'mean ms':>8} {'p95 ms':>8} {'sent KB':>8} {'recv KB':>8}"
+            ]
+            for endpoint, stats in rows:
+                lines.append(
+                    f"{endpoint:<{width}} {stats.calls:>6} {stats.errors:>6} "
+                    f"{stats.total_time * 1000:>9.1f} {stats.mean_time * 1000:>8.1f} "
+                    f"{stats.percentile(0.95) * 1000:>8.1f} {stats.bytes_sent / 1024:>8.1f} "
+                    f"{stats.bytes_received / 1024:>8.1f}"
+                )
+            calls = sum(stats.calls for _, stats in rows)
+            total_time = sum(stats.total_time for _, stats in rows)
+            lines.append(f"{calls} requests, {total_time * 1000:.1f} ms")
+        return "\n".join(lines)
+
+    def __repr__(self):
+        return f"<Metrics(endpoints={len(self.endpoints)}, calls={self.calls})>"
+
+
+def record(metrics: Metrics | None, endpoint: str, latency: float, sent=0, received=0, error=False):
+    """
+    Records one request into `metrics` and into every open `profile()`.
+    """
+    if metrics is not None:
+        metrics.record(endpoint, latency, sent, received, error)
+    if _profiles:
+        with _profiles_lock:
+            profiles = list(_profiles)
+        for profile_metrics in profiles:
+            profile_metrics.record(endpoint, latency, sent, received, error)
+
+
+@contextmanager
+def profile(print_report: bool = False):
+    """
+    Collects the HTTP requests made by every client while the block runs, from every
+    thread.
+
+    Example:
+        with anytype.profile() as p:
+            space.update_object(obj)
+        print(p.report())
+        assert p.calls_to("PATCH /spaces/{id}/objects/{id}") == 1
+
+    Parameters:
+        print_report (bool): If True, `Metrics.report()` is printed when the block ends.
+
+    Returns:
+        Metrics: The requests made inside the block.
+    """
+    metrics = Metrics()
+    with _profiles_lock:
+        _profiles.append(metrics)
+    try:
+        yield metrics
+    finally:
+        with _profiles_lock:
+            _profiles.remove(metrics)
+        if print_report:
+            print(metrics.report())
@@ -0,0 +1,71 @@
+class Request:
+    """
+    One call to the Anytype API, as seen by the middleware.
+
+    Attributes:
+        method (str): HTTP method.
+        path (str): Path below the API url, e.g. `/spaces/{space_id}/objects`.
+        params (dict | None): Query parameters.
+        json (dict | None): JSON body.
+        context (dict): Free storage shared by the hooks of this request.
+    """
+
+    __slots__ = ("method", "path", "params", "json", "context")
+
+    def __init__(self, method: str, path: str, params=None, json=None):
+        self.method = method
+        self.path = path
+        self.params = params
+        self.json = json
+        self.context: dict = {}
+
+    def __repr__(self):
+        return f"<Request({self.method} {self.path})>"
+
+
+class Middleware:
+    """
+    Base class for the hooks run around every call of `apiEndpoints`.
+
+    Middleware are given as a list to `Anytype(middleware=...)` or
+    `apiEndpoints(headers, middleware=...)`. `before_request` hooks run in list order,
+    `after_response` and `on_error` hooks in reverse order, like nested wrappers. The
+    hooks see one call, retries and hedges included. Override only the hooks you need,
+    with the async client they can also be coroutines.
+
+    Example:
+        class Printer(Middleware):
+            def before_request(self, request):
+                print(request.method, request.path)
+
+        any = Anytype(middleware=[Printer()])
+    """
+
+    def before_request(self, request: Request) -> dict | None:
+        """
+        Called before the request is sent. `request` can be modified.
+
+        Returns:
+            None to send the request, or a response that is used without sending it.
+            The later middleware are then skipped.
+        """
+        return None
+
+    def after_response(self, request: Request, response: dict) -> dict:
+        """
+        Called with the decoded response, also when it came from `before_request` or
+        `on_error`.
+
+        Returns:
+            The response given to the caller, `response` or a replacement.
+        """
+        return response
+
+    def on_error(self, request: Request, error: Exception) -> dict | None:
+        """
+        Called when the request failed.
+
+        Returns:
+            None to raise `error`, or a response used instead.
+        """
+        return None
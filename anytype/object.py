@@ -1,12 +1,30 @@
 import re
+import threading
+from copy import copy
 
 from .type import Type
 from .template import Template
 from .icon import Icon
 from .property import Property
-from .api import apiEndpoints, APIWrapper
+from .api import apiEndpoints, APIWrapper, _slot_names
 from .utils import requires_auth, _ANYTYPE_SYSTEM_RELATIONS
 
+# fields hydrated on first access with lazy hydration: key in the API response, attribute
+# and factory of the value used when the response has none
+_LAZY_FIELDS = (
+    ("type", "type", lambda: None),
+    ("properties", "properties", dict),
+    ("icon", "_icon", Icon),
+    ("markdown", "_markdown", str),
+)
+_LAZY_KEYS = frozenset(key for key, _, _ in _LAZY_FIELDS)
+# attributes missing until the object is hydrated, the snapshot depends on all of them
+_LAZY_ATTRIBUTES = frozenset(
+    [attribute for _, attribute, _ in _LAZY_FIELDS] + ["icon", "markdown", "_snapshot"]
+)
+# set while hydrating, writing them must not hydrate the object again
+_HYDRATION_STATE = frozenset(["_pending", "_hydration_lock"])
+
 
 class Object(APIWrapper):
     """
@@ -28,14 +46,48 @@ class Object(APIWrapper):
 
     You can also provide a Template for this object.
 
+    Objects returned by the API are hydrated lazily by default: `id`, `name` and the other
+    plain fields are set right away, while `type`, `properties`, `icon` and the markdown
+    body are built from the response the first time one of them is used, or before the
+    first change to any field, so `Space.update_object` still sees what changed. Pass
+    `lazy_hydration=False` to the client to build everything up front.
+
+    Objects from the same client share one `Type` instance per type, and one `Tag` per
+    tag in their select and multi-select values, so these should be treated as read-only.
+    Each object only holds its own property values.
+
     Note that these property names are derived from the corresponding name in the Anytype GUI. They are all lowercase with spaces replaced by underscores. For instance, a property called `Release Year` in the Anytype GUI will be accessed as `release_year` in the object, and a property called `Publication Date` will be accessed as `publication_date`.
 
     """
 
+    __slots__ = (
+        "_pending",
+        "_hydration_lock",
+        "_icon",
+        "_markdown",
+        "_snapshot",
+        "type",
+        "type_key",
+        "id",
+        "source",
+        "name",
+        "archived",
+        "description",
+        "layout",
+        "properties",
+        "root_id",
+        "template_id",
+        "object",
+        "snippet",
+    )
+    # fields of the API response not hydrated yet, see _hydrate
+    _DEFAULTS = APIWrapper._DEFAULTS | {"_pending": None, "_hydration_lock": None}
+
     def __init__(self, name: str = "", type: Type | None = None, template: Template | None = None):
+        self._pending: dict | None = None
+        self._hydration_lock = None
         self._apiEndpoints: apiEndpoints | None = None
         self._icon: Icon = Icon()
-        self._values: dict = {}
         self.type: None | Type = None
         self.type_key: str = ""
         self.id: str = ""
@@ -52,17 +104,153 @@ class Object(APIWrapper):
                 raise Exception("Type has no id, create the type first and pass the created type")
             for _, prop in type.properties.items():
                 if prop.key not in _ANYTYPE_SYSTEM_RELATIONS:
-                    self.properties[prop.name] = prop
+                    # values are per object, do not share them with other objects of the type
+                    self.properties[prop.name] = copy(prop)
 
             self.type = type
 
         self.root_id: str = ""
         self.space_id: str = ""
         self.template_id: str = ""
+        # state of the object in the server, used by Space.update_object to send only changes
+        self._snapshot: dict | None = None
 
         if template is not None:
             self.template_id = template.id
 
+    @classmethod
+    def _from_api(cls, api: apiEndpoints, data: dict) -> "Object":
+        # the response is not kept, its fields are the slots of the object and its type,
+        # property definitions and tags are the instances shared through the client
+        if not api.lazy_hydration:
+            obj = super()._from_api(api, data)
+            obj._json = None
+            obj._snapshot = obj._state()
+            return obj
+
+        obj = super()._from_api(
+            api, {key: value for key, value in data.items() if key not in _LAZY_KEYS}
+        )
+        obj._json = None
+        for _, attribute, _ in _LAZY_FIELDS:
+            delattr(obj, attribute)
+        del obj._snapshot
+        # the description is a plain attribute, read it without building the properties
+        for entry in data.get("properties") or []:
+            if entry.get("key") == "description" and entry.get("text") is not None:
+                obj.description = entry["text"]
+        obj._pending = {key: data[key] for key in _LAZY_KEYS if key in data}
+        # from here on, the first write to any field hydrates the object, so the snapshot
+        # is the state of the server and not the edited one
+        obj._hydration_lock = threading.RLock()
+        return obj
+
+    def _hydrate(self) -> None:
+        """
+        Builds the fields left pending by `_from_api`, once, in any thread. Other threads
+        that use the object meanwhile wait for it.
+        """
+        lock = self._hydration_lock
+        if lock is None:
+            return
+        with lock:
+            pending = self._pending
+            if pending is None:
+                return
+            self._pending = None
+            for key, attribute, default in _LAZY_FIELDS:
+                if pending.get(key) is None:
+                    setattr(self, attribute, default())
+            self._add_attrs_from_dict(pending)
+            self._snapshot = self._state()
+            self._hydration_lock = None
+
+    def __getattr__(self, name: str):
+        # only called for missing attributes, the lazy ones until the object is hydrated
+        if name in _LAZY_ATTRIBUTES:
+            self._hydrate()
+            return object.__getattribute__(self, name)
+        return super().__getattr__(name)
+
+    def __setattr__(self, name: str, value) -> None:
+        if self._hydration_lock is not None and name not in _HYDRATION_STATE:
+            self._hydrate()
+        super().__setattr__(name, value)
+
+    def __deepcopy__(self, memo):
+        # the copy does not share the pending response nor the lock that guards it
+        self._hydrate()
+        return super().__deepcopy__(memo)
+
+    def __getstate__(self) -> dict:
+        # locks cannot be pickled, __setstate__ makes a new one for the pending response
+        state = {}
+        for name in _slot_names(type(self)):
+            if name == "_hydration_lock":
+                continue
+            try:
+                state[name] = object.__getattribute__(self, name)
+            except AttributeError:
+                continue
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+        if state.get("_pending") is not None:
+            object.__setattr__(self, "_hydration_lock", threading.RLock())
+
+    def _state(self) -> dict:
+        """
+        Lightweight copy of the fields that can be changed by `Space.update_object`.
+        """
+        try:
+            icon = self._icon._get_json()
+        except ValueError:
+            icon = None
+
+        properties = {}
+        for name, prop in self.properties.items():
+            try:
+                value = prop.value
+            except ValueError:
+                continue
+            properties[name] = list(value) if isinstance(value, list) else value
+
+        return {
+            "name": self.name,
+            "icon": icon,
+            "body": self._markdown,
+            "description": self.description,
+            "properties": properties,
+        }
+
+    def _changes(self) -> tuple[dict, list[Property]]:
+        """
+        Compares the object with the snapshot taken when it was retrieved from the API.
+
+        Returns:
+            The changed top level fields (name, icon, body, description) and the
+            properties whose value changed.
+        """
+        state = self._state()
+        snapshot = self._snapshot
+        if snapshot is None:
+            return state, list(self.properties.values())
+
+        fields = {}
+        for key in ("name", "icon", "body", "description"):
+            if state[key] != snapshot[key]:
+                fields[key] = state[key]
+
+        old_values = snapshot["properties"]
+        properties = [
+            self.properties[name]
+            for name, value in state["properties"].items()
+            if name not in old_values or old_values[name] != value
+        ]
+        return fields, properties
+
     @property
     def icon(self):
         return self._icon
@@ -112,11 +300,15 @@ class Object(APIWrapper):
 
     @markdown.getter
     def markdown(self):
-        if self._markdown == "" and self.id and self._apiEndpoints is not None:
-            data = self._apiEndpoints.getObject(self.space_id, self.id)
+        api = self._apiEndpoints
+        # the async client cannot block here, AsyncSpace.get_object returns the markdown
+        if self._markdown == "" and self.id and api is not None and not api._is_async:
+            data = api.getObject(self.space_id, self.id)
             self._markdown = data["object"]["markdown"]
             if isinstance(self._markdown, (list, tuple)):
                 self._markdown = "".join(self._markdown)
+            if self._snapshot is not None:
+                self._snapshot["body"] = self._markdown
         return self._markdown
 
     def add_type(self, type: Type):
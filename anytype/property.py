@@ -1,8 +1,8 @@
-from .api import APIWrapper
+from typing import Iterator
+from .api import APIWrapper, _iter_pages
 from .tag import Tag
-from .utils import requires_auth, _ANYTYPE_PROPERTIES_COLORS
+from .utils import requires_auth
 import warnings
-import random
 import datetime
 
 
@@ -20,40 +20,116 @@ class Property(APIWrapper):
 
     Methods:
         value (property): Getter and setter for the property's value, dispatches by property type.
+            Values read from the API are typed: select and multi-select values are `Tag`
+            instances and dates are `datetime.datetime`.
     """
 
-    __slots__ = (
-        "name",
-        "id",
-        "key",
-        "_apiEndpoints",
-        "_json",
-        "object",
-        "format",
-        "space_id",
-    )
+    __slots__ = ("name", "id", "key", "object", "format")
 
     def __init__(self, name: str = ""):
 
         self.id: str = ""
         self.name: str = name
 
-    @requires_auth
-    def _get_json(self) -> dict:
+    def _get_json(self, tag_ids: dict[str, str] | None = None) -> dict:
         """
-        Retrieves all properties associated with the property.
+        Serializes the property value for the create and update object requests.
+
+        The payload is built from the locally known schema (key and format), only the
+        tags of select properties may need the API.
+
+        Parameters:
+            tag_ids (dict, optional): Tag ids by name, already resolved for this property.
 
         Returns:
-            A list of Property instances representing the properties associated with the property.
+            A dict with the property key and its value.
 
         Raises:
-            Raises an error if the request to the API fails.
+            ValueError: If the property has no key or its value cannot be serialized.
         """
-        if self._apiEndpoints is None:
-            raise Exception("Internal error, please report")
+        json_dict = {"key": self._schema_key()}
+        if tag_ids is None:
+            tag_ids = self._resolve_tags(self._tag_names())
+        json_dict.update(self._value_json(tag_ids))
+        return json_dict
+
+    def _schema_key(self) -> str:
+        key = getattr(self, "key", "")
+        if key == "" and self.id != "" and self._apiEndpoints is not None:
+            definition = self._apiEndpoints._property_cache.get(self.space_id, self.id)
+            key = definition["key"] if definition is not None else ""
+        if key == "":
+            raise ValueError(f"Property '{self.name}' has no key, retrieve it from the API first")
+        return key
+
+    def _tag_names(self) -> list[str]:
+        """
+        Names of the tags used by the value that must be resolved to tag ids.
+        """
+        if isinstance(self, Select):
+            return [] if isinstance(self.select, Tag) or self.select == "" else [self.select]
+        elif isinstance(self, MultiSelect):
+            return [tag for tag in self.multi_select if not isinstance(tag, Tag)]
+        return []
+
+    def _resolve_tags(self, names: list[str]) -> dict[str, str]:
+        """
+        Maps tag names to tag ids, creating the tags that do not exist yet.
+        """
+        if len(names) == 0:
+            return {}
+        key = (self.space_id, self.id)
+        return self._apiEndpoints._resolve_tags({key: names})[key]
+
+    def _tag(self, data: dict) -> Tag:
+        api = self._apiEndpoints
+        tag_class = api._models.get("tag", Tag)
+        return api._canonical(
+            "tag",
+            self.space_id,
+            data.get("id"),
+            lambda: tag_class._from_api(
+                api, data | {"space_id": self.space_id, "property_id": self.id}
+            ),
+        )
+
+    def _iter_tags(self, limit: int) -> Iterator[Tag]:
+        registry = self._apiEndpoints._tag_registry(self.space_id, self.id)
+        if registry.loaded:
+            for data in registry.tags():
+                yield self._tag(data)
+            return
+
+        def fetch(offset: int, limit: int) -> dict:
+            response = self._apiEndpoints.getTags(self.space_id, self.id, offset, limit)
+            registry.update(response.get("data", []))
+            return response
+
+        for data in _iter_pages(fetch, limit, self._apiEndpoints.page_parallelism):
+            yield self._tag(data)
+        registry.loaded = True
+
+    def _tag_id(self, name: str, tag_ids: dict[str, str]) -> str:
+        tag_id = tag_ids.get(name)
+        if tag_id is None:
+            raise ValueError(f"Tag '{name}' of property '{self.name}' could not be created")
+        return tag_id
+
+    def _has_value(self) -> bool:
+        """
+        False for a select or a date that was never set, these are not sent.
+        """
+        if isinstance(self, Select):
+            return self.select != ""
+        if isinstance(self, Date):
+            return self.date != ""
+        return True
 
-        response = self._apiEndpoints.getProperty(self.space_id, self.id)
-        json_dict = response.get("property", {})
+    def _value_json(self, tag_ids: dict[str, str]) -> dict:
+        """
+        Serializes the value of the property, tag names are replaced using `tag_ids`.
+        """
+        json_dict = {}
         if isinstance(self, Checkbox):
             json_dict["checkbox"] = self.value
         elif isinstance(self, Text):
@@ -61,45 +137,17 @@ class Property(APIWrapper):
         elif isinstance(self, Number):
             json_dict["number"] = self.value
         elif isinstance(self, Select):
-            all_tags = None  # self.get_tags()
             if isinstance(self.select, Tag):
                 json_dict["select"] = self.select.id
+            elif self.select == "":
+                raise ValueError("Select property has no value")
             else:
-                if all_tags is None:
-                    all_tags = self.get_tags()
-                notfound = True
-                for found_tag in all_tags:
-                    if found_tag.name == self.select:
-                        json_dict["select"] = found_tag.id
-                        notfound = False
-                        break
-                if notfound:
-                    random_color = random.choice(_ANYTYPE_PROPERTIES_COLORS)
-                    tag_obj = self.create_tag(self.select, random_color)
-                    warnings.warn(f"Tag '{tag_obj.name}' not exist, creating it")
-                    json_dict["select"] = tag_obj.id
+                json_dict["select"] = self._tag_id(self.select, tag_ids)
         elif isinstance(self, MultiSelect):
-            tag_ids = []
-            all_tags = None  # self.get_tags()
-            for tag in self.multi_select:
-                if isinstance(tag, Tag):
-                    tag_ids.append(tag.id)
-                else:
-                    if all_tags is None:
-                        all_tags = self.get_tags()
-                    notfound = True
-                    for found_tag in all_tags:
-                        if found_tag.name == tag:
-                            tag_ids.append(found_tag.id)
-                            notfound = False
-                            break
-                    if notfound:
-                        random_color = random.choice(_ANYTYPE_PROPERTIES_COLORS)
-                        tag_obj = self.create_tag(tag, random_color)
-                        tag_ids.append(tag_obj.id)
-                        warnings.warn(f"Tag '{tag_obj.name}' not exist, creating it")
-
-            json_dict["multi_select"] = tag_ids
+            json_dict["multi_select"] = [
+                tag.id if isinstance(tag, Tag) else self._tag_id(tag, tag_ids)
+                for tag in self.multi_select
+            ]
         elif isinstance(self, Date):
             if self.value is None:
                 json_dict["date"] = None
@@ -109,7 +157,7 @@ class Property(APIWrapper):
                 dt = datetime.datetime.strptime(self.date, "%d/%m/%Y")
                 json_dict["date"] = dt.strftime("%Y-%m-%dT%H:%M:%SZ")
             elif isinstance(self.value, datetime.datetime):
-                if datetime.datetime is None or self.date is not datetime.datetime:
+                if datetime.datetime is None or not isinstance(self.date, datetime.datetime):
                     raise Exception("Invalid datetime initialization")
                 json_dict["date"] = self.date.strftime("%Y-%m-%dT%H:%M:%SZ")
         elif isinstance(self, Files):
@@ -124,7 +172,8 @@ class Property(APIWrapper):
             if isinstance(self.value, list):
                 ids = []
                 for v in self.value:
-                    ids.append(v.id)
+                    # ids when the value was read from the API
+                    ids.append(v if isinstance(v, str) else v.id)
                 json_dict["objects"] = ids
             else:
                 json_dict["objects"] = [self.value.id]
@@ -132,6 +181,27 @@ class Property(APIWrapper):
             raise ValueError("Format not supported")
         return json_dict
 
+    def _value_from_json(self, data: dict) -> None:
+        """
+        Sets the value from an entry of the `properties` array of an object, as returned
+        by the API. Tags become `Tag` instances and dates `datetime.datetime`, a missing
+        value keeps the default.
+        """
+        value = data.get(self.format)
+        if value is None:
+            return
+        if isinstance(self, Select):
+            self.select = self._tag(value)
+        elif isinstance(self, MultiSelect):
+            self.multi_select = [self._tag(tag) for tag in value]
+        elif isinstance(self, Date):
+            try:
+                self.date = datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+            except ValueError:
+                self.date = value
+        else:
+            setattr(self, self.format, value)
+
     @property
     def value(self):
         if isinstance(self, Checkbox):
@@ -228,6 +298,8 @@ class Text(Property):
     Represents a text property.
     """
 
+    __slots__ = ("text",)
+
     def __init__(self, name: str = ""):
         super().__init__(name)
         self.format = "text"
@@ -242,6 +314,8 @@ class Number(Property):
     Represents a numeric property (integer or float).
     """
 
+    __slots__ = ("number",)
+
     def __init__(self, name: str = ""):
         super().__init__(name)
         self.format = "number"
@@ -261,6 +335,8 @@ class Select(Property):
         get_tag(tag_id): Fetches a specific tag by ID.
     """
 
+    __slots__ = ("select",)
+
     def __init__(self, name: str = ""):
         super().__init__(name)
         self.format = "select"
@@ -280,26 +356,26 @@ class Select(Property):
         Raises:
             Raises an error if the request to the API fails.
         """
-        data = {"name": name, "color": color}
-        if not create_if_exists:
-            for tag in self.get_tags():
-                if tag.name == name:
-                    warnings.warn(f"Tag '{name}' already exists, returning existing tag")
-                    return tag
-
         if self._apiEndpoints is None:
             raise Exception("Internal error, please report")
 
+        data = {"name": name, "color": color}
+        registry = self._apiEndpoints._load_tags(self.space_id, self.id)
+        if not create_if_exists:
+            existing = registry.get(name)
+            if existing is not None:
+                warnings.warn(f"Tag '{name}' already exists, returning existing tag")
+                return self._tag(existing)
+
         response = self._apiEndpoints.createTag(self.space_id, self.id, data)
-        tag = Tag._from_api(
-            self._apiEndpoints, response.get("tag", []) | {"space_id": self.space_id}
-        )
-        return tag
+        registry.update([response.get("tag", {})])
+        return self._tag(response.get("tag", {}))
 
     @requires_auth
     def get_tags(self) -> list[Tag]:
         """
-        Retrieves all tags associated with the property.
+        Retrieves all tags associated with the property. Tags are loaded once per client,
+        paging through all of them, and kept up to date with the tags created from it.
 
         Returns:
             A list of Tag instances representing the tags associated with the property.
@@ -310,14 +386,25 @@ class Select(Property):
         if self._apiEndpoints is None:
             raise Exception("Internal error, please report")
 
-        response = self._apiEndpoints.getTags(self.space_id, self.id)
-        types = [
-            Tag._from_api(
-                self._apiEndpoints, data | {"space_id": self.space_id, "property_id": self.id}
-            )
-            for data in response.get("data", [])
-        ]
-        return types
+        registry = self._apiEndpoints._load_tags(self.space_id, self.id)
+        return [self._tag(data) for data in registry.tags()]
+
+    @requires_auth
+    def iter_tags(self, limit: int = 100) -> Iterator[Tag]:
+        """
+        Iterates over every tag of the property, requesting `limit` tags at a time. Tags
+        already loaded by this client are returned without new requests.
+
+        Parameters:
+            limit (int, optional): The number of tags per request (default: 100).
+
+        Returns:
+            An iterator of Tag instances.
+
+        Raises:
+            Raises an error if a request to the API fails.
+        """
+        return self._iter_tags(limit)
 
     @requires_auth
     def get_tag(self, tag_id: str) -> Tag:
@@ -337,10 +424,7 @@ class Select(Property):
             raise Exception("Internal error, please report")
 
         response = self._apiEndpoints.getTag(self.space_id, self.id, tag_id)
-        tag = Tag._from_api(
-            self._apiEndpoints, response.get("tag", []) | {"space_id": self.space_id}
-        )
-        return tag
+        return self._tag(response.get("tag", {}))
 
     def __repr__(self):
         return f"<Select({self.name})>"
@@ -356,6 +440,8 @@ class MultiSelect(Property):
         get_tag(tag_id): Fetches a specific tag by ID.
     """
 
+    __slots__ = ("multi_select",)
+
     def __init__(self, name: str = ""):
         super().__init__(name)
         self.format = "multi_select"
@@ -375,26 +461,26 @@ class MultiSelect(Property):
         Raises:
             Raises an error if the request to the API fails.
         """
-        data = {"name": name, "color": color}
-        if not create_if_exists:
-            for tag in self.get_tags():
-                if tag.name == name:
-                    warnings.warn(f"Tag '{name}' already exists, returning existing tag")
-                    return tag
-
         if self._apiEndpoints is None:
             raise Exception("Internal error, please report")
 
+        data = {"name": name, "color": color}
+        registry = self._apiEndpoints._load_tags(self.space_id, self.id)
+        if not create_if_exists:
+            existing = registry.get(name)
+            if existing is not None:
+                warnings.warn(f"Tag '{name}' already exists, returning existing tag")
+                return self._tag(existing)
+
         response = self._apiEndpoints.createTag(self.space_id, self.id, data)
-        tag = Tag._from_api(
-            self._apiEndpoints, response.get("tag", []) | {"space_id": self.space_id}
-        )
-        return tag
+        registry.update([response.get("tag", {})])
+        return self._tag(response.get("tag", {}))
 
     @requires_auth
     def get_tags(self) -> list[Tag]:
         """
-        Retrieves all tags associated with the property.
+        Retrieves all tags associated with the property. Tags are loaded once per client,
+        paging through all of them, and kept up to date with the tags created from it.
 
         Returns:
             A list of Tag instances representing the tags associated with the property.
@@ -405,14 +491,25 @@ class MultiSelect(Property):
         if self._apiEndpoints is None:
             raise Exception("Internal error, please report")
 
-        response = self._apiEndpoints.getTags(self.space_id, self.id)
-        types = [
-            Tag._from_api(
-                self._apiEndpoints, data | {"space_id": self.space_id, "property_id": self.id}
-            )
-            for data in response.get("data", [])
-        ]
-        return types
+        registry = self._apiEndpoints._load_tags(self.space_id, self.id)
+        return [self._tag(data) for data in registry.tags()]
+
+    @requires_auth
+    def iter_tags(self, limit: int = 100) -> Iterator[Tag]:
+        """
+        Iterates over every tag of the property, requesting `limit` tags at a time. Tags
+        already loaded by this client are returned without new requests.
+
+        Parameters:
+            limit (int, optional): The number of tags per request (default: 100).
+
+        Returns:
+            An iterator of Tag instances.
+
+        Raises:
+            Raises an error if a request to the API fails.
+        """
+        return self._iter_tags(limit)
 
     @requires_auth
     def get_tag(self, tag_id: str) -> Tag:
@@ -432,10 +529,7 @@ class MultiSelect(Property):
             raise Exception("Internal error, please report")
 
         response = self._apiEndpoints.getTag(self.space_id, self.id, tag_id)
-        tag = Tag._from_api(
-            self._apiEndpoints, response.get("tag", []) | {"space_id": self.space_id}
-        )
-        return tag
+        return self._tag(response.get("tag", {}))
 
     def __repr__(self):
         return f"<MultiSelect({self.name})>"
@@ -446,6 +540,8 @@ class Date(Property):
     Represents a date property (str DD/MM/YYYY or `datetime.datetime`).
     """
 
+    __slots__ = ("date",)
+
     def __init__(self, name: str = ""):
         super().__init__(name)
         self.format = "date"
@@ -460,6 +556,8 @@ class Files(Property):
     Represents a files property (not implemented yet).
     """
 
+    __slots__ = ("files",)
+
     def __init__(self, name: str = ""):
         super().__init__(name)
         self.format = "files"
@@ -474,6 +572,8 @@ class Checkbox(Property):
     Represents a checkbox (boolean) property.
     """
 
+    __slots__ = ("checkbox",)
+
     def __init__(self, name: str = ""):
         super().__init__(name)
         self.format = "checkbox"
@@ -488,6 +588,8 @@ class Url(Property):
     Represents a URL property.
     """
 
+    __slots__ = ("url",)
+
     def __init__(self, name: str = ""):
         super().__init__(name)
         self.format = "url"
@@ -502,6 +604,8 @@ class Email(Property):
     Represents an email address property.
     """
 
+    __slots__ = ("email",)
+
     def __init__(self, name: str = ""):
         super().__init__(name)
         self.format = "email"
@@ -516,6 +620,8 @@ class Phone(Property):
     Represents a phone number property.
     """
 
+    __slots__ = ("phone",)
+
     def __init__(self, name: str = ""):
         super().__init__(name)
         self.format = "phone"
@@ -530,6 +636,8 @@ class Objects(Property):
     Not implemented yet
     """
 
+    __slots__ = ("objects",)
+
     def __init__(self, name: str = ""):
         self.format = "objects"
         super().__init__(name)
@@ -0,0 +1,168 @@
+"""
+pytest plugin that fails a test when it calls the Anytype API more than allowed.
+
+The plugin is registered through the `pytest11` entry point when the package is
+installed, or with `pytest -p anytype.pytest_plugin` or
+`pytest_plugins = ["anytype.pytest_plugin"]` in a `conftest.py`.
+
+Example:
+    from anytype.pytest_plugin import anytype_budget
+
+    @anytype_budget(create_object=1, get_property=0)
+    def test_import_article():
+        space.create_object(article)
+
+    def test_search(anytype_calls):
+        space.search("doi")
+        assert anytype_calls["search"] == 1
+
+    def test_offline(anytype_server):
+        space = anytype_server.client().get_space(anytype_server.space_id)
+"""
+
+import re
+import functools
+import threading
+from collections import Counter
+
+import pytest
+
+from .api import apiEndpoints
+from .fakeserver import FakeAnytypeServer
+
+anytype_budget = pytest.mark.anytype_budget
+
+
+def _snake_case(name: str) -> str:
+    return re.sub(r"(?<!^)(?=[A-Z])", "_", name).lower()
+
+
+def _endpoint_methods() -> dict[str, str]:
+    """
+    Returns:
+        The public endpoint methods of `apiEndpoints`, by snake_case name.
+    """
+    return {
+        _snake_case(name): name
+        for name, value in vars(apiEndpoints).items()
+        if callable(value) and not name.startswith("_") and name != "close"
+    }
+
+
+class CallCounter:
+    """
+    Counts the calls of the endpoint methods of every `apiEndpoints` (sync or async)
+    while it is active, from every thread.
+
+    Counts are read by method name, in snake_case (`create_object`) or as defined
+    (`createObject`), and `total` is the sum of every call.
+    """
+
+    def __init__(self):
+        self.counts: Counter = Counter()
+        self._methods = _endpoint_methods()
+        self._originals: dict = {}
+        self._lock = threading.Lock()
+
+    def _name(self, key: str) -> str:
+        name = self._methods.get(key, key)
+        if name not in self._methods.values():
+            raise KeyError(f"apiEndpoints has no endpoint method {key!r}")
+        return name
+
+    def __getitem__(self, key: str) -> int:
+        if key == "total":
+            return self.total
+        return self.counts[self._name(key)]
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+    def _wrap(self, name: str, method):
+        @functools.wraps(method)
+        def counted(*args, **kwargs):
+            with self._lock:
+                self.counts[name] += 1
+            return method(*args, **kwargs)
+
+        return counted
+
+    def __enter__(self):
+        for name in self._methods.values():
+            method = vars(apiEndpoints)[name]
+            self._originals[name] = method
+            setattr(apiEndpoints, name, self._wrap(name, method))
+        return self
+
+    def __exit__(self, *exc):
+        for name, method in self._originals.items():
+            setattr(apiEndpoints, name, method)
+        self._originals.clear()
+
+    def over_budget(self, budget: dict) -> list[str]:
+        """
+        Parameters:
+            budget (dict): Maximum number of calls per method name, or `total`.
+
+        Returns:
+            One message per method called more often than its budget.
+        """
+        messages = []
+        for key, limit in budget.items():
+            count = self[key]
+            if count > limit:
+                messages.append(f"{key}: {count} calls, budget is {limit}")
+        return messages
+
+    def check(self, **budget) -> None:
+        """
+        Raises:
+            AssertionError: If a method was called more often than its budget.
+        """
+        messages = self.over_budget(budget)
+        if messages:
+            calls = ", ".join(f"{name}={count}" for name, count in sorted(self.counts.items()))
+            raise AssertionError(
+                "Anytype request budget exceeded: " + "; ".join(messages) + f" ({calls})"
+            )
+
+    def __repr__(self):
+        return f"<CallCounter(total={self.total})>"
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "anytype_budget(**budget): fail if the test calls an apiEndpoints method more "
+        "often than its budget, e.g. anytype_budget(create_object=1, total=5)",
+    )
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item):
+    marker = item.get_closest_marker("anytype_budget")
+    if marker is None:
+        return (yield)
+    with CallCounter() as counter:
+        result = yield
+    counter.check(**marker.kwargs)
+    return result
+
+
+@pytest.fixture
+def anytype_calls():
+    """
+    Counts the apiEndpoints calls made by the test, see `CallCounter`.
+    """
+    with CallCounter() as counter:
+        yield counter
+
+
+@pytest.fixture
+def anytype_server():
+    """
+    A running `FakeAnytypeServer`, stopped after the test.
+    """
+    with FakeAnytypeServer() as server:
+        yield server
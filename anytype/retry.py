@@ -0,0 +1,110 @@
+import random
+import threading
+
+# endpoints that are sent with POST but only read, like `/search` and `/spaces/{id}/search`
+READ_ONLY_ENDPOINTS = frozenset({"search"})
+
+
+def read_only(method: str, path: str = "") -> bool:
+    """
+    Returns:
+        True if the request does not change anything on the server: a GET or a search.
+    """
+    if method in ("GET", "HEAD", "OPTIONS"):
+        return True
+    endpoint = path.split("?", 1)[0].rstrip("/").rsplit("/", 1)[-1]
+    return method == "POST" and endpoint in READ_ONLY_ENDPOINTS
+
+
+class RetryPolicy:
+    """
+    Decides which failed requests `apiEndpoints` sends again, and how long it waits
+    before each attempt.
+
+    A request is retried when the server answers with one of `RETRY_STATUSES` or the
+    connection fails. POST requests that only read, like the searches, are idempotent.
+    The other POST requests (they create an object, a tag, a space...) are only retried
+    when the server could not have processed them: a 429 response or a connection that
+    could not be opened. The wait between attempts grows with decorrelated jitter, and a
+    `Retry-After` header sent by the server is honoured.
+
+    Parameters:
+        max_attempts (int): Attempts per request, including the first one. 1 disables
+            retries (default: 4).
+        base_delay (float): Minimum wait between attempts, in seconds (default: 0.2).
+        max_delay (float): Maximum computed wait between attempts, in seconds (default: 10).
+        max_retry_after (float): Longest `Retry-After` that is honoured, a longer one makes
+            the request fail at once (default: 60).
+        retry_non_idempotent (bool): If True, POST requests are retried like the other
+            methods, which can create duplicates (default: False).
+
+    Attributes:
+        counters (dict): `requests` sent, `retries` made, requests `recovered` by a retry
+            and requests that still failed after retrying (`exhausted`).
+    """
+
+    IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "PATCH", "DELETE"})
+    RETRY_STATUSES = frozenset({408, 429, 500, 502, 503, 504})
+
+    def __init__(
+        self,
+        max_attempts: int = 4,
+        base_delay: float = 0.2,
+        max_delay: float = 10.0,
+        max_retry_after: float = 60.0,
+        retry_non_idempotent: bool = False,
+    ):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_retry_after = max_retry_after
+        self.retry_non_idempotent = retry_non_idempotent
+        self.counters = {"requests": 0, "retries": 0, "recovered": 0, "exhausted": 0}
+        self._lock = threading.Lock()
+
+    def retryable(
+        self, method: str, status_code: int | None, sent: bool = True, path: str = ""
+    ) -> bool:
+        """
+        Parameters:
+            method (str): HTTP method of the failed request.
+            status_code (int | None): Status of the error response, None if the
+                connection failed.
+            sent (bool): False if the request surely never reached the server.
+            path (str): API path of the request, to recognize the POST that only read.
+        """
+        if status_code is not None and status_code not in self.RETRY_STATUSES:
+            return False
+        if self.idempotent(method, path) or self.retry_non_idempotent:
+            return True
+        return status_code == 429 or not sent
+
+    def idempotent(self, method: str, path: str = "") -> bool:
+        """
+        Returns:
+            True if sending the request twice has the same effect as sending it once.
+        """
+        return method in self.IDEMPOTENT_METHODS or read_only(method, path)
+
+    def delay(self, attempt: int, previous: float, retry_after: float | None = None):
+        """
+        Returns:
+            Seconds to wait before attempt `attempt + 1`, or None to give up.
+        """
+        if attempt >= self.max_attempts:
+            return None
+        if retry_after is not None and retry_after > self.max_retry_after:
+            return None
+        # decorrelated jitter: random between the base and three times the last wait
+        upper = max(previous, self.base_delay) * 3
+        delay = min(self.max_delay, random.uniform(self.base_delay, upper))
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+    def count(self, name: str, value: int = 1) -> None:
+        with self._lock:
+            self.counters[name] += value
+
+    def __repr__(self):
+        return f"<RetryPolicy(max_attempts={self.max_attempts}, counters={self.counters})>"
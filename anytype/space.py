@@ -1,13 +1,18 @@
-from copy import deepcopy
+from concurrent.futures import ThreadPoolExecutor, wait
+from itertools import islice
+from functools import partial
+from typing import Iterable, Iterator
 
 from .listview import ListView
 from .type import Type
 from .object import Object
 from .member import Member
 from .icon import Icon
-from .api import apiEndpoints, APIWrapper
+from .api import apiEndpoints, APIWrapper, _iter_pages
 from .utils import requires_auth
 from .property import Property
+from .bulk import BulkResult, BulkFailure
+from . import deadline as _deadline
 
 
 class Space(APIWrapper):
@@ -15,14 +20,24 @@ class Space(APIWrapper):
     Used to interact with and manage objects, types, and other elements within a specific Space. It provides methods to retrieve objects, types, and perform search operations within the space. Additionally, it allows creating new objects associated with specific types.
     """
 
+    __slots__ = (
+        "_all_types",
+        "name",
+        "id",
+        "object",
+        "icon",
+        "description",
+        "gateway_url",
+        "network_id",
+    )
+
     def __init__(self):
         self._apiEndpoints: apiEndpoints | None = None
         self.name = ""
         self.id = ""
         self._all_types = []
 
-    @requires_auth
-    def _object_to_dict(self, obj: Object) -> dict:
+    def _check_object_type(self, obj: Object) -> None:
         if obj.type is None:
             raise Exception(
                 "You need to set one type for the object, use add_type method from the Object class"
@@ -35,6 +50,19 @@ class Space(APIWrapper):
                 "Type has an invalid key, please retrieve it from the API to get a valid type"
             )
 
+    def _object_properties(self, obj: Object) -> list[Property]:
+        if not isinstance(obj.properties, dict):
+            raise ValueError("Invalid properties type")
+
+        properties = []
+        for prop in obj.properties.values():
+            if not isinstance(prop, Property):
+                raise TypeError("Internal error: expected an instance of Property")
+            prop.space_id = self.id
+            properties.append(prop)
+        return properties
+
+    def _object_payload(self, obj: Object, properties_json: list[dict]) -> dict:
         type_key = obj.type_key if obj.type_key != "" else obj.type.key
         template_id = obj.template_id if obj.template_id != "" else obj.type.template_id
         icon_json = {}
@@ -43,22 +71,6 @@ class Space(APIWrapper):
         else:
             raise ValueError("Invalid icon type")
 
-        properties_json: list[dict] = []
-
-        if isinstance(obj.properties, dict):
-            for prop in obj.properties.values():
-                if isinstance(prop, Property):
-                    try:
-                        prop.space_id = self.id
-                        json = prop._get_json()
-                        properties_json.append(json)
-                    except:
-                        pass
-                else:
-                    raise TypeError("Internal error: expected an instance of Property")
-        else:
-            raise ValueError("Invalid properties type")
-
         # append description property
         # To avoid incompatibility
         properties_json.append(
@@ -79,6 +91,29 @@ class Space(APIWrapper):
         }
         return object_data
 
+    def _tags_to_resolve(self, properties: list[Property]) -> dict:
+        wanted = {}
+        for prop in properties:
+            names = prop._tag_names()
+            if len(names) > 0:
+                wanted.setdefault((self.id, prop.id), []).extend(names)
+        return wanted
+
+    def _properties_json(self, properties: list[Property], tag_ids: dict) -> list[dict]:
+        properties_json: list[dict] = []
+        for prop in properties:
+            if prop._has_value():
+                properties_json.append(prop._get_json(tag_ids.get((self.id, prop.id), {})))
+        return properties_json
+
+    @requires_auth
+    def _object_to_dict(self, obj: Object) -> dict:
+        self._check_object_type(obj)
+
+        properties = self._object_properties(obj)
+        tag_ids = self._apiEndpoints._resolve_tags(self._tags_to_resolve(properties))
+        return self._object_payload(obj, self._properties_json(properties, tag_ids))
+
     @requires_auth
     def get_objects(self, offset=0, limit=100) -> list[Object]:
         """
@@ -102,6 +137,25 @@ class Space(APIWrapper):
 
         return objects
 
+    @requires_auth
+    def iter_objects(self, limit: int = 100) -> Iterator[Object]:
+        """
+        Iterates over every object of the space. Pages of `limit` objects are requested
+        lazily, the next one in the background while the current one is consumed.
+
+        Parameters:
+            limit (int, optional): The number of objects per request (default: 100).
+
+        Returns:
+            An iterator of Object instances.
+
+        Raises:
+            Raises an error if a request to the API fails.
+        """
+        api = self._apiEndpoints
+        for data in _iter_pages(partial(api.getObjects, self.id), limit, api.page_parallelism):
+            yield Object._from_api(api, data | {"space_id": self.id})
+
     @requires_auth
     def get_object(self, obj: str | Object) -> Object:
         """
@@ -152,21 +206,151 @@ class Space(APIWrapper):
         new_obj.space_id = self.id
         return new_obj
 
-    def _diff_properties(self, new_props, old_props):
-        new_idx = {p["key"]: p for p in new_props if "key" in p}
-        old_idx = {p["key"]: p for p in old_props if "key" in p}
+    def _chunk_properties(self, objs: list[Object], type: Type | None) -> tuple[list, dict]:
+        """
+        Validates a chunk of objects and collects the tags all of them need.
+
+        Returns:
+            For each object, its properties or the exception raised while validating it,
+            and the tag names to resolve for the whole chunk.
+        """
+        properties = []
+        wanted = {}
+        for obj in objs:
+            try:
+                if obj.type is None and type is not None:
+                    obj.type = type
+                self._check_object_type(obj)
+                props = self._object_properties(obj)
+            except Exception as e:
+                properties.append(e)
+                continue
+            properties.append(props)
+            for key, names in self._tags_to_resolve(props).items():
+                wanted.setdefault(key, []).extend(names)
+        return properties, wanted
+
+    def _chunk_payloads(self, objs: list[Object], properties: list, tag_ids: dict) -> list:
+        payloads = []
+        for obj, props in zip(objs, properties):
+            if isinstance(props, Exception):
+                payloads.append(props)
+                continue
+            try:
+                payloads.append(self._object_payload(obj, self._properties_json(props, tag_ids)))
+            except Exception as e:
+                payloads.append(e)
+        return payloads
 
+    def _tag_failures(self, properties: list, error: Exception) -> list:
+        """
+        Fails the objects of a chunk that use tags with `error`, raised while resolving
+        the tags of the chunk. The other objects are still created.
+        """
         return [
-            deepcopy(prop)
-            for key, prop in new_idx.items()
-            if key not in old_idx or prop != old_idx[key]
+            error if not isinstance(props, Exception) and self._tags_to_resolve(props) else props
+            for props in properties
         ]
 
+    def _objects_payloads(self, objs: list[Object], type: Type | None) -> list:
+        """
+        Serializes a chunk of objects, resolving the tags of all of them in one step.
+
+        Returns:
+            For each object, its payload or the exception raised while building it.
+        """
+        properties, wanted = self._chunk_properties(objs, type)
+        try:
+            tag_ids = self._apiEndpoints._resolve_tags(wanted)
+        except Exception as e:
+            properties, tag_ids = self._tag_failures(properties, e), {}
+        return self._chunk_payloads(objs, properties, tag_ids)
+
+    def _create_from_payload(self, payload: dict) -> Object:
+        response = self._apiEndpoints.createObject(self.id, payload)
+        data = response.get("object", {})
+        return Object._from_api(self._apiEndpoints, data | {"space_id": self.id})
+
+    @requires_auth
+    def create_objects(
+        self,
+        objs: Iterable[Object],
+        type: Type | None = None,
+        concurrency: int = 8,
+        chunk_size: int = 100,
+    ) -> BulkResult:
+        """
+        Creates many objects within the space.
+
+        Objects are read from `objs` in chunks of `chunk_size`. The payloads of a chunk
+        are built up front (creating all missing tags in one concurrent step) and sent by
+        `concurrency` workers while the next chunk is being serialized. A failing object
+        does not stop the others.
+
+        Parameters:
+            objs (Iterable[Object]): The objects to create, can be a generator.
+            type (Type, optional): Type used for the objects that have no type.
+            concurrency (int, optional): Number of simultaneous create requests (default: 8).
+            chunk_size (int, optional): Number of objects serialized at once (default: 100).
+
+        Returns:
+            BulkResult: The created objects in input order and the per-object failures.
+        """
+        result = BulkResult()
+        iterator = iter(objs)
+        index = 0
+        pending = []
+        create = _deadline.propagate(self._create_from_payload)
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            while True:
+                chunk = list(islice(iterator, chunk_size))
+                if len(chunk) == 0:
+                    break
+
+                payloads = self._objects_payloads(chunk, type)
+                # at most two chunks are queued: the one being sent and this one
+                wait([future for _, _, future in pending])
+                self._collect_created(result, pending)
+                pending = []
+                for obj, payload in zip(chunk, payloads):
+                    result.objects.append(None)
+                    if isinstance(payload, Exception):
+                        result.failures.append(BulkFailure(index, obj, payload))
+                    else:
+                        future = pool.submit(create, payload)
+                        pending.append((index, obj, future))
+                    index += 1
+
+            wait([future for _, _, future in pending])
+            self._collect_created(result, pending)
+
+        result.failures.sort(key=lambda failure: failure.index)
+        return result
+
+    def _collect_created(self, result: BulkResult, pending: list) -> None:
+        for index, obj, future in pending:
+            error = future.exception()
+            if error is None:
+                result.objects[index] = future.result()
+            else:
+                result.failures.append(BulkFailure(index, obj, error))
+
+    def _update_payload(self, obj: Object, fields: dict, properties_json: list[dict]) -> dict:
+        data = {key: value for key, value in fields.items() if key != "description"}
+        if "description" in fields:
+            properties_json.append({"key": "description", "text": obj.description})
+        if len(properties_json) > 0:
+            data["properties"] = properties_json
+        return data
+
     @requires_auth
     def update_object(self, obj: Object) -> Object:
         """
         Updates an existing object within the space.
 
+        Only the fields and property values that changed since the object was retrieved
+        from the API are sent. If nothing changed, no request is made and `obj` is returned.
+
         Parameters:
             obj (Object): The anytype.Object to be modified.
 
@@ -176,15 +360,22 @@ class Space(APIWrapper):
         Raises:
             Raises an error if the request to the API fails.
         """
-        data = self._object_to_dict(obj)
-        old_obj = self._object_to_dict(self.get_object(obj.id))
+        if obj._snapshot is None:
+            # not retrieved from the API, there is nothing to compare with
+            data = self._object_to_dict(obj)
+        else:
+            fields, properties = obj._changes()
+            if len(fields) == 0 and len(properties) == 0:
+                return obj
 
-        # keep only changed properties
-        data["properties"] = self._diff_properties(
-            data.get("properties", []), old_obj.get("properties", [])
-        )
+            for prop in properties:
+                prop.space_id = self.id
+            tag_ids = self._apiEndpoints._resolve_tags(self._tags_to_resolve(properties))
+            properties_json = self._properties_json(properties, tag_ids)
+            data = self._update_payload(obj, fields, properties_json)
 
         response = self._apiEndpoints.updateObject(self.id, obj.id, data)
+        obj._snapshot = obj._state()
 
         data = response.get("object", {})
         return Object._from_api(self._apiEndpoints, data | {"space_id": self.id})
@@ -233,16 +424,15 @@ class Space(APIWrapper):
             raise Exception("Please define icon, layout, name and plural_name")
 
         defined_props = []
-        all_props = self.get_properties(offset=0, limit=200)
         for _, prop in type.properties.items():
             prop.space_id = self.id
             prop_name = prop.name if isinstance(prop, Property) else prop["name"]
             prop_format = prop.format if isinstance(prop, Property) else prop["format"]
             exists = False
-            for any_prop in all_props:
-                if any_prop.name == prop_name:
-                    exists = True
-                    prop = any_prop
+            any_prop = self._property_byname(prop_name)
+            if any_prop is not None:
+                exists = True
+                prop = any_prop
 
             if not exists:
                 prop = Property.from_format(prop_name, prop_format)
@@ -295,7 +485,6 @@ class Space(APIWrapper):
             raise Exception("Please define icon, layout, name and plural_name")
 
         defined_props = []
-        all_props = self.get_properties(offset=0, limit=200)
         for prop in type.properties:
             if isinstance(prop, str):
                 prop_name = prop
@@ -310,10 +499,10 @@ class Space(APIWrapper):
 
             prop_format = prop.format
             exists = False
-            for any_prop in all_props:
-                if any_prop.name == prop_name:
-                    exists = True
-                    prop = any_prop
+            any_prop = self._property_byname(prop_name)
+            if any_prop is not None:
+                exists = True
+                prop = any_prop
 
             if not exists:
                 prop = Property.from_format(prop_name, prop_format)
@@ -376,13 +565,11 @@ class Space(APIWrapper):
         Raises:
             ValueError: If the type with the specified name is not found.
         """
-        if isinstance(type, Type):
-            typeId = type.id
-        else:
-            type = self.get_type_byname(type)
-            typeId = type.id
+        if not isinstance(type, Type):
+            # the index already holds the full type
+            return self.get_type_byname(type)
 
-        response = self._apiEndpoints.getType(self.id, typeId)
+        response = self._apiEndpoints.getType(self.id, type.id)
         data = response.get("type", {})
         # TODO: Sometimes we need to add more attributes beyond the ones in the
         # API response. There might be a cleaner way to do this, but doing
@@ -411,12 +598,32 @@ class Space(APIWrapper):
         ]
         return types
 
+    @requires_auth
+    def iter_types(self, limit: int = 100) -> Iterator[Type]:
+        """
+        Iterates over every type of the space, requesting `limit` types at a time.
+
+        Parameters:
+            limit (int, optional): The number of types per request (default: 100).
+
+        Returns:
+            An iterator of Type instances.
+
+        Raises:
+            Raises an error if a request to the API fails.
+        """
+        api = self._apiEndpoints
+        for data in _iter_pages(partial(api.getTypes, self.id), limit, api.page_parallelism):
+            yield Type._from_api(api, data | {"space_id": self.id})
+
+    @requires_auth
     def get_type_byname(self, name: str) -> Type:
         """
         Retrieves a type by its name.
 
-        This method paginates through all available types in the space
-        until a type with the given name is found.
+        The types of the space are indexed by name and key on the first lookup, in one
+        pass over all pages. Later lookups do not send requests until a type is created,
+        updated or deleted through this client, or `refresh_index` is called.
 
         Parameters:
             name (str): The name of the type to retrieve.
@@ -428,20 +635,40 @@ class Space(APIWrapper):
             ValueError: If no type with the given name is found.
             Raises an error if the request to the API fails.
         """
-        offset = 0
-        limit = 5
-        while True:
-            types = self.get_types(offset=offset, limit=limit)
-            type_len = len(types)
-            for type in types:
-                if type.name == name:
-                    return type
-            if type_len < limit:
-                break
+        data = self._apiEndpoints._lookup(("types", self.id), "name", name)
+        if data is None:
+            raise ValueError("Type not found")
+        return Type._from_api(self._apiEndpoints, data | {"space_id": self.id})
+
+    @requires_auth
+    def get_type_bykey(self, key: str) -> Type:
+        """
+        Retrieves a type by its key (e.g. "page"), using the same index as
+        `get_type_byname`.
 
-            offset += limit
+        Parameters:
+            key (str): The key of the type to retrieve.
 
-        raise ValueError("Type not found")
+        Returns:
+            Type: The matching Type instance.
+
+        Raises:
+            ValueError: If no type with the given key is found.
+            Raises an error if the request to the API fails.
+        """
+        data = self._apiEndpoints._lookup(("types", self.id), "key", key)
+        if data is None:
+            raise ValueError("Type not found")
+        return Type._from_api(self._apiEndpoints, data | {"space_id": self.id})
+
+    @requires_auth
+    def refresh_index(self) -> None:
+        """
+        Drops the name and key indexes of the types, properties and templates of the
+        space, they are rebuilt by the next lookup. Use it to see changes made outside
+        this client, e.g. in the desktop app.
+        """
+        self._apiEndpoints._lookup_index.invalidate(self.id)
 
     @requires_auth
     def get_member(self, member: str | Member) -> Member:
@@ -475,6 +702,24 @@ class Space(APIWrapper):
             for data in response.get("data", [])
         ]
 
+    @requires_auth
+    def iter_members(self, limit: int = 100) -> Iterator[Member]:
+        """
+        Iterates over every member of the space, requesting `limit` members at a time.
+
+        Parameters:
+            limit (int, optional): The number of members per request (default: 100).
+
+        Returns:
+            An iterator of Member instances.
+
+        Raises:
+            Raises an error if a request to the API fails.
+        """
+        api = self._apiEndpoints
+        for data in _iter_pages(partial(api.getMembers, self.id), limit, api.page_parallelism):
+            yield Member._from_api(api, data | {"space_id": self.id})
+
     @requires_auth
     def get_listviews(
         self, listId: str | Object | Type, offset: int = 0, limit: int = 100
@@ -511,6 +756,7 @@ class Space(APIWrapper):
             Raises an error if the request to the API fails.
         """
         response = self._apiEndpoints.getProperties(self.id, offset, limit)
+        self._apiEndpoints._property_cache.update(self.id, response.get("data", []))
         # types = [
         #     Property._from_api(self._apiEndpoints, data | {"space_id": self.id})
         #     for data in response.get("data", [])
@@ -524,6 +770,29 @@ class Space(APIWrapper):
         self._all_types = types
         return types
 
+    @requires_auth
+    def iter_properties(self, limit: int = 100) -> Iterator[Property]:
+        """
+        Iterates over every property of the space, requesting `limit` properties at a time.
+
+        Parameters:
+            limit (int, optional): The number of properties per request (default: 100).
+
+        Returns:
+            An iterator of Property instances.
+
+        Raises:
+            Raises an error if a request to the API fails.
+        """
+
+        def fetch(offset: int, limit: int) -> dict:
+            response = self._apiEndpoints.getProperties(self.id, offset, limit)
+            self._apiEndpoints._property_cache.update(self.id, response.get("data", []))
+            return response
+
+        for data in _iter_pages(fetch, limit, self._apiEndpoints.page_parallelism):
+            yield Property._from_api(self._apiEndpoints, data | {"space_id": self.id})
+
     @requires_auth
     def create_property(self, prop: Property) -> Property:
         object_data = {
@@ -531,6 +800,7 @@ class Space(APIWrapper):
             "format": prop.format,
         }
         response = self._apiEndpoints.createProperty(self.id, object_data)
+        self._apiEndpoints._property_cache.update(self.id, [response.get("property", {})])
         prop = Property._from_api(
             self._apiEndpoints, response.get("property", {}) | {"space_id": self.id}
         )
@@ -548,24 +818,50 @@ class Space(APIWrapper):
         prop = Property._from_api(self._apiEndpoints, data | {"space_id": self.id})
         return prop
 
+    @requires_auth
     def get_property_bykey(self, key: str) -> Property:
-        all_properties = self.get_properties(offset=0, limit=100)
-        offset = 0
-        limit = 50
-        while True:
-            for prop in all_properties:
-                if prop.key == key:
-                    return prop
-
-            if len(all_properties) < 100:
-                break
-            else:
-                all_properties = self.get_properties(offset=offset, limit=limit)
-            offset += limit
-            limit += 100
+        """
+        Retrieves a property by its key. Properties are indexed by key and name on the
+        first lookup, see `get_type_byname`.
+
+        Parameters:
+            key (str): The key of the property to retrieve.
 
-        # If we reach here, the property was not found
-        raise ValueError("Property not found, create it using create_property method")
+        Returns:
+            Property: The matching Property instance.
+
+        Raises:
+            ValueError: If no property with the given key is found.
+        """
+        data = self._apiEndpoints._lookup(("properties", self.id), "key", key)
+        if data is None:
+            raise ValueError("Property not found, create it using create_property method")
+        return Property._from_api(self._apiEndpoints, data | {"space_id": self.id})
+
+    @requires_auth
+    def get_property_byname(self, name: str) -> Property:
+        """
+        Retrieves a property by its name, using the same index as `get_property_bykey`.
+
+        Parameters:
+            name (str): The name of the property to retrieve.
+
+        Returns:
+            Property: The matching Property instance.
+
+        Raises:
+            ValueError: If no property with the given name is found.
+        """
+        prop = self._property_byname(name)
+        if prop is None:
+            raise ValueError("Property not found, create it using create_property method")
+        return prop
+
+    def _property_byname(self, name: str) -> Property | None:
+        data = self._apiEndpoints._lookup(("properties", self.id), "name", name)
+        if data is None:
+            return None
+        return Property._from_api(self._apiEndpoints, data | {"space_id": self.id})
 
     @requires_auth
     def search(
@@ -589,32 +885,49 @@ class Space(APIWrapper):
         if self.id == "":
             raise ValueError("Space ID is required")
 
-        types = []
+        data = self._search_data(query, type)
+        response = self._apiEndpoints.search(self.id, data, offset, limit)
+        return [
+            Object._from_api(self._apiEndpoints, data | {"space_id": self.id})
+            for data in response.get("data", [])
+        ]
 
-        if isinstance(type, Type):
-            key = type.key
-            if key == "":
-                key = type.name.lower()
-            types = [key]
-        elif isinstance(type, list):
-            for t in type:
-                key = t.key
-                if key == "":
-                    key = t.name.lower()
-                types.append(key)
-
-        print(types)
+    @requires_auth
+    def iter_search(
+        self, query, type: Type | list[Type] | None = None, limit: int = 100
+    ) -> Iterator[Object]:
+        """
+        Iterates over every object that matches the search, requesting `limit` objects at
+        a time.
 
-        data = {
+        Parameters:
+            query (str): The search query string.
+            type (Type, optional): The type to filter by.
+            limit (int, optional): The number of objects per request (default: 100).
+
+        Returns:
+            An iterator of Object instances that match the search query.
+
+        Raises:
+            ValueError: If the space ID is not set.
+        """
+        if self.id == "":
+            raise ValueError("Space ID is required")
+
+        data = self._search_data(query, type)
+        fetch = lambda offset, limit: self._apiEndpoints.search(self.id, data, offset, limit)
+        for item in _iter_pages(fetch, limit, self._apiEndpoints.page_parallelism):
+            yield Object._from_api(self._apiEndpoints, item | {"space_id": self.id})
+
+    def _search_data(self, query, type: Type | list[Type] | None) -> dict:
+        types = []
+        for t in [type] if isinstance(type, Type) else type or []:
+            types.append(t.key if t.key != "" else t.name.lower())
+        return {
             "query": query,
             "sort": {"direction": "desc", "property_key": "last_modified_date"},
             "types": types,
         }
-        response = self._apiEndpoints.search(self.id, data, offset, limit)
-        return [
-            Object._from_api(self._apiEndpoints, data | {"space_id": self.id})
-            for data in response.get("data", [])
-        ]
 
     def __repr__(self):
         return f"<Space(name={self.name})>"
@@ -3,9 +3,11 @@ from .utils import requires_auth
 
 
 class Tag(APIWrapper):
+    __slots__ = ("property_id", "color", "name", "id", "key", "object")
+
     def __init__(self):
         self.space_id: str = ""
-        self._property_id: str = ""
+        self.property_id: str = ""
         self.color: str = ""
         self.name: str = ""
         self.id: str = ""
@@ -24,9 +26,10 @@ class Tag(APIWrapper):
             Raises an error if the request to the API fails.
         """
         data = {"name": name, "color": color}
-        response = self._apiEndpoints.updateTag(self.space_id, self._property_id, self.id, data)
+        response = self._apiEndpoints.updateTag(self.space_id, self.property_id, self.id, data)
         tag = Tag._from_api(
-            self._apiEndpoints, response.get("tag", []) | {"space_id": self.space_id}
+            self._apiEndpoints,
+            response.get("tag", {}) | {"space_id": self.space_id, "property_id": self.property_id},
         )
         return tag
 
@@ -41,7 +44,7 @@ class Tag(APIWrapper):
         Raises:
             Raises an error if the request to the API fails.
         """
-        _ = self._apiEndpoints.deleteTag(self.space_id, self._property_id, self.id)
+        _ = self._apiEndpoints.deleteTag(self.space_id, self.property_id, self.id)
 
     def __repr__(self):
         return f"<Tag(name={self.name})>"
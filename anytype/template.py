@@ -2,6 +2,19 @@ from .api import apiEndpoints, APIWrapper
 
 
 class Template(APIWrapper):
+    __slots__ = (
+        "type",
+        "id",
+        "name",
+        "icon",
+        "object",
+        "archived",
+        "snippet",
+        "layout",
+        "markdown",
+        "properties",
+    )
+
     def __init__(self):
         self._apiEndpoints: apiEndpoints | None = None
         self.type = ""
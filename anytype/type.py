@@ -1,5 +1,7 @@
 from .template import Template
-from .api import apiEndpoints, APIWrapper
+from functools import partial
+from typing import Iterator
+from .api import apiEndpoints, APIWrapper, _iter_pages
 from .utils import requires_auth
 from .property import Property
 from .icon import Icon
@@ -10,6 +12,21 @@ class Type(APIWrapper):
     The Type class is used to interact with and manage templates in a specific space. It allows for retrieving available templates, setting a specific template for a type, and handling template-related actions within the space.
     """
 
+    __slots__ = (
+        "_all_templates",
+        "_icon",
+        "type",
+        "id",
+        "name",
+        "key",
+        "properties",
+        "layout",
+        "plural_name",
+        "template_id",
+        "object",
+        "archived",
+    )
+
     def __init__(self, name: str = ""):
         self._all_templates = []
         self.type = ""
@@ -55,12 +72,12 @@ class Type(APIWrapper):
         """
         Retrieves a template by its name.
 
-        This method paginates through all available templates in the space
-        until a template with the given name is found.
+        The templates of the type are indexed by name on the first lookup, in one pass
+        over all pages, later lookups do not send requests. See `Space.refresh_index`.
 
         Parameters:
             name (str): The name of the template to retrieve.
-            offset (int, optional): The starting offset for pagination (default: 0).
+            offset (int, optional): Unused, the index covers every template.
             limit (int, optional): The maximum number of templates per request (default: 100).
 
         Returns:
@@ -70,20 +87,14 @@ class Type(APIWrapper):
             ValueError: If no template with the given name is found.
             Raises an error if the request to the API fails.
         """
-        while True:
-            templates = self.get_templates(offset=offset, limit=limit)
-            template_len = len(templates)
-
-            for template in templates:
-                if template.name == name:
-                    return template
-
-            if template_len < limit:
-                break
-
-            offset += limit
+        data = self._template_data(name, limit)
+        if data is None:
+            raise ValueError("Template not found")
+        return Template._from_api(self._apiEndpoints, data | {"space_id": self.space_id})
 
-        raise ValueError("Template not found")
+    def _template_data(self, name: str, limit: int = 100) -> dict | None:
+        collection = ("templates", self.space_id, self.id)
+        return self._apiEndpoints._lookup(collection, "name", name, limit)
 
     @requires_auth
     def get_templates(self, offset: int = 0, limit: int = 100) -> list[Template]:
@@ -108,9 +119,28 @@ class Type(APIWrapper):
 
         return self._all_templates
 
+    @requires_auth
+    def iter_templates(self, limit: int = 100) -> Iterator[Template]:
+        """
+        Iterates over every template of the type, requesting `limit` templates at a time.
+
+        Parameters:
+            limit (int): The number of templates per request (default: 100).
+
+        Returns:
+            An iterator of Template objects.
+
+        Raises:
+            Raises an error if a request to the API fails.
+        """
+        fetch = partial(self._apiEndpoints.getTemplates, self.space_id, self.id)
+        for data in _iter_pages(fetch, limit, self._apiEndpoints.page_parallelism):
+            yield Template._from_api(self._apiEndpoints, data | {"space_id": self.space_id})
+
+    @requires_auth
     def set_template(self, template_name: str) -> None:
         """
-        Sets a template for the type by name. If no templates are loaded, it will first fetch all templates.
+        Sets a template for the type by name, looked up in the template index of the type.
 
         Parameters:
             template_name (str): The name of the template to assign.
@@ -121,17 +151,10 @@ class Type(APIWrapper):
         Raises:
             ValueError: If a template with the specified name is not found.
         """
-        if len(self._all_templates) == 0:
-            self.get_templates()
-
-        found = False
-        for template in self._all_templates:
-            if template.name == template_name:
-                found = True
-                self.template_id = template.id
-                return
-        if not found:
+        data = self._template_data(template_name)
+        if data is None:
             raise ValueError(f"Type '{self.name}' does not have a template named '{template_name}'")
+        self.template_id = data["id"]
 
     @requires_auth
     def get_template(self, id: str) -> Template:
@@ -154,7 +177,7 @@ class Type(APIWrapper):
         template._apiEndpoints = self._apiEndpoints
         for data in response_data.get("data", []):
             for key, value in data.items():
-                template.__dict__[key] = value
+                setattr(template, key, value)
 
         return template
 
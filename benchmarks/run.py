@@ -0,0 +1,306 @@
+"""
+End-to-end benchmarks of the client hot paths, run against `FakeAnytypeServer`.
+
+Every operation is timed for each dataset size, with the requests it sends counted
+per endpoint, and the results are written as JSON to compare releases.
+
+Usage:
+    python benchmarks/run.py
+    python benchmarks/run.py --sizes 100 1000 --latency 0.002 --output before.json
+    python benchmarks/run.py --operations create_object update_object --iterations 200
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import argparse
+import platform
+import warnings
+import subprocess
+from datetime import datetime, timezone
+from importlib import metadata
+
+# benchmark the working tree, not an installed release
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from anytype import Object, Type, Icon, profile  # noqa: E402
+from anytype.fakeserver import FakeAnytypeServer  # noqa: E402
+from anytype.property import MultiSelect, Number, Text  # noqa: E402
+
+DEFAULT_SIZES = (100, 1000, 10000, 100000)
+
+
+class Dataset:
+    """
+    A fake server seeded with `size` objects of one type with text, number and
+    multi-select properties, and a client connected to it.
+    """
+
+    def __init__(self, size: int, latency: float, jitter: float, seed: int):
+        self.size = size
+        self.server = FakeAnytypeServer(latency=latency, jitter=jitter, seed=seed).start()
+        self.client = self.server.client()
+        self.space = self.client.get_space(self.server.space_id)
+        self.type = self.space.create_type(article_type("Benchmark Article"))
+        self.counter = 0
+
+        # one tag for every 100 objects, each object has two of them
+        authors, year, summary = (
+            self.type.properties[name] for name in ("Authors", "Year", "Summary")
+        )
+        self.tags = [f"Author {i}" for i in range(max(10, size // 100))]
+        tag_ids = [self.server.add_tag(self.space.id, authors.id, name) for name in self.tags]
+        for i in range(size):
+            properties = [
+                {
+                    "key": authors.key,
+                    "multi_select": [tag_ids[i % len(tag_ids)], tag_ids[i // 7 % len(tag_ids)]],
+                },
+                {"key": year.key, "number": 1900 + i % 125},
+                {"key": summary.key, "text": f"Summary of article {i}"},
+            ]
+            self.server.add_object(
+                self.space.id, self.type.key, f"Article {i}", f"# Article {i}", properties
+            )
+
+    def unique(self, prefix: str) -> str:
+        self.counter += 1
+        return f"{prefix} {self.counter}"
+
+    def new_object(self, name: str, authors: list[str]) -> Object:
+        obj = Object(name, self.type)
+        obj.markdown = f"# {name}"
+        obj.properties["Authors"].value = authors
+        obj.properties["Year"].value = 2025
+        obj.properties["Summary"].value = f"Summary of {name}"
+        return obj
+
+    def close(self) -> None:
+        self.client.close()
+        self.server.stop()
+
+
+def article_type(name: str, extra: str | None = None) -> Type:
+    type = Type(name)
+    type.icon = Icon()
+    type.layout = "basic"
+    type.plural_name = name + "s"
+    type.add_property(MultiSelect("Authors"))
+    type.add_property(Number("Year"))
+    type.add_property(Text("Summary"))
+    if extra is not None:
+        type.add_property(Text(extra))
+    return type
+
+
+# Each operation is `(setup, run)`: `setup(dataset, i)` prepares the argument of the
+# i-th call outside of the timing, `run(dataset, argument)` is timed and returns the
+# number of items it handled.
+
+
+def _page_offset(dataset: Dataset, i: int) -> int:
+    return i * 100 % dataset.size
+
+
+def _get_objects(dataset: Dataset, offset: int) -> int:
+    return len(dataset.space.get_objects(offset=offset, limit=100))
+
+
+def _iter_objects(dataset: Dataset, _) -> int:
+    return sum(1 for _ in dataset.space.iter_objects(limit=100))
+
+
+def _new_object(dataset: Dataset, i: int) -> Object:
+    authors = [dataset.tags[i % len(dataset.tags)], dataset.tags[(i + 1) % len(dataset.tags)]]
+    return dataset.new_object(dataset.unique("Created"), authors)
+
+
+def _create_object(dataset: Dataset, obj: Object) -> int:
+    dataset.space.create_object(obj)
+    return 1
+
+
+def _fetched_object(dataset: Dataset, i: int) -> Object:
+    obj = dataset.space.get_objects(offset=i % dataset.size, limit=1)[0]
+    obj.name = dataset.unique("Updated")
+    obj.properties["Year"].value = 2000 + i % 25
+    obj.properties["Summary"].value = f"Updated summary {i}"
+    return obj
+
+
+def _update_object(dataset: Dataset, obj: Object) -> int:
+    dataset.space.update_object(obj)
+    return 1
+
+
+def _search_query(dataset: Dataset, i: int) -> str:
+    return f"Article {i % dataset.size}"
+
+
+def _search(dataset: Dataset, query: str) -> int:
+    return len(dataset.space.search(query, type=dataset.type, limit=100))
+
+
+def _cold_object(dataset: Dataset, i: int) -> tuple:
+    # a new client has not loaded the tags of the property yet
+    space = dataset.server.client().get_space(dataset.space.id)
+    existing = [dataset.tags[(i + n) % len(dataset.tags)] for n in range(5)]
+    obj = dataset.new_object(dataset.unique("Tagged"), existing + [dataset.unique("New tag")])
+    return space, obj
+
+
+def _resolve_tags(dataset: Dataset, argument: tuple) -> int:
+    space, obj = argument
+    # builds the payload of create_object, which resolves the tag names to ids
+    space._object_to_dict(obj)
+    return len(obj.properties["Authors"].value)
+
+
+def _new_type(dataset: Dataset, i: int) -> Type:
+    return article_type(dataset.unique("Benchmark Type"), extra=dataset.unique("Field"))
+
+
+def _create_type(dataset: Dataset, type: Type) -> int:
+    dataset.space.create_type(type)
+    return 1
+
+
+OPERATIONS = {
+    "get_objects": (_page_offset, _get_objects),
+    "iter_objects": (lambda dataset, i: None, _iter_objects),
+    "create_object": (_new_object, _create_object),
+    "update_object": (_fetched_object, _update_object),
+    "search": (_search_query, _search),
+    "tag_resolution": (_cold_object, _resolve_tags),
+    "create_type": (_new_type, _create_type),
+}
+
+# operations that read the whole dataset are repeated fewer times
+SCANS = ("iter_objects",)
+
+
+def percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def measure(dataset: Dataset, name: str, iterations: int, warmup: int) -> dict:
+    setup, run = OPERATIONS[name]
+    if name in SCANS:
+        iterations, warmup = max(1, iterations // 10), 0
+    for i in range(warmup):
+        run(dataset, setup(dataset, i))
+
+    latencies = []
+    items = 0
+    requests: dict[str, int] = {}
+    for i in range(warmup, warmup + iterations):
+        argument = setup(dataset, i)
+        with profile() as p:
+            start = time.perf_counter()
+            items += run(dataset, argument)
+            latencies.append(time.perf_counter() - start)
+        for endpoint, stats in p.endpoints.items():
+            requests[endpoint] = requests.get(endpoint, 0) + stats.calls
+
+    total = sum(latencies)
+    return {
+        "operation": name,
+        "dataset_size": dataset.size,
+        "iterations": iterations,
+        "items": items,
+        "total_s": total,
+        "ops_per_s": iterations / total if total else None,
+        "items_per_s": items / total if total else None,
+        "latency_ms": {
+            "mean": total / iterations * 1000,
+            "min": min(latencies) * 1000,
+            "p50": percentile(latencies, 0.50) * 1000,
+            "p95": percentile(latencies, 0.95) * 1000,
+            "p99": percentile(latencies, 0.99) * 1000,
+            "max": max(latencies) * 1000,
+        },
+        "requests_per_op": sum(requests.values()) / iterations,
+        "requests": {endpoint: calls / iterations for endpoint, calls in sorted(requests.items())},
+    }
+
+
+def environment(args) -> dict:
+    try:
+        version = metadata.version("anytype-client")
+    except metadata.PackageNotFoundError:
+        with open(os.path.join(ROOT, "pyproject.toml")) as f:
+            found = re.search(r'^version = "(.+)"', f.read(), re.MULTILINE)
+        version = found.group(1) if found else None
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "anytype_client": version,
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "latency_s": args.latency,
+        "jitter_s": args.jitter,
+        "iterations": args.iterations,
+        "warmup": args.warmup,
+    }
+
+
+def main(argv=None) -> dict:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="objects in the space"
+    )
+    parser.add_argument(
+        "--operations", nargs="+", choices=OPERATIONS, default=list(OPERATIONS), metavar="OP"
+    )
+    parser.add_argument("--iterations", type=int, default=50, help="timed calls per operation")
+    parser.add_argument("--warmup", type=int, default=2, help="untimed calls per operation")
+    parser.add_argument(
+        "--latency", type=float, default=0.001, help="seconds added to every response"
+    )
+    parser.add_argument("--jitter", type=float, default=0.0, help="random extra latency")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="benchmark.json", help="JSON file of the results")
+    args = parser.parse_args(argv)
+
+    warnings.filterwarnings("ignore", message="Tag '.*' not exist")
+    report = {"environment": environment(args), "results": []}
+    print(
+        f"{'operation':<15} {'size':>7} {'ops/s':>9} {'items/s':>10} {'p50 ms':>8} "
+        f"{'p95 ms':>8} {'req/op':>7}"
+    )
+    for size in args.sizes:
+        dataset = Dataset(size, args.latency, args.jitter, args.seed)
+        try:
+            for name in args.operations:
+                result = measure(dataset, name, args.iterations, args.warmup)
+                report["results"].append(result)
+                print(
+                    f"{name:<15} {size:>7} {result['ops_per_s']:>9.1f} "
+                    f"{result['items_per_s']:>10.1f} {result['latency_ms']['p50']:>8.2f} "
+                    f"{result['latency_ms']['p95']:>8.2f} {result['requests_per_op']:>7.2f}"
+                )
+        finally:
+            dataset.close()
+
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"results written to {args.output}")
+    return report
+
+
+if __name__ == "__main__":
+    main()
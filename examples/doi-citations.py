@@ -8,7 +8,6 @@ sys.path.append(file)
 
 import anytype
 import requests
-import time
 import warnings
 
 any = anytype.Anytype()
@@ -50,7 +49,7 @@ if article_type is None:
 assert isinstance(article_type, anytype.Type)
 
 
-time.sleep(2)
+articles = []
 
 
 def add_article(doi, recursive=False):
@@ -92,11 +91,7 @@ def add_article(doi, recursive=False):
                 if ref_doi != "":
                     add_article(ref_doi)
 
-        try:
-            myspace.create_object(obj)
-        except:
-            warnings.warn(f"Not possible to create {obj.name}")
-        time.sleep(1)
+        articles.append(obj)
 
     else:
         print(f"Error fetching article data: {response.status_code}")
@@ -105,3 +100,7 @@ def add_article(doi, recursive=False):
 # Example usage:
 doi = "10.1080/17459737.2025.2465976"
 add_article(doi, True)
+
+result = myspace.create_objects(articles)
+for failure in result.failures:
+    warnings.warn(f"Not possible to create {failure.object.name}")
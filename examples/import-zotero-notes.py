@@ -125,16 +125,10 @@ attachments = cur.fetchall()
 # ------------------------------------------------------------
 
 humans = []
-offset = 0
-persons_len = 100
 human = space.get_type("Human")
-while persons_len > 20:
-    h_obj = space.get_objects(offset, 100)
-    print(h_obj)
-    for obj in h_obj:
-        if obj.type is not None and obj.type.id == human.id:
-            humans.append(obj)
-    persons_len = len(h_obj)
+for obj in space.iter_objects():
+    if obj.type is not None and obj.type.id == human.id:
+        humans.append(obj)
 
 
 humans_names = []
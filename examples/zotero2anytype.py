@@ -1,6 +1,5 @@
 import os
 import sys
-import time
 import sqlite3
 import json
 import urllib.parse
@@ -165,6 +164,7 @@ if __name__ == "__main__":
     api_space = any.get_spaces()[0]
 
     page_type = api_space.get_type_byname("Page")
+    objects = []
     for r in results:
         obj = anytype.Object(r["title"])
 
@@ -179,5 +179,8 @@ if __name__ == "__main__":
                     needadd = True
             if needadd:
                 print(f"Adding {r["title"]}")
-                api_space.create_object(obj, type=page_type)
-            time.sleep(0.3)
+                objects.append(obj)
+
+    result = api_space.create_objects(objects, type=page_type)
+    for failure in result.failures:
+        print(f"Not possible to create {failure.object.name}: {failure.error}")
@@ -0,0 +1,3 @@
+# the plugin is also registered by the pytest11 entry point once the package is installed,
+# the tests load it themselves to check their request budgets from a source checkout
+pytest_plugins = ["anytype.pytest_plugin", "pytester"]
@@ -1,5 +1,20 @@
-from anytype import Anytype, Space, Object, Type, Icon
+from anytype import (
+    Anytype,
+    Space,
+    Object,
+    Type,
+    Icon,
+    ResponseCache,
+    RetryPolicy,
+    AdaptiveLimiter,
+    Deadline,
+    DeadlineExceeded,
+    HedgePolicy,
+    Middleware,
+    profile,
+)
 
+from anytype.pytest_plugin import anytype_budget
 from anytype.property import (
     Text,
     Number,
@@ -17,6 +32,9 @@ from anytype.property import (
 
 import random
 import string
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 any = Anytype()
 any.auth()
@@ -101,6 +119,197 @@ def test_create_space():
     assert get_apispace()
 
 
+def test_shared_session():
+    api_space = get_apispace()
+    objtype = api_space.get_type_byname("Page")
+    assert api_space._apiEndpoints is any._apiEndpoints
+    assert objtype._apiEndpoints.session is any._apiEndpoints.session
+
+
+def test_response_cache():
+    cached = Anytype(response_cache=ResponseCache(ttl=60))
+    cached.auth()
+    api_space = cached.get_space(get_apispace().id)
+
+    with profile() as p:
+        for _ in range(5):
+            assert cached.get_space(api_space.id).id == api_space.id
+    assert p.calls == 0
+
+
+def test_concurrent_gets_are_coalesced(monkeypatch):
+    api_space = get_apispace()
+    endpoints = api_space._apiEndpoints
+
+    calls = []
+    send = endpoints._send
+
+    def slow_send(method, path, params=None, json=None):
+        calls.append(path)
+        time.sleep(0.2)
+        return send(method, path, params, json)
+
+    monkeypatch.setattr(endpoints, "_send", slow_send)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        responses = list(pool.map(lambda _: endpoints.getSpace(api_space.id), range(8)))
+    assert calls == [f"/spaces/{api_space.id}"]
+    assert all(response is responses[0] for response in responses)
+
+
+def test_failed_get_is_retried(monkeypatch):
+    api_space = get_apispace()
+    endpoints = api_space._apiEndpoints
+    monkeypatch.setattr(endpoints, "retry", RetryPolicy(base_delay=0.01))
+
+    statuses = []
+    request = endpoints.session.request
+
+    def flaky_request(method, url, **kwargs):
+        response = request(method, url, **kwargs)
+        if not statuses:
+            response.status_code = 503
+        statuses.append(response.status_code)
+        return response
+
+    monkeypatch.setattr(endpoints.session, "request", flaky_request)
+    space = endpoints.getSpaces(0, 1)
+    assert len(space["data"]) == 1
+    assert statuses == [503, 200]
+    assert endpoints.retry.counters["recovered"] == 1
+
+
+def test_limiter_caps_requests_in_flight(monkeypatch):
+    api_space = get_apispace()
+    endpoints = api_space._apiEndpoints
+    limiter = AdaptiveLimiter(initial_limit=2, min_limit=2, max_limit=2)
+    monkeypatch.setattr(endpoints, "limiter", limiter)
+
+    in_flight, peak = [0], [0]
+    request = endpoints.session.request
+
+    def tracked_request(method, url, **kwargs):
+        in_flight[0] += 1
+        peak[0] = max(peak[0], in_flight[0])
+        time.sleep(0.05)
+        try:
+            return request(method, url, **kwargs)
+        finally:
+            in_flight[0] -= 1
+
+    monkeypatch.setattr(endpoints.session, "request", tracked_request)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda offset: endpoints.getObjects(api_space.id, offset, 1), range(8)))
+    assert peak[0] <= 2
+    assert limiter.counters["throttled"] > 0
+    assert limiter.in_flight == 0
+
+
+def test_deadline_bounds_nested_requests(monkeypatch):
+    api_space = get_apispace()
+    endpoints = api_space._apiEndpoints
+
+    timeouts = []
+    request = endpoints.session.request
+
+    def slow_request(method, url, **kwargs):
+        timeouts.append(kwargs["timeout"])
+        time.sleep(0.3)
+        return request(method, url, **kwargs)
+
+    monkeypatch.setattr(endpoints.session, "request", slow_request)
+    start = time.monotonic()
+    try:
+        with Deadline(0.5):
+            for offset in range(5):
+                endpoints.getObjects(api_space.id, offset, 1)
+        assert False, "the deadline did not stop the requests"
+    except DeadlineExceeded:
+        pass
+    assert time.monotonic() - start < 1
+    assert len(timeouts) == 2
+    assert all(read <= 0.5 for _, read in timeouts)
+
+
+def test_slow_read_is_hedged(monkeypatch):
+    client = Anytype(hedge=HedgePolicy(min_samples=5))
+    client.auth()
+    endpoints = client._apiEndpoints
+    space_id = get_apispace().id
+    for _ in range(10):
+        endpoints.getSpace(space_id)
+
+    stalled = []
+    request = endpoints.session.request
+
+    def stalling_request(method, url, **kwargs):
+        if not stalled:
+            stalled.append(url)
+            time.sleep(2)
+        return request(method, url, **kwargs)
+
+    monkeypatch.setattr(endpoints.session, "request", stalling_request)
+    start = time.monotonic()
+    endpoints.getSpace(space_id)
+    assert time.monotonic() - start < 1
+    assert endpoints.hedge.counters["won"] == 1
+
+
+def test_middleware_hooks_run_in_order():
+    events = []
+
+    class Recorder(Middleware):
+        def __init__(self, name):
+            self.name = name
+
+        def before_request(self, request):
+            events.append((self.name, "before", request.path))
+
+        def after_response(self, request, response):
+            events.append((self.name, "after", request.path))
+            return response
+
+        def on_error(self, request, error):
+            events.append((self.name, "error", request.path))
+            if isinstance(error, ValueError):
+                return {"space": None}
+
+    space_id = get_apispace().id
+    client = Anytype(middleware=[Recorder("outer"), Recorder("inner")])
+    client.auth()
+    # auth validates the token with a request of its own
+    events.clear()
+    client._apiEndpoints.getSpace(space_id)
+    assert events == [
+        ("outer", "before", f"/spaces/{space_id}"),
+        ("inner", "before", f"/spaces/{space_id}"),
+        ("inner", "after", f"/spaces/{space_id}"),
+        ("outer", "after", f"/spaces/{space_id}"),
+    ]
+
+    events.clear()
+    assert client._apiEndpoints.getSpace("missing-space") == {"space": None}
+    assert [event[1] for event in events] == ["before", "before", "error", "after", "after"]
+
+
+def test_profile_counts_requests_per_endpoint():
+    api_space = get_apispace()
+    with profile() as p:
+        api_space.get_objects(limit=5)
+        api_space.get_types(limit=5)
+    assert p.calls_to("GET /spaces/{id}/objects") == 1
+    assert p.calls_to("GET /spaces/{id}/types") == 1
+    stats = p.endpoints["GET /spaces/{id}/objects"]
+    assert stats.bytes_received > 0
+    assert stats.errors == 0
+    assert "GET /spaces/{id}/objects" in p.report()
+
+
+@anytype_budget(get_objects=1, get_object=0)
+def test_get_objects_request_budget():
+    api_space = get_apispace()
+    api_space.get_objects(limit=5)
+
+
 def test_globalsearch():
     objects = any.global_search("")
     assert len(objects) > 0
@@ -115,6 +324,35 @@ def test_get_objects():
     assert len(objects) > 0
 
 
+def test_get_objects_uses_property_cache():
+    api_space = get_apispace()
+    api_space.get_objects(limit=20)
+
+    with profile() as p:
+        api_space.get_objects(limit=20)
+    assert p.calls_to("GET /spaces/{id}/objects") == p.calls == 1
+
+
+def test_iter_objects():
+    api_space = get_apispace()
+    objects = api_space.get_objects(limit=1000)
+    iterated = list(api_space.iter_objects(limit=7))
+    assert [obj.id for obj in iterated] == [obj.id for obj in objects]
+
+    types = api_space.iter_types(limit=2)
+    assert next(types).id != ""
+    types.close()
+
+
+def test_iter_objects_parallel_pages(monkeypatch):
+    api_space = get_apispace()
+    monkeypatch.setattr(api_space._apiEndpoints, "page_parallelism", 1)
+    serial = [obj.id for obj in api_space.iter_objects(limit=5)]
+    monkeypatch.setattr(api_space._apiEndpoints, "page_parallelism", 8)
+    parallel = [obj.id for obj in api_space.iter_objects(limit=5)]
+    assert parallel == serial
+
+
 def test_get_object():
     api_space = get_apispace()
     objects = api_space.get_objects()
@@ -162,6 +400,32 @@ def test_create_object():
     assert created_obj.icon.emoji == "🐍"
 
 
+def test_create_object_single_request():
+    api_space = get_apispace()
+    objtype = api_space.get_type_byname("Page")
+    api_space.get_objects(limit=1)
+
+    obj = Object("Single request", objtype)
+    obj.description = "Created with one request"
+    with profile() as p:
+        api_space.create_object(obj)
+    assert p.calls_to("POST /spaces/{id}/objects") == p.calls == 1
+
+
+def test_create_objects():
+    api_space = get_apispace()
+    objtype = api_space.get_type_byname("Page")
+
+    objs = [Object(f"Bulk {i}", objtype) for i in range(10)]
+    objs[3] = Object("Bulk without type")
+    result = api_space.create_objects(objs, concurrency=4, chunk_size=3)
+
+    assert len(result.objects) == 10
+    assert result.objects[3] is None
+    assert [failure.index for failure in result.failures] == [3]
+    assert [obj.name for obj in result.created] == [f"Bulk {i}" for i in range(10) if i != 3]
+
+
 def test_update_object():
     api_space = get_apispace()
 
@@ -180,6 +444,23 @@ def test_update_object():
     api_space.update_object(created_obj)
 
 
+def test_update_object_sends_only_changes():
+    api_space = get_apispace()
+    objtype = api_space.get_type_byname("Page")
+    created_obj = api_space.create_object(Object("Dirty tracking", objtype))
+
+    with profile() as p:
+        assert api_space.update_object(created_obj) is created_obj
+    assert p.calls == 0
+
+    created_obj.name = "Dirty tracking 2"
+    assert created_obj._changes() == ({"name": "Dirty tracking 2"}, [])
+    with profile() as p:
+        updated_obj = api_space.update_object(created_obj)
+    assert p.calls_to("PATCH /spaces/{id}/objects/{id}") == p.calls == 1
+    assert updated_obj.name == "Dirty tracking 2"
+
+
 def test_delete_object():
     api_space = get_apispace()
     objtype = api_space.get_type_byname("Page")
@@ -191,6 +472,25 @@ def test_delete_object():
     api_space.delete_object(created_obj)
 
 
+def test_async_create_objects():
+    from anytype.aio import AsyncAnytype
+
+    async def create_and_list():
+        async with AsyncAnytype() as async_any:
+            # the key of the sync client, auth would prompt for a code without a saved one
+            await async_any.auth(persist_token=False, api_key=any.api_key)
+            space = await async_any.get_space(get_apispace().id)
+            objtype = await space.get_type("Page")
+            objs = [Object(f"Async {i}", objtype) for i in range(5)]
+            created = await asyncio.gather(*[space.create_object(obj) for obj in objs])
+            listed = [obj async for obj in space.iter_objects(limit=2)]
+            return created, listed
+
+    created, listed = asyncio.run(create_and_list())
+    assert [obj.name for obj in created] == [f"Async {i}" for i in range(5)]
+    assert {obj.id for obj in created} <= {obj.id for obj in listed}
+
+
 # ╭──────────────────────────────────────╮
 # │                Types                 │
 # ╰──────────────────────────────────────╯
@@ -252,6 +552,24 @@ def test_get_type_byname():
     assert page
 
 
+def test_indexed_lookups():
+    api_space = get_apispace()
+    page = api_space.get_type_byname("Page")
+    api_space.get_property_byname("Description")
+
+    with profile() as p:
+        for _ in range(50):
+            assert api_space.get_type("Page").id == page.id
+            assert api_space.get_type_bykey(page.key).id == page.id
+            assert api_space.get_property_bykey("description").name == "Description"
+    assert p.calls == 0
+
+    api_space.refresh_index()
+    with profile() as p:
+        api_space.get_type_byname("Page")
+    assert p.calls_to("GET /spaces/{id}/types") == p.calls == 1
+
+
 def test_create_types():
     api_space = get_apispace()
     types = api_space.get_types()
@@ -399,3 +717,22 @@ def test_testproperties():
     obj.properties["prop_phone"].value = "+55112233445566"
 
     updated_obj = api_space.update_object(created_obj)
+
+
+def test_tag_registry():
+    api_space = get_apispace()
+    tag_type = Type(f"TagRegistry {random_string(5)}")
+    tag_type.icon = Icon()
+    tag_type.layout = "basic"
+    tag_type.plural_name = "TagRegistries"
+    tag_type.add_property(MultiSelect("Authors"))
+    tag_type = api_space.create_type(tag_type)
+
+    names = [f"Author {random_string(5)}" for _ in range(15)]
+    obj = Object("Many tags", tag_type)
+    obj.properties["Authors"].value = names
+    api_space.create_object(obj)
+
+    tags = tag_type.properties["Authors"].get_tags()
+    assert set(names) <= {tag.name for tag in tags}
+    assert len(tags) == len({tag.name for tag in tags})
@@ -0,0 +1,423 @@
+import asyncio
+import copy
+import pickle
+import threading
+
+from anytype import Object, Type, Tag, Icon, HedgePolicy, ResponseCache, RetryPolicy, profile
+from anytype.aio import AsyncTag, _hydrate
+from anytype.fakeserver import FakeAnytypeServer
+from anytype.property import MultiSelect, Number, Select, Text
+
+# runs without the desktop app, against the in-memory server
+server = FakeAnytypeServer().start()
+any = server.client()
+
+
+def get_space():
+    return any.get_space(server.space_id)
+
+
+def test_create_and_get_object():
+    space = get_space()
+    obj = Object("Offline object", space.get_type_byname("Page"))
+    obj.markdown = "# Title"
+    created = space.create_object(obj)
+
+    assert space.get_object(created.id).name == "Offline object"
+    assert created.id in {o.id for o in space.search("offline object")}
+
+
+def test_create_type_and_tags():
+    space = get_space()
+    article = Type("Article")
+    article.icon = Icon()
+    article.layout = "basic"
+    article.plural_name = "Articles"
+    article.add_property(MultiSelect("Authors"))
+    article.add_property(Number("Year"))
+    article = space.create_type(article)
+
+    obj = Object("Paper", article)
+    obj.properties["Authors"].value = ["Ada", "Alan"]
+    space.create_object(obj)
+
+    tags = article.properties["Authors"].get_tags()
+    assert {"Ada", "Alan"} <= {tag.name for tag in tags}
+    assert [o.name for o in space.search("", type=article)] == ["Paper"]
+
+
+def test_update_created_type():
+    space = get_space()
+    # index the properties before the type creates new ones
+    space.get_property_byname("Tag")
+    book = Type("Book")
+    book.icon = Icon()
+    book.layout = "basic"
+    book.plural_name = "Books"
+    book.add_property(Text("Isbn"))
+    book = space.create_type(book)
+
+    book.icon = Icon("📚")
+    with profile() as p:
+        updated = space.update_type(book)
+
+    assert updated.icon.emoji == "📚"
+    assert p.calls_to("POST /spaces/{id}/properties") == 0
+    assert [prop.name for prop in space.get_properties() if prop.name == "Isbn"] == ["Isbn"]
+
+
+def test_reads_sent_during_an_update_are_not_cached(monkeypatch):
+    client = server.client(response_cache=ResponseCache())
+    space = client.get_space(server.space_id)
+    draft = Type("Draft")
+    draft.icon = Icon()
+    draft.layout = "basic"
+    draft.plural_name = "Drafts"
+    draft = space.create_type(draft)
+
+    api = client._apiEndpoints
+    send = api._send
+
+    def send_after_a_read(method, path, params=None, json=None):
+        if method == "PATCH":
+            # another thread reads the type just before the update reaches the server
+            api.getType(space.id, draft.id)
+        return send(method, path, params, json)
+
+    monkeypatch.setattr(api, "_send", send_after_a_read)
+    api.updateType(space.id, draft.id, {"name": "Final"})
+
+    assert api.getType(space.id, draft.id)["type"]["name"] == "Final"
+
+
+def test_objects_read_during_a_type_update_get_the_new_type(monkeypatch):
+    client = server.client()
+    space = client.get_space(server.space_id)
+    memo = Type("Memo")
+    memo.icon = Icon()
+    memo.layout = "basic"
+    memo.plural_name = "Memos"
+    memo = space.create_type(memo)
+    obj = space.create_object(Object("A memo", memo))
+
+    api = client._apiEndpoints
+    send = api._send
+
+    def send_after_a_read(method, path, params=None, json=None):
+        if method == "PATCH":
+            # another thread hydrates an object of the type before the update is done
+            assert space.get_object(obj.id).type.name == "Memo"
+        return send(method, path, params, json)
+
+    monkeypatch.setattr(api, "_send", send_after_a_read)
+    api.updateType(space.id, memo.id, {"name": "Final memo"})
+
+    assert space.get_object(obj.id).type.name == "Final memo"
+
+
+def test_lookups_made_during_a_type_update_are_not_indexed(monkeypatch):
+    client = server.client()
+    space = client.get_space(server.space_id)
+    journal = Type("Journal")
+    journal.icon = Icon()
+    journal.layout = "basic"
+    journal.plural_name = "Journals"
+    journal = space.create_type(journal)
+
+    api = client._apiEndpoints
+    send = api._send
+
+    def send_after_a_lookup(method, path, params=None, json=None):
+        if method == "PATCH":
+            # another thread indexes the types before the update is done
+            space.get_type_byname("Journal")
+        return send(method, path, params, json)
+
+    monkeypatch.setattr(api, "_send", send_after_a_lookup)
+    api.updateType(space.id, journal.id, {"name": "Final journal"})
+
+    assert space.get_type_byname("Final journal").id == journal.id
+
+
+def _bulk_objects(name: str) -> list:
+    client = server.client(retry=RetryPolicy(max_attempts=1))
+    space = client.get_space(server.space_id)
+    paper = Type(name)
+    paper.icon = Icon()
+    paper.layout = "basic"
+    paper.plural_name = name + "s"
+    paper.add_property(MultiSelect("Authors"))
+    paper = space.create_type(paper)
+
+    tagged = Object("Tagged " + name, paper)
+    tagged.properties["Authors"].value = ["Grace"]
+    return space, [Object("Plain " + name, paper), tagged]
+
+
+def test_bulk_create_reports_a_tag_that_was_not_created():
+    space, objs = _bulk_objects("Preprint")
+    server.inject_error(500, method="POST", path=r"/tags$")
+
+    result = space.create_objects(objs)
+
+    assert [obj is not None for obj in result.objects] == [True, False]
+    assert [failure.index for failure in result.failures] == [1]
+    assert "Grace" in str(result.failures[0].error)
+
+
+def test_bulk_create_keeps_going_when_tags_cannot_be_loaded():
+    space, objs = _bulk_objects("Thesis")
+    server.inject_error(500, method="GET", path=r"/tags$")
+
+    result = space.create_objects(objs)
+
+    assert [obj is not None for obj in result.objects] == [True, False]
+    assert result.failures[0].error.status_code == 500
+
+
+def test_values_are_read_from_list_responses():
+    space = get_space()
+    review = Type("Review")
+    review.icon = Icon()
+    review.layout = "basic"
+    review.plural_name = "Reviews"
+    review.add_property(Select("Verdict"))
+    review.add_property(Number("Score"))
+    review = space.create_type(review)
+
+    obj = Object("Hydrated review", review)
+    obj.description = "Read from the list"
+    obj.properties["Verdict"].value = "Accept"
+    obj.properties["Score"].value = 8
+    space.create_object(obj)
+
+    # a new client has no cached property definitions
+    fresh = server.client().get_space(server.space_id)
+    with profile() as p:
+        found = fresh.search("Hydrated review", type=review)[0]
+
+    assert p.calls == 1
+    assert found.description == "Read from the list"
+    assert found.properties["Verdict"].value.name == "Accept"
+    assert found.properties["Score"].value == 8
+
+
+def test_objects_are_hydrated_on_first_access():
+    space = get_space()
+    obj = Object("Lazy page", space.get_type_byname("Page"))
+    obj.description = "Not built yet"
+    space.create_object(obj)
+
+    found = [o for o in space.get_objects(limit=1000) if o.name == "Lazy page"][0]
+    assert found._pending is not None
+    assert found.description == "Not built yet"
+
+    assert found.type.key == "page"
+    assert found._pending is None
+    found.name = "Lazy page renamed"
+    assert space.update_object(found).name == "Lazy page renamed"
+
+
+def test_renaming_a_listed_object_sends_the_change():
+    space = get_space()
+    obj = Object("Listed page", space.get_type_byname("Page"))
+    space.create_object(obj)
+
+    found = [o for o in space.get_objects(limit=1000) if o.name == "Listed page"][0]
+    found.name = "Listed page renamed"
+    found.description = "Changed before hydration"
+    with profile() as p:
+        space.update_object(found)
+
+    assert p.calls_to("PATCH /spaces/{id}/objects/{id}") == 1
+    fetched = space.get_object(found.id)
+    assert (fetched.name, fetched.description) == ("Listed page renamed", found.description)
+
+
+def test_objects_share_types_and_tags():
+    space = get_space()
+    note = Type("Shared note")
+    note.icon = Icon()
+    note.layout = "basic"
+    note.plural_name = "Shared notes"
+    note.add_property(MultiSelect("Topics"))
+    note = space.create_type(note)
+    for name in ("First note", "Second note"):
+        obj = Object(name, note)
+        obj.properties["Topics"].value = ["Memory"]
+        space.create_object(obj)
+
+    first, second = space.search("", type=note)
+    assert first.type is second.type
+    assert first.properties["Topics"] is not second.properties["Topics"]
+    assert first.properties["Topics"].value[0] is second.properties["Topics"].value[0]
+
+
+def test_unknown_fields_are_kept_in_one_mapping():
+    space = get_space()
+    obj = space.get_objects(limit=1)[0]
+    assert not hasattr(obj, "__dict__")
+
+    obj.doi = "10.1000/182"
+    assert obj.doi == "10.1000/182"
+    assert obj._extra == {"doi": "10.1000/182"}
+
+    tag = Tag._from_api(any._apiEndpoints, {"id": "bafytag", "name": "New", "rank": 3})
+    assert (tag.name, tag.rank) == ("New", 3)
+    assert tag._extra == {"rank": 3}
+
+
+def test_types_are_lists_of_their_objects():
+    space = get_space()
+    task = space.get_type_byname("Task")
+    assert "Try the API" in {o.name for o in space.get_objects(limit=1000)}
+
+    view = space.get_listviews(task)[0]
+    names = {o.name for o in view.get_objectsinlistview(limit=1000)}
+    assert names == {o.name for o in space.search("", type=task, limit=1000)}
+
+
+def test_deep_copies_keep_the_client():
+    space = get_space()
+    obj = space.get_objects(limit=1)[0]
+
+    clone = copy.deepcopy(obj)
+    assert clone._apiEndpoints is obj._apiEndpoints
+    assert clone.type is not obj.type and clone.type.id == obj.type.id
+    clone.name = "Copied"
+    assert obj.name != "Copied"
+
+
+def test_pickled_objects_open_their_own_client():
+    space = get_space()
+    obj = space.get_objects(limit=1)[0]
+    assert obj._pending is not None
+
+    loaded_space, loaded = pickle.loads(pickle.dumps((space, obj)))
+    assert loaded._apiEndpoints is loaded_space._apiEndpoints is not space._apiEndpoints
+    assert loaded._pending is not None
+    assert (loaded.name, loaded.type.id) == (obj.name, obj.type.id)
+    assert loaded_space.get_object(obj.id).name == obj.name
+
+
+def test_async_tags_are_deleted():
+    async def create_and_delete():
+        client = await server.async_client()
+        space = await client.get_space(server.space_id)
+        status = (await space.get_type_byname("Task")).properties["Status"]
+        tag = await status.create_tag("Blocked")
+        await tag.delete_tag()
+        await client.close()
+        return tag
+
+    tag = asyncio.run(create_and_delete())
+
+    assert isinstance(tag, AsyncTag)
+    status = server.client().get_space(server.space_id).get_type_byname("Task").properties["Status"]
+    assert "Blocked" not in {t.name for t in status.get_tags()}
+
+
+def test_async_objects_keep_their_prefetched_definitions():
+    async def hydrate():
+        client = await server.async_client()
+        api = client._apiEndpoints
+        status = await (await client.get_space(server.space_id)).get_property_byname("Status")
+        # older servers only send the id of the properties of an object
+        data = {"id": "bafyold", "name": "Old", "properties": [{"id": status.id}]}
+        obj = (await _hydrate(Object, api, server.space_id, [data]))[0]
+        api._property_cache.invalidate(server.space_id)
+        await client.close()
+        return obj
+
+    assert list(asyncio.run(hydrate()).properties) == ["Status"]
+
+
+def test_missing_object_is_404():
+    space = get_space()
+    try:
+        space.get_object("bafymissing")
+    except ValueError as e:
+        assert e.status_code == 404
+    else:
+        raise AssertionError("expected a 404")
+
+
+def test_injected_error_is_retried():
+    client = server.client(retry=RetryPolicy(base_delay=0.001))
+    space = client.get_space(server.space_id)
+    server.inject_error(503, times=2, method="GET", path=r"/types$")
+
+    with profile() as p:
+        space.get_types()
+
+    assert p.calls_to("GET /spaces/{id}/types") == 3
+    assert client.retry.counters["recovered"] == 1
+
+
+def test_failed_searches_are_retried():
+    client = server.client(retry=RetryPolicy(base_delay=0.001))
+    space = client.get_space(server.space_id)
+    server.inject_error(500, times=1, method="POST", path=r"/search$")
+
+    with profile() as p:
+        space.search("note")
+
+    assert p.calls_to("POST /spaces/{id}/search") == 2
+    assert client.retry.counters["recovered"] == 1
+    assert client._apiEndpoints._hedgeable("POST", f"/spaces/{server.space_id}/search")
+
+
+def test_default_limiter_fits_the_connection_pool():
+    client = server.client(pool_maxsize=4)
+    assert client.limiter.max_limit == client._apiEndpoints.limiter.max_limit == 4
+    assert client.limiter.limit == 4
+
+
+def test_reads_that_cannot_be_hedged_stay_on_the_calling_thread(monkeypatch):
+    client = server.client(hedge=HedgePolicy(min_samples=5), pool_maxsize=4)
+    api = client._apiEndpoints
+    threads = []
+    attempt = api._attempt
+
+    def recorded_attempt(*args, **kwargs):
+        threads.append(threading.current_thread())
+        return attempt(*args, **kwargs)
+
+    monkeypatch.setattr(api, "_attempt", recorded_attempt)
+    # too few latencies are known to hedge these reads
+    for _ in range(3):
+        api.getSpace(server.space_id)
+
+    assert threads == [threading.current_thread()] * 3
+    assert api._hedge_pool._max_workers == 4
+
+
+def test_latency_is_added():
+    with FakeAnytypeServer(latency=0.05) as slow:
+        client = slow.client()
+        with profile() as p:
+            client.get_space(slow.space_id)
+        assert p.endpoints["GET /spaces/{id}"].max_time >= 0.05
+
+
+def test_exceeded_request_budget_fails(pytester):
+    pytester.makepyfile("""
+        from anytype.pytest_plugin import anytype_budget
+
+        def get_space_twice(server):
+            client = server.client()
+            client.get_space(server.space_id)
+            client.get_space(server.space_id)
+
+        @anytype_budget(get_space=1)
+        def test_over_budget(anytype_server):
+            get_space_twice(anytype_server)
+
+        @anytype_budget(get_space=2)
+        def test_within_budget(anytype_server):
+            get_space_twice(anytype_server)
+        """)
+    result = pytester.runpytest("-p", "anytype.pytest_plugin", "--strict-markers")
+
+    result.assert_outcomes(passed=1, failed=1)
+    result.stdout.fnmatch_lines(["*Anytype request budget exceeded: get_space: 2 calls*"])